@@ -0,0 +1,70 @@
+# benchmarks/bench_block_executor.py
+# ⏱️ Thread scaling of the block-parallel NumPy operators
+#
+# Times each BlockExecutor operator on a random n³ grid for 1..N threads and
+# prints the speedup over one thread.
+#
+# Usage:
+#   PYTHONPATH=. python benchmarks/bench_block_executor.py --size 128 --max-workers 8
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from src.step_1_solver_initialization.field_store import FieldStore
+from src.step_2_time_stepping_loop.block_executor import BlockExecutor
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+
+
+def _random_store(n: int, seed: int = 0) -> FieldStore:
+    rng = np.random.default_rng(seed)
+    store = FieldStore((n, n, n))
+    for name in ("pressure", "vx", "vy", "vz"):
+        getattr(store, name)[...] = rng.standard_normal(store.shape)
+    return store
+
+
+def _best_of(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=128, help="grid points per axis")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    store = _random_store(args.size)
+    h = 1.0 / args.size
+    params = SolverParameters(dt=1e-3, rho=1.0, mu=1e-3, dx=h, dy=h, dz=h, Fx=0.0, Fy=0.0, Fz=0.0)
+    operators = {
+        "laplacian": lambda ex: ex.laplacian(store, h, h, h),
+        "advection": lambda ex: ex.advection(store, h, h, h),
+        "divergence": lambda ex: ex.divergence(store, h, h, h),
+        "pressure_gradient": lambda ex: ex.pressure_gradient(store, h, h, h),
+        "predict": lambda ex: ex.predict(store, params),
+    }
+
+    workers = sorted({1, *[w for w in (2, 4, 8, 16, 32, 64) if w < args.max_workers], args.max_workers})
+    print(f"grid {args.size}^3, best of {args.repeat}")
+    print(f"{'operator':<18}" + "".join(f"{f'{w} thr':>17}" for w in workers))
+    for name, op in operators.items():
+        row, base = [], None
+        for w in workers:
+            with BlockExecutor(workers=w) as executor:
+                elapsed = _best_of(lambda: op(executor), args.repeat)
+            base = base or elapsed
+            row.append(f"{elapsed * 1e3:.1f}ms x{base / elapsed:.2f}")
+        print(f"{name:<18}" + "".join(f"{cell:>17}" for cell in row))
+
+
+if __name__ == "__main__":
+    main()
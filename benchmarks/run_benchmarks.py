@@ -0,0 +1,244 @@
+# benchmarks/run_benchmarks.py
+# ⏱️ Step 1/2 operator benchmarks across grid sizes, with baseline comparison
+#
+# Times, for every n in --sizes (an n³ box: wall shell, fluid interior):
+#   build_cell_dict, build_neighbor_table            (step 1)
+#   build_neighbor_map                                (step 2, full cell_dict)
+#   laplacian_velocity, adv_vx/vy/vz, divergence,
+#   grad_p_x/y/z                                      (per-cell, on a cell sample)
+#   *_grid operators                                  (whole FieldStore)
+#   timestep_driver                                   (one full step per backend)
+# and writes JSON with seconds and cells/second per (name, size). Per-cell
+# operators run on --sample cells spread over the grid and report that sample's
+# throughput; their cell_dict holds only the sampled cells and the cells within
+# STENCIL_REACH of them, so they run at every size. build_cell_dict,
+# build_neighbor_map and the per-cell driver need the full legacy cell_dict and
+# stop at --dict-max-size (a 128³ cell_dict needs several GB) and
+# --python-driver-max-size. Above --dict-max-size the numpy driver steps a lean
+# cell_dict (grid_index, cell_type, boundary_role, time_history only) up to
+# --driver-max-size; one 128³ step peaks at roughly 5 GB. Skipped entries are
+# listed as such.
+#
+# With --baseline, throughput below (1 - --threshold) × baseline is reported
+# as a regression and the exit status is 1.
+#
+# Usage:
+#   PYTHONPATH=. python benchmarks/run_benchmarks.py --output results.json
+#   PYTHONPATH=. python benchmarks/run_benchmarks.py --sizes 16 32 --baseline benchmarks/baseline.json
+
+import argparse
+import itertools
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from src.step_1_solver_initialization.cell_builder import build_cell_dict, build_field_store
+from src.step_1_solver_initialization.field_store import CELL_TYPES, NO_ROLE
+from src.step_1_solver_initialization.neighbor_mapper import build_neighbor_table
+from src.step_2_time_stepping_loop.driver_loop import timestep_driver
+from src.step_2_time_stepping_loop.field_access import build_neighbor_map
+from src.step_2_time_stepping_loop.mac_advection_ops import adv_vx, adv_vy, adv_vz, advection_grid
+from src.step_2_time_stepping_loop.mac_diffusion import laplacian_velocity, laplacian_velocity_grid
+from src.step_2_time_stepping_loop.mac_gradients import (
+    divergence,
+    divergence_grid,
+    grad_p_x,
+    grad_p_y,
+    grad_p_z,
+    pressure_gradient_grid,
+)
+from src.step_2_time_stepping_loop.mac_update_velocity import update_velocity_grid
+from src.step_2_time_stepping_loop.parameter_utils import build_solver_parameters
+
+TEMPLATE_CONFIG = "tests/test_models/test_step_0_output.json"
+DEFAULT_SIZES = (16, 32, 64, 128)
+STENCIL_REACH = 2  # per-cell operators read cells up to two neighbour hops away
+
+
+def box_config(n: int) -> Dict[str, Any]:
+    """The 4×4×4 test model's physics on an n³ box with a one-cell wall shell."""
+    with open(TEMPLATE_CONFIG) as f:
+        config = json.load(f)
+    mask = np.ones((n, n, n), dtype=int)
+    mask[[0, -1], :, :] = mask[:, [0, -1], :] = mask[:, :, [0, -1]] = -1
+    config["external_forces"] = {"force_vector": [0.0, 0.0, 0.0]}
+    config["domain_definition"].update(nx=n, ny=n, nz=n)
+    config["geometry_definition"]["geometry_mask_flat"] = mask.ravel(order="F").tolist()
+    config["geometry_definition"]["geometry_mask_shape"] = [n, n, n]
+    return config
+
+
+def _best_of(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _per_cell(op: Callable[[int], Any], sample: np.ndarray) -> Callable[[], None]:
+    def run():
+        for center in sample:
+            op(int(center))
+    return run
+
+
+def _fresh_dict(cell_dict: Dict[str, Any]) -> Dict[str, Any]:
+    return json.loads(json.dumps(cell_dict))
+
+
+def sampled_cell_dict(store: Any, sample: np.ndarray) -> Dict[str, Any]:
+    """Legacy cell_dict entries (str keys) for sample and every cell within STENCIL_REACH hops."""
+    r = STENCIL_REACH
+    offsets = np.array([d for d in itertools.product(range(-r, r + 1), repeat=3) if sum(map(abs, d)) <= r])
+    grid = np.array(np.unravel_index(sample, store.shape, order="F")).T
+    cells = (grid[:, None, :] + offsets[None, :, :]).reshape(-1, 3)
+    cells = cells[((cells >= 0) & (cells < store.shape)).all(axis=1)]
+    flat = np.unique(np.ravel_multi_index(cells.T, store.shape, order="F"))
+    table, _ = build_neighbor_table(store.shape)
+    return _fresh_dict({int(f): store.cell_entry(int(f), table) for f in flat})
+
+
+def lean_cell_dict(store: Any) -> Dict[int, Dict[str, Any]]:
+    """The cell_dict fields the numpy driver reads, without the flat_index_* neighbours."""
+    i, j, k = (axis.tolist() for axis in np.unravel_index(np.arange(store.n_cells), store.shape, order="F"))
+    types = [CELL_TYPES[code] for code in store.cell_type.ravel(order="F").tolist()]
+    roles = [None if code == NO_ROLE else store.roles[code] for code in store.boundary_role.ravel(order="F").tolist()]
+    return {flat: {"grid_index": [a, b, c], "cell_type": cell_type, "boundary_role": role,
+                   "time_history": {"0": store.state_at(a, b, c)}}
+            for flat, (a, b, c, cell_type, role) in enumerate(zip(i, j, k, types, roles))}
+
+
+def run_size(n: int, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Benchmark every operator on an n³ box."""
+    config = box_config(n)
+    params = build_solver_parameters(config)
+    dx, dy, dz = params.dx, params.dy, params.dz
+    n_cells = n ** 3
+    results = []
+
+    def record(name: str, func: Callable[[], Any], cells: int, repeat: int = args.repeat) -> None:
+        seconds = _best_of(func, repeat)
+        results.append({"name": name, "size": n, "cells": cells, "seconds": seconds,
+                        "cells_per_second": cells / seconds if seconds > 0 else float("inf")})
+        print(f"  {name:<28} {n:>4}³  {seconds * 1e3:10.2f} ms  {cells / seconds:14.0f} cells/s",
+              file=sys.stderr, flush=True)
+
+    def skip(name: str, reason: str) -> None:
+        results.append({"name": name, "size": n, "skipped": reason})
+
+    store = build_field_store(config)
+    store.vx[...] = np.random.default_rng(n).standard_normal(store.shape)  # non-trivial advection
+
+    record("build_neighbor_table", lambda: build_neighbor_table(store.shape), n_cells)
+    record("laplacian_velocity_grid", lambda: laplacian_velocity_grid(store, dx, dy, dz), n_cells)
+    record("advection_grid", lambda: advection_grid(store, dx, dy, dz), n_cells)
+    record("divergence_grid", lambda: divergence_grid(store, dx, dy, dz), n_cells)
+    record("pressure_gradient_grid", lambda: pressure_gradient_grid(store.pressure, dx, dy, dz), n_cells)
+    record("update_velocity_grid", lambda: update_velocity_grid(store, params), n_cells)
+
+    sample = np.linspace(0, n_cells - 1, min(args.sample, n_cells)).astype(int)
+    cell_dict = sampled_cell_dict(store, sample)
+    per_cell = {
+        "laplacian_velocity": lambda c: laplacian_velocity(cell_dict, c, dx, dy, dz, 0),
+        "adv_vx": lambda c: adv_vx(cell_dict, c, dx, dy, dz, 0),
+        "adv_vy": lambda c: adv_vy(cell_dict, c, dx, dy, dz, 0),
+        "adv_vz": lambda c: adv_vz(cell_dict, c, dx, dy, dz, 0),
+        "divergence": lambda c: divergence(cell_dict, c, dx, dy, dz, 0),
+        "grad_p_x": lambda c: grad_p_x(cell_dict, c, dx, 0),
+        "grad_p_y": lambda c: grad_p_y(cell_dict, c, dy, 0),
+        "grad_p_z": lambda c: grad_p_z(cell_dict, c, dz, 0),
+    }
+    for name, op in per_cell.items():
+        record(name, _per_cell(op, sample), len(sample))
+
+    if n > args.dict_max_size:
+        for name in ("build_cell_dict", "build_neighbor_map", "timestep_driver[python]"):
+            skip(name, f"full cell_dict benchmarks stop at --dict-max-size {args.dict_max_size}")
+        if n > args.driver_max_size:
+            skip("timestep_driver[numpy]", f"numpy driver stops at --driver-max-size {args.driver_max_size}")
+        else:
+            lean = lean_cell_dict(store)
+            record("timestep_driver[numpy]",
+                   lambda: timestep_driver(lean, config, 0, params=params, backend="numpy"), n_cells, repeat=1)
+        return results
+
+    record("build_cell_dict", lambda: build_cell_dict(config), n_cells, repeat=1)
+    cell_dict = _fresh_dict(store.to_cell_dict())
+    record("build_neighbor_map", lambda: build_neighbor_map(cell_dict, 0), n_cells)
+    for backend in ("numpy", "python"):
+        name = f"timestep_driver[{backend}]"
+        if backend == "python" and n > args.python_driver_max_size:
+            skip(name, f"per-cell driver stops at --python-driver-max-size {args.python_driver_max_size}")
+            continue
+        # each repeat steps a fresh copy so every step starts from the same level
+        copies = [_fresh_dict(cell_dict) for _ in range(args.repeat)]
+        record(name, lambda: timestep_driver(copies.pop(), config, 0, params=params, backend=backend), n_cells)
+    return results
+
+
+def compare_to_baseline(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+                        threshold: float) -> List[Dict[str, Any]]:
+    """Entries whose cells_per_second fell more than threshold below the baseline."""
+    reference = {(b["name"], b["size"]): b for b in baseline if "cells_per_second" in b}
+    regressions = []
+    for entry in results:
+        base = reference.get((entry["name"], entry["size"]))
+        if base is None or "cells_per_second" not in entry:
+            continue
+        ratio = entry["cells_per_second"] / base["cells_per_second"]
+        if ratio < 1.0 - threshold:
+            regressions.append({"name": entry["name"], "size": entry["size"], "ratio": ratio,
+                                "cells_per_second": entry["cells_per_second"],
+                                "baseline_cells_per_second": base["cells_per_second"]})
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark step 1/2 operators on n³ boxes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="best-of repeats per benchmark")
+    parser.add_argument("--sample", type=int, default=4096, help="cells timed for per-cell operators")
+    parser.add_argument("--dict-max-size", type=int, default=64)
+    parser.add_argument("--python-driver-max-size", type=int, default=32)
+    parser.add_argument("--driver-max-size", type=int, default=128,
+                        help="largest n for the numpy driver step above --dict-max-size (lean cell_dict)")
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed throughput drop (fraction)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for n in args.sizes:
+        print(f"⏱️ {n}³", file=sys.stderr, flush=True)
+        results.extend(run_size(n, args))
+
+    report = {
+        "meta": {"python": platform.python_version(), "numpy": np.__version__,
+                 "machine": platform.machine(), "repeat": args.repeat, "sample": args.sample},
+        "results": results,
+    }
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        report["regressions"] = compare_to_baseline(results, baseline, args.threshold)
+        for reg in report["regressions"]:
+            print(f"❌ {reg['name']} @ {reg['size']}³: {reg['ratio']:.2f}× baseline", file=sys.stderr)
+        status = 1 if report["regressions"] else 0
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
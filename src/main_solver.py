@@ -2,42 +2,50 @@
 # 🚀 Modular Navier-Stokes Simulation Orchestrator
 # 📌 Executes a 4-step pipeline: parse input, formulate system, solve equations, write output
 
+import argparse
+import itertools
 import os
 import sys
 import json
 
+import numpy as np
+
 from step_0_input_data_parsing.input_reader import load_simulation_input
 from step_0_input_data_parsing.config_validator import validate_config
-from step_1_solver_initialization.cell_builder import build_cell_dict
+from step_1_solver_initialization.cell_builder import build_field_store
+from step_1_solver_initialization.cell_dict_view import CellDictView
+from src.solver_logging import LEVELS, configure, get_logger, lazy
+
+# ✅ Centralized logger: progress at INFO, config/cell dumps at DEBUG
+log = get_logger(__name__)
+
 
-# ✅ Centralized debug flag
-debug = True
+def _preview(cell_dict: dict) -> str:
+    # Preview only first few cells for readability
+    return json.dumps({str(k): cell_dict[k] for k in itertools.islice(cell_dict, 3)}, indent=2)
 
 
 def step_0_input_data_parsing(input_path: str) -> dict:
     config = load_simulation_input(input_path)
     validate_config(config)
-    if debug:
-        print("✅ [Step 1] Parsed and validated input schema.")
-        print(json.dumps(config, indent=2))
+    log.info("✅ [Step 1] Parsed and validated input schema.")
+    log.debug("%s", lazy(json.dumps, config, indent=2, default=np.ndarray.tolist))
     return config
 
 
-def step_1_solver_initialization(config: dict) -> dict:
-    cell_dict = build_cell_dict(config)
-    if debug:
-        print("✅ [Step 2] Domain initialized with per-cell dictionary.")
-        # Preview only first few cells for readability
-        preview = {k: cell_dict[k] for k in list(cell_dict.keys())[:3]}
-        print(json.dumps(preview, indent=2))
+def step_1_solver_initialization(config: dict) -> CellDictView:
+    # FieldStore arrays behind a read-only per-cell view: cell dicts are built on
+    # access, never all at once (build_cell_dict(config) if a mutable dict is needed)
+    cell_dict = CellDictView(build_field_store(config))
+    log.info("✅ [Step 2] Domain initialized with per-cell view over %d cells.", len(cell_dict))
+    log.debug("%s", lazy(_preview, cell_dict))
     return cell_dict
 
 
 # def step_3_solve_system(cell_dict: dict):
 #     snapshots = generate_snapshots(sim_config=cell_dict)
-#     if debug:
-#         print(f"✅ [Step 3] Generated {len(snapshots)} snapshots.")
-#         print(f"📦 First snapshot preview:\n{json.dumps(snapshots[0][1], indent=2)[:1000]}")
+#     log.info("✅ [Step 3] Generated %d snapshots.", len(snapshots))
+#     log.debug("📦 First snapshot preview:\n%s", lazy(lambda: json.dumps(snapshots[0][1], indent=2)[:1000]))
 #     return snapshots
 
 
@@ -47,12 +55,10 @@ def step_1_solver_initialization(config: dict) -> dict:
 #         filename = f"{scenario_name}_step_{step:04d}.json"
 #         path = os.path.join(output_dir, filename)
 #         write_snapshot(snapshot, path)
-#         if debug:
-#             print(f"📝 [Step 4] Snapshot {step:04d} written → {filename}")
+#         log.debug("📝 [Step 4] Snapshot %04d written → %s", step, filename)
 #     if os.getenv("UPLOAD_TO_DROPBOX", "false").lower() == "true":
 #         upload_to_dropbox(output_dir)
-#         if debug:
-#             print("☁️ Output uploaded to Dropbox.")
+#         log.info("☁️ Output uploaded to Dropbox.")
 
 
 def run_simulation(input_path: str, output_dir: str | None = None):
@@ -64,20 +70,25 @@ def run_simulation(input_path: str, output_dir: str | None = None):
     # snapshots = step_3_solve_system(cell_dict)
     # step_4_write_output(snapshots, scenario_name, output_dir)
 
-    if debug:
-        print("✅ Simulation complete.")
+    log.info("✅ Simulation complete.")
     return cell_dict
 
 
 if __name__ == "__main__":
-    input_file = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = argparse.ArgumentParser(description="Run the Navier-Stokes simulation pipeline.")
+    parser.add_argument("input_file", nargs="?")
+    parser.add_argument("--log-level", default=os.getenv("FLUID_SOLVER_LOG") or "info",
+                        help=f"'level' or 'level,module=level,...' with levels {LEVELS} "
+                             "(default: $FLUID_SOLVER_LOG, else info)")
+    args = parser.parse_args()
+    configure(args.log_level)
     output_dir = os.getenv("OUTPUT_RESULTS_BASE_DIR", None)
 
-    if not input_file:
+    if not args.input_file:
         print("❌ Error: No input file provided.")
         sys.exit(1)
 
-    run_simulation(input_file, output_dir)
+    run_simulation(args.input_file, output_dir)
 
 
 
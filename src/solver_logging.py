@@ -0,0 +1,106 @@
+# src/solver_logging.py
+# 📜 Solver Logging — one "fluid_solver" logger tree with per-module levels
+#
+# Modules log through get_logger(__name__), which maps both import styles
+# (src.step_2_time_stepping_loop.field_access, step_2_...field_access) onto
+# "fluid_solver.field_access". Nothing is printed below WARNING until
+# configure() sets levels, from a spec string such as
+#
+#   FLUID_SOLVER_LOG="info,field_access=debug,config_validator=warning"
+#
+# (a bare level applies to every module, name=level overrides one module).
+# The CLIs take the same spec via --log-level (default: the environment
+# variable) and call configure() once at startup; importing this module
+# configures nothing, so library users keep control of logging.
+#
+# Messages use %-style arguments, so nothing is formatted when a level is
+# off; wrap expensive arguments (json.dumps of a config) in lazy(). Hot loops
+# test logger.isEnabledFor(logging.DEBUG) once, before the loop, and branch
+# on that bool per cell.
+
+import logging
+import os
+import sys
+from typing import Any, Callable, Dict
+
+ROOT_NAME = "fluid_solver"
+ENV_VAR = "FLUID_SOLVER_LOG"
+LEVELS = ("debug", "info", "warning", "error", "critical")
+
+_HANDLER_NAME = "fluid_solver.stdout"
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler writing to whatever sys.stdout is at emit time."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, _value):
+        pass
+
+
+class lazy:
+    """Defers func(*args, **kwargs) until the log record is actually formatted."""
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func: Callable[..., Any], *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args, **self.kwargs))
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    """Logger "fluid_solver.<module>" for a module's __name__."""
+    return logging.getLogger(f"{ROOT_NAME}.{module_name.rsplit('.', 1)[-1]}")
+
+
+def parse_spec(spec: str) -> Dict[str, int]:
+    """
+    Parse "level,module=level,..." into {logger suffix: level}.
+
+    The bare level is returned under the key "" (the fluid_solver root).
+
+    Raises:
+        ValueError: on an unknown level name.
+    """
+    levels: Dict[str, int] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        module, _, level = item.rpartition("=")
+        if level.lower() not in LEVELS:
+            raise ValueError(f"Unknown log level '{level}' in '{spec}'. Expected one of {LEVELS}.")
+        levels[module.strip()] = getattr(logging, level.upper())
+    return levels
+
+
+def configure(spec: str | None = None) -> Dict[str, int]:
+    """
+    Apply a level spec (default: $FLUID_SOLVER_LOG) and install the stdout handler.
+
+    Modules not named in the spec inherit the bare level (WARNING if none is
+    given). Returns the parsed spec.
+    """
+    spec = os.environ.get(ENV_VAR, "") if spec is None else spec
+    levels = parse_spec(spec)
+    root = logging.getLogger(ROOT_NAME)
+    root.setLevel(levels.get("", logging.WARNING))
+    for name, child in list(logging.Logger.manager.loggerDict.items()):
+        if name.startswith(ROOT_NAME + ".") and isinstance(child, logging.Logger):
+            child.setLevel(logging.NOTSET)
+    for module, level in levels.items():
+        if module:
+            logging.getLogger(f"{ROOT_NAME}.{module}").setLevel(level)
+
+    if not any(h.get_name() == _HANDLER_NAME for h in root.handlers):
+        handler = _StdoutHandler()
+        handler.set_name(_HANDLER_NAME)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        root.addHandler(handler)
+    logging.getLogger(f"{ROOT_NAME}.solver_logging").debug("📜 Log levels: %s", levels)
+    return levels
@@ -9,8 +9,10 @@ import argparse
 import json
 from typing import Dict
 
-# ✅ Centralized debug flag for GitHub Actions logging
-debug = True
+from src.solver_logging import LEVELS, configure, get_logger
+
+# ✅ Verbosity comes from FLUID_SOLVER_LOG / --log-level (see src/solver_logging.py)
+log = get_logger(__name__)
 
 def validate_config(config: Dict) -> Dict:
     """
@@ -96,8 +98,7 @@ def validate_config(config: Dict) -> Dict:
         if not isinstance(ghost_rules["face_types"], dict):
             raise ValueError("Invalid 'face_types' — must be a dictionary.")
 
-    if debug:
-        print("[CONFIG] Validation passed — config is structurally complete.")
+    log.info("[CONFIG] Validation passed — config is structurally complete.")
 
     return {"status": "success", "message": "Config is structurally complete."}
 
@@ -105,7 +106,11 @@ def main():
     parser = argparse.ArgumentParser(description="Config Validator CLI for Navier-Stokes simulation input")
     parser.add_argument("--input", required=True, help="Path to input JSON file")
     parser.add_argument("--output", required=True, help="Path to output JSON file")
+    parser.add_argument("--log-level", default=None,
+                        help=f"'level' or 'level,module=level,...' with levels {LEVELS} "
+                             "(default: $FLUID_SOLVER_LOG)")
     args = parser.parse_args()
+    configure(args.log_level)
 
     with open(args.input, "r") as f:
         config = json.load(f)
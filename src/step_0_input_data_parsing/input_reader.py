@@ -1,27 +1,147 @@
 # src/step1_input_validation/input_reader.py
 # 📥 Input Reader — parses and validates structured Navier-Stokes simulation input
 # 📌 This module anchors schema alignment for reflex scoring, mutation overlays, and diagnostic traceability.
+#
+# geometry_mask_flat is streamed: the file is read in CHUNK_CHARS pieces, the
+# mask list is converted chunk by chunk into a compact int8 array (mask codes
+# such as fluid=1, solid=0, boundary=-1 all fit), and only the remaining small
+# sections go through json.loads. Peak memory stays near the final mask size
+# instead of one Python int per cell.
 
 import os
+import re
 import json
 import argparse
+import warnings
+from typing import Any, Dict, List, Tuple
 
-# ✅ Centralized debug flag for GitHub Actions logging
-debug = False
+import numpy as np
 
-def load_simulation_input(filepath: str) -> dict:
-    if debug:
-        print(f"📁 Loading input file: {filepath}")
+from src.solver_logging import LEVELS, configure, get_logger, lazy
+from src.step_0_input_data_parsing.sidecar_files import (
+    MASK_DTYPE,
+    check_mask_codes,
+    load_field_file,
+    load_mask_file,
+)
+
+log = get_logger(__name__)
+
+CHUNK_CHARS = 1 << 18
+
+_MASK_START = re.compile(r'"geometry_mask_flat"\s*:\s*\[')
+_KEY_OVERLAP = 256  # chars kept between reads so the key can span two chunks
+_EMPTY_TOKEN = re.compile(r"^\s*,|,\s*,|,\s*$")  # leading, doubled or trailing comma
+
+
+def _parse_mask_values(text: str, allow_empty: bool = True) -> np.ndarray:
+    """
+    Comma-separated integers → MASK_DTYPE array.
+
+    Raises ValueError if any value does not fit, on an empty token (a
+    leading, doubled or trailing comma, which np.fromstring would skip), or
+    on a blank text unless allow_empty.
+    """
+    if not text.strip():
+        if not allow_empty:
+            raise ValueError("❌ Failed to parse JSON: empty value in geometry_mask_flat.")
+        return np.zeros(0, dtype=MASK_DTYPE)
+    if _EMPTY_TOKEN.search(text):
+        raise ValueError("❌ Failed to parse JSON: empty value in geometry_mask_flat.")
+    with warnings.catch_warnings():
+        # fromstring only warns (and stops early) on a token it cannot read
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(text, dtype=np.int64, sep=",")
+        except (ValueError, DeprecationWarning):
+            raise ValueError("❌ geometry_mask_flat must contain only integers.")
+    check_mask_codes(values, "geometry_mask_flat")
+    return values.astype(MASK_DTYPE)
+
+
+def _mask_preview(mask: Any) -> List[int]:
+    """First cells of a mask (list or array) for the debug log."""
+    return np.asarray(mask[:16]).tolist()
+
+
+def _stream_mask(f: Any, chunk_chars: int = CHUNK_CHARS) -> Tuple[str, np.ndarray | None]:
+    """
+    Read a JSON document, pulling the geometry_mask_flat list out as it goes.
+
+    Returns the document text with the list replaced by null, and the mask
+    array (None when the document has no geometry_mask_flat list).
+    """
+    head: List[str] = []
+    buffer = ""
+    while True:
+        match = _MASK_START.search(buffer)
+        if match is not None:
+            break
+        chunk = f.read(chunk_chars)
+        if not chunk:
+            return "".join(head) + buffer, None
+        head.append(buffer[:-_KEY_OVERLAP])
+        buffer = buffer[-_KEY_OVERLAP:] + chunk
+    head.append(buffer[:match.start()] + '"geometry_mask_flat": null')
+
+    # pieces are cut after a comma, so each must hold a value; only "[]" may be blank
+    parts: List[np.ndarray] = []
+    rest = buffer[match.end():]
+    after_comma = False
+    while True:
+        end = rest.find("]")
+        if end >= 0:
+            parts.append(_parse_mask_values(rest[:end], allow_empty=not after_comma))
+            break
+        cut = rest.rfind(",")
+        if cut >= 0:
+            parts.append(_parse_mask_values(rest[:cut], allow_empty=False))
+            rest = rest[cut + 1:]
+            after_comma = True
+        chunk = f.read(chunk_chars)
+        if not chunk:
+            raise ValueError("❌ Failed to parse JSON: unterminated geometry_mask_flat list.")
+        rest += chunk
+    head.append(rest[end + 1:] + f.read())
+    return "".join(head), np.concatenate(parts) if parts else np.zeros(0, dtype=MASK_DTYPE)
+
+
+def load_simulation_input(filepath: str, stream_mask: bool = True) -> Dict[str, Any]:
+    """
+    Load and check a simulation input file.
+
+    With stream_mask (default) geometry_definition.geometry_mask_flat is
+    returned as a MASK_DTYPE NumPy array; otherwise the file goes through
+    json.load and the mask stays a list. A geometry_mask_file sidecar is
+    loaded into geometry_mask_flat, and initial_conditions.initial_fields
+    references are replaced by their (memory-mapped) arrays; see
+    sidecar_files.
+
+    Raises:
+        FileNotFoundError: if filepath or a sidecar file does not exist.
+        ValueError: on malformed JSON or a mask/field that does not match the shape.
+        KeyError: if a required section or key is missing.
+    """
+    log.debug("📁 Loading input file: %s", filepath)
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"❌ Input file not found: {filepath}")
+    base_dir = os.path.dirname(os.path.abspath(filepath))
 
     with open(filepath, "r") as f:
         try:
-            data = json.load(f)
-            if debug:
-                print(f"📦 JSON loaded successfully. Top-level keys: {list(data.keys())}")
+            if stream_mask:
+                text, mask = _stream_mask(f)
+                data = json.loads(text)
+            else:
+                data, mask = json.load(f), None
+            log.debug("📦 JSON loaded successfully. Top-level keys: %s", list(data))
         except json.JSONDecodeError as e:
             raise ValueError(f"❌ Failed to parse JSON: {e}")
+    if mask is not None:
+        geometry = data.get("geometry_definition")
+        if not isinstance(geometry, dict) or geometry.get("geometry_mask_flat", False) is not None:
+            raise ValueError("❌ 'geometry_mask_flat' is only allowed inside 'geometry_definition'.")
+        geometry["geometry_mask_flat"] = mask
 
     required_sections = [
         "domain_definition",
@@ -33,113 +153,96 @@ def load_simulation_input(filepath: str) -> dict:
     for section in required_sections:
         if section not in data:
             raise KeyError(f"❌ Missing required section: '{section}'")
-        if debug:
-            print(f"✅ Section '{section}' found.")
+        log.debug("✅ Section '%s' found.", section)
 
     domain = data["domain_definition"]
-    if debug:
-        print(f"📂 Domain keys: {list(domain.keys())}")
+    log.debug("📂 Domain keys: %s", list(domain))
     for key in ["nx", "ny", "nz", "x_min", "x_max", "y_min", "y_max", "z_min", "z_max"]:
         if key not in domain:
             raise KeyError(f"❌ Missing domain key: '{key}'")
-        if debug:
-            print(f"✅ Domain key '{key}' = {domain[key]}")
-    if debug:
-        print(f"🧩 Domain resolution: {domain['nx']}×{domain['ny']}×{domain['nz']}")
-        print(f"📐 Domain bounds: x={domain['x_min']}→{domain['x_max']}, y={domain['y_min']}→{domain['y_max']}, z={domain['z_min']}→{domain['z_max']}")
+        log.debug("✅ Domain key '%s' = %s", key, domain[key])
+    log.debug("🧩 Domain resolution: %s×%s×%s", domain["nx"], domain["ny"], domain["nz"])
+    log.debug("📐 Domain bounds: x=%s→%s, y=%s→%s, z=%s→%s", domain["x_min"], domain["x_max"],
+              domain["y_min"], domain["y_max"], domain["z_min"], domain["z_max"])
 
     fluid = data["fluid_properties"]
-    if debug:
-        print(f"📂 Fluid keys: {list(fluid.keys())}")
+    log.debug("📂 Fluid keys: %s", list(fluid))
     for key in ["density", "viscosity"]:
         if key not in fluid:
             raise KeyError(f"❌ Missing fluid property: '{key}'")
-        if debug:
-            print(f"✅ Fluid key '{key}' = {fluid[key]}")
-    if debug:
-        print(f"🌊 Fluid density (ρ): {fluid['density']}")
-        print(f"🌊 Fluid viscosity (μ): {fluid['viscosity']}")
+        log.debug("✅ Fluid key '%s' = %s", key, fluid[key])
+    log.debug("🌊 Fluid density (ρ): %s, viscosity (μ): %s", fluid["density"], fluid["viscosity"])
 
     init = data["initial_conditions"]
-    if debug:
-        print(f"📂 Initial condition keys: {list(init.keys())}")
+    log.debug("📂 Initial condition keys: %s", list(init))
     for key in ["initial_velocity", "initial_pressure"]:
         if key not in init:
             raise KeyError(f"❌ Missing initial condition: '{key}'")
-        if debug:
-            print(f"✅ Initial key '{key}' = {init[key]}")
-    if debug:
-        print(f"🌀 Initial velocity: {init['initial_velocity']}")
-        print(f"🌀 Initial pressure: {init['initial_pressure']}")
+        log.debug("✅ Initial key '%s' = %s", key, init[key])
+    log.debug("🌀 Initial velocity: %s, pressure: %s", init["initial_velocity"], init["initial_pressure"])
 
     sim = data["simulation_parameters"]
-    if debug:
-        print(f"📂 Simulation keys: {list(sim.keys())}")
+    log.debug("📂 Simulation keys: %s", list(sim))
     for key in ["time_step", "total_time", "output_interval"]:
         if key not in sim:
             raise KeyError(f"❌ Missing simulation parameter: '{key}'")
-        if debug:
-            print(f"✅ Simulation key '{key}' = {sim[key]}")
-    if debug:
-        print(f"⏱️ Time step (Δt): {sim['time_step']}")
-        print(f"⏱️ Total time (T): {sim['total_time']}")
-        print(f"⚙️ Output interval: {sim['output_interval']}")
+        log.debug("✅ Simulation key '%s' = %s", key, sim[key])
+    log.debug("⏱️ Time step (Δt): %s, total time (T): %s, output interval: %s",
+              sim["time_step"], sim["total_time"], sim["output_interval"])
 
     if "pressure_solver" in data:
         pressure_cfg = data["pressure_solver"]
-        if debug:
-            print(f"📂 Pressure solver keys: {list(pressure_cfg.keys())}")
-        for key in ["method", "tolerance"]:
-            if key not in pressure_cfg:
-                raise KeyError(f"❌ Missing pressure solver key: '{key}'")
-            if debug:
-                print(f"✅ Pressure solver key '{key}' = {pressure_cfg[key]}")
-        if debug:
-            print(f"💧 Pressure Solver → Method: {pressure_cfg['method']}, Tolerance: {pressure_cfg['tolerance']}")
+        log.debug("📂 Pressure solver keys: %s", list(pressure_cfg))
+        # every key is optional; load_pressure_solver_settings fills the defaults
+        log.debug("💧 Pressure Solver → Method: %s, Tolerance: %s",
+                  pressure_cfg.get("method", "default"), pressure_cfg.get("tolerance", "default"))
 
     bc_list = data["boundary_conditions"]
-    if debug:
-        print(f"📂 Boundary conditions count: {len(bc_list)}")
     if not isinstance(bc_list, list):
         raise TypeError("❌ 'boundary_conditions' must be a list.")
+    log.debug("📂 Boundary conditions count: %d", len(bc_list))
     for i, bc in enumerate(bc_list):
         if not isinstance(bc, dict):
             raise TypeError(f"❌ boundary_conditions[{i}] must be a dictionary.")
-        if debug:
-            print(f"📂 boundary_conditions[{i}] keys: {list(bc.keys())}")
+        log.debug("📂 boundary_conditions[%d] keys: %s", i, list(bc))
         for key in ["role", "type", "apply_to", "apply_faces"]:
             if key not in bc:
                 raise KeyError(f"❌ boundary_conditions[{i}] missing required key: '{key}'")
-            if debug:
-                print(f"✅ boundary_conditions[{i}] key '{key}' = {bc[key]}")
-        if debug:
-            print(f"🚧 Boundary Role: {bc['role']}")
-            print(f"   Type: {bc['type']}")
-            print(f"   Apply To: {bc['apply_to']}")
-            print(f"   Apply Faces: {bc['apply_faces']}")
-            print(f"   Velocity: {bc['velocity']}" if "velocity" in bc else "   Velocity: —")
-            print(f"   Pressure: {bc['pressure']}" if "pressure" in bc else "   Pressure: —")
-            print(f"   No-Slip: {bc['no_slip']}" if "no_slip" in bc else "   No-Slip: —")
+            log.debug("✅ boundary_conditions[%d] key '%s' = %s", i, key, bc[key])
+        log.debug("🚧 Boundary Role: %s, Type: %s, Apply To: %s, Apply Faces: %s, Velocity: %s, "
+                  "Pressure: %s, No-Slip: %s", bc["role"], bc["type"], bc["apply_to"], bc["apply_faces"],
+                  bc.get("velocity", "—"), bc.get("pressure", "—"), bc.get("no_slip", "—"))
 
     if "geometry_definition" in data:
         geometry = data["geometry_definition"]
-        if debug:
-            print(f"📂 Geometry keys: {list(geometry.keys())}")
-        for key in ["geometry_mask_flat", "geometry_mask_shape", "mask_encoding", "flattening_order"]:
+        log.debug("📂 Geometry keys: %s", list(geometry))
+        for key in ["geometry_mask_shape", "mask_encoding", "flattening_order"]:
             if key not in geometry:
                 raise KeyError(f"❌ Missing geometry key: '{key}'")
-            if debug:
-                print(f"✅ Geometry key '{key}' = {geometry[key]}")
-        if debug:
-            print(f"🧱 Geometry mask shape: {geometry['geometry_mask_shape']}")
-            print(f"🧱 Mask encoding: fluid={geometry['mask_encoding']['fluid']}, solid={geometry['mask_encoding']['solid']}")
-            print(f"🧱 Flattening order: {geometry['flattening_order']}")
-            print(f"🧱 Mask preview: {geometry['geometry_mask_flat']}")
-            print(f"🧮 Mask length: {len(geometry['geometry_mask_flat'])}")
-            expected_len = geometry["geometry_mask_shape"][0] * geometry["geometry_mask_shape"][1] * geometry["geometry_mask_shape"][2]
-            print(f"🧮 Expected mask length from shape: {expected_len}")
-            if len(geometry["geometry_mask_flat"]) != expected_len:
-                raise ValueError(f"❌ geometry_mask_flat length mismatch: expected {expected_len}, got {len(geometry['geometry_mask_flat'])}")
+            log.debug("✅ Geometry key '%s' = %s", key, geometry[key])
+        if "geometry_mask_file" in geometry:
+            if "geometry_mask_flat" in geometry:
+                raise ValueError("❌ Give either 'geometry_mask_flat' or 'geometry_mask_file', not both.")
+            geometry["geometry_mask_flat"] = load_mask_file(geometry["geometry_mask_file"], base_dir,
+                                                            geometry["geometry_mask_shape"])
+        elif "geometry_mask_flat" not in geometry:
+            raise KeyError("❌ Missing geometry key: 'geometry_mask_flat' (or 'geometry_mask_file')")
+        log.debug("🧱 Geometry mask shape: %s, encoding: %s, flattening order: %s",
+                  geometry["geometry_mask_shape"], geometry["mask_encoding"], geometry["flattening_order"])
+        log.debug("🧱 Mask preview: %s", lazy(_mask_preview, geometry["geometry_mask_flat"]))
+        expected_len = geometry["geometry_mask_shape"][0] * geometry["geometry_mask_shape"][1] * geometry["geometry_mask_shape"][2]
+        log.debug("🧮 Mask length: %d (expected from shape: %d)", len(geometry["geometry_mask_flat"]), expected_len)
+        if len(geometry["geometry_mask_flat"]) != expected_len:
+            raise ValueError(f"❌ geometry_mask_flat length mismatch: expected {expected_len}, got {len(geometry['geometry_mask_flat'])}")
+
+    fields = init.get("initial_fields", {})
+    if fields:
+        if "geometry_definition" not in data:
+            raise KeyError("❌ 'initial_fields' needs 'geometry_definition' for geometry_mask_shape.")
+        for name in fields:
+            fields[name] = load_field_file(name, fields[name], base_dir,
+                                           data["geometry_definition"]["geometry_mask_shape"])
+            log.debug("🌀 Initial %s field: shape %s", name, fields[name].shape)
 
     return data
 
@@ -147,12 +250,16 @@ def main():
     parser = argparse.ArgumentParser(description="Input Reader CLI for Navier-Stokes simulation input")
     parser.add_argument("--input", required=True, help="Path to input JSON file")
     parser.add_argument("--output", required=True, help="Path to output JSON file")
+    parser.add_argument("--log-level", default=None,
+                        help=f"'level' or 'level,module=level,...' with levels {LEVELS} "
+                             "(default: $FLUID_SOLVER_LOG)")
     args = parser.parse_args()
+    configure(args.log_level)
 
     result = load_simulation_input(args.input)
 
     with open(args.output, "w") as f:
-        json.dump(result, f, indent=2)
+        json.dump(result, f, indent=2, default=np.ndarray.tolist)
 
 if __name__ == "__main__":
     main()
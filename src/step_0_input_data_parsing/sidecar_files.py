@@ -0,0 +1,143 @@
+# src/step_0_input_data_parsing/sidecar_files.py
+# 🗂️ Sidecar Files — binary geometry masks and per-cell initial fields
+#
+# Large arrays can live next to the input JSON instead of inside it:
+#
+#   "geometry_definition": {"geometry_mask_file": {"path": "mask.npy", "format": "npy"}, ...}
+#   "initial_conditions":  {"initial_fields": {"pressure": {"path": "p.npy", "format": "npy"},
+#                                              "velocity": {"path": "v.npy", "format": "npy"}}, ...}
+#
+# Relative paths are resolved against the input file's directory.
+#
+# Formats
+#   npy  np.save output, opened with mmap_mode="r". A mask is either flat
+#        (nx*ny*nz, x-major) or shaped (nx, ny, nz); a field is (N,) / (N, 3)
+#        flat x-major or (nx, ny, nz) / (nx, ny, nz, 3). Arrays saved in
+#        Fortran order flatten without a copy.
+#   rle  (masks only) an .npy holding an (n_runs, 2) integer array of
+#        (value, run_length) rows in x-major order; see save_rle.
+#
+# Loaders return flat x-major arrays and check them against
+# geometry_mask_shape: size, layout, integer mask codes that fit MASK_DTYPE,
+# and finite field values.
+
+import os
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+from src.solver_logging import get_logger
+
+log = get_logger(__name__)
+
+MASK_DTYPE = np.int8
+SIDECAR_FORMATS = ("npy", "rle")
+FIELD_COMPONENTS = {"pressure": 1, "velocity": 3}
+
+
+def resolve_path(ref: Dict[str, Any], base_dir: str) -> str:
+    """Absolute path of a sidecar reference (relative paths are taken from base_dir)."""
+    if not isinstance(ref, dict) or not isinstance(ref.get("path"), str):
+        raise ValueError(f"❌ Sidecar reference must be an object with a 'path' string, got {ref!r}.")
+    fmt = ref.get("format", "npy")
+    if fmt not in SIDECAR_FORMATS:
+        raise ValueError(f"❌ Unknown sidecar format '{fmt}'. Expected one of {SIDECAR_FORMATS}.")
+    path = os.path.join(base_dir, ref["path"])
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"❌ Sidecar file not found: {path}")
+    return path
+
+
+def _flatten(array: np.ndarray, shape: Sequence[int], trailing: tuple, what: str) -> np.ndarray:
+    """(nx, ny, nz, *trailing) or (N, *trailing) → (N, *trailing) in x-major order."""
+    n_cells = int(np.prod(shape))
+    if array.shape == tuple(shape) + trailing:
+        return array.reshape((n_cells,) + trailing, order="F")
+    if array.shape == (n_cells,) + trailing:
+        return array
+    raise ValueError(f"❌ {what} has shape {array.shape}, expected {(n_cells,) + trailing} "
+                     f"or {tuple(shape) + trailing} for geometry_mask_shape {list(shape)}.")
+
+
+def check_mask_codes(values: np.ndarray, what: str) -> None:
+    """ValueError unless values are integers that fit MASK_DTYPE."""
+    if not np.issubdtype(values.dtype, np.integer):
+        raise ValueError(f"❌ {what} must hold integers, got dtype {values.dtype}.")
+    limits = np.iinfo(MASK_DTYPE)
+    if values.size and (values.min() < limits.min or values.max() > limits.max):
+        raise ValueError(f"❌ {what} values must lie in [{limits.min}, {limits.max}].")
+
+
+def encode_rle(mask_flat: np.ndarray) -> np.ndarray:
+    """(n_runs, 2) int64 array of (value, run_length) for a flat mask."""
+    mask_flat = np.asarray(mask_flat).ravel()
+    if mask_flat.size == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    starts = np.flatnonzero(np.r_[True, mask_flat[1:] != mask_flat[:-1]])
+    lengths = np.diff(np.r_[starts, mask_flat.size])
+    return np.column_stack([mask_flat[starts], lengths]).astype(np.int64)
+
+
+def decode_rle(runs: np.ndarray, expected_len: int) -> np.ndarray:
+    """Flat MASK_DTYPE mask from (value, run_length) rows, checked against expected_len."""
+    runs = np.asarray(runs)
+    if runs.ndim != 2 or runs.shape[1] != 2:
+        raise ValueError(f"❌ RLE mask must be an (n_runs, 2) array, got shape {runs.shape}.")
+    values, lengths = runs[:, 0], runs[:, 1]
+    check_mask_codes(values, "RLE mask")
+    if (lengths < 0).any():
+        raise ValueError("❌ RLE mask has negative run lengths.")
+    total = int(lengths.sum())
+    if total != expected_len:
+        raise ValueError(f"❌ RLE mask covers {total} cells, expected {expected_len}.")
+    return np.repeat(values.astype(MASK_DTYPE), lengths)
+
+
+def save_rle(path: str, mask_flat: np.ndarray) -> None:
+    """Write a flat x-major mask as an RLE sidecar (format "rle")."""
+    np.save(path, encode_rle(mask_flat))
+
+
+def load_mask_file(ref: Dict[str, Any], base_dir: str, shape: Sequence[int]) -> np.ndarray:
+    """
+    Flat x-major geometry mask from a sidecar reference.
+
+    npy masks stay memory-mapped (in their stored integer dtype); rle masks
+    are expanded into a MASK_DTYPE array.
+
+    Raises:
+        FileNotFoundError: if the sidecar is missing.
+        ValueError: on an unknown format or a mask that does not match shape.
+    """
+    path = resolve_path(ref, base_dir)
+    stored = np.load(path, mmap_mode="r", allow_pickle=False)
+    if ref.get("format", "npy") == "rle":
+        mask = decode_rle(stored, int(np.prod(shape)))
+    else:
+        mask = _flatten(stored, shape, (), f"Mask {path}")
+        check_mask_codes(mask, f"Mask {path}")
+    log.debug("🗂️ Loaded mask %s: %d cells, dtype %s", path, mask.size, mask.dtype)
+    return mask
+
+
+def load_field_file(name: str, ref: Dict[str, Any], base_dir: str, shape: Sequence[int]) -> np.ndarray:
+    """
+    Per-cell initial field ("pressure": (N,), "velocity": (N, 3)), flat x-major, memory-mapped.
+
+    Raises:
+        FileNotFoundError: if the sidecar is missing.
+        KeyError: for a field name other than pressure or velocity.
+        ValueError: for a non-npy format, a shape mismatch, or non-finite values.
+    """
+    if name not in FIELD_COMPONENTS:
+        raise KeyError(f"❌ Unknown initial field '{name}'. Expected one of {tuple(FIELD_COMPONENTS)}.")
+    path = resolve_path(ref, base_dir)
+    if ref.get("format", "npy") != "npy":
+        raise ValueError(f"❌ Initial field '{name}' must be an npy sidecar.")
+    stored = np.load(path, mmap_mode="r", allow_pickle=False)
+    trailing = () if FIELD_COMPONENTS[name] == 1 else (FIELD_COMPONENTS[name],)
+    field = _flatten(stored, shape, trailing, f"Initial {name} field {path}")
+    if not np.issubdtype(field.dtype, np.number) or not np.isfinite(field).all():
+        raise ValueError(f"❌ Initial {name} field {path} must hold finite numbers.")
+    log.debug("🗂️ Loaded initial %s field %s: shape %s", name, path, field.shape)
+    return field
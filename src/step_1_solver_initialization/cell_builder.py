@@ -1,105 +1,121 @@
 # src/step_1_solver_initialization/cell_builder.py
 # 🧱 Step 1: Domain Initialization — Build the Per-Cell Dictionary
 
-from src.step_1_solver_initialization.indexing_utils import flat_to_grid
-from src.step_1_solver_initialization.neighbor_mapper import get_stencil_neighbors
+import logging
 
-debug = False
+import numpy as np
 
-def build_cell_dict(config: dict) -> dict[int, dict]:
+from src.solver_logging import LEVELS, configure, get_logger
+from src.step_1_solver_initialization.cell_dict_view import CellDictView, dump_cell_dict
+from src.step_1_solver_initialization.field_store import FieldStore, FLUID, SOLID, BOUNDARY, NO_ROLE
+from src.step_1_solver_initialization.run_length_mask import RunLengthMask
+
+log = get_logger(__name__)
+
+# Domain faces recognised in apply_faces: (axis, which end)
+FACE_SLICES = {
+    "x_min": (0, 0), "x_max": (0, -1),
+    "y_min": (1, 0), "y_max": (1, -1),
+    "z_min": (2, 0), "z_max": (2, -1),
+}
+
+
+def _on_faces(cells: tuple, shape: tuple, faces: list) -> np.ndarray:
+    """For (i, j, k) index arrays, whether each cell lies on any of the listed domain faces."""
+    on_face = np.zeros(len(cells[0]), dtype=bool)
+    for face in faces:
+        if face in FACE_SLICES:
+            axis, end = FACE_SLICES[face]
+            on_face |= cells[axis] == (0 if end == 0 else shape[axis] - 1)
+    return on_face
+
+
+def build_field_store(config: dict) -> FieldStore:
     """
-    Build the per-cell dictionary from the simulation input config.
-    Each cell entry contains:
-      - flat_index
-      - grid_index [i, j, k]
-      - stencil-safe neighbor mapping
-      - geometry classification (fluid, solid, boundary)
-      - boundary role (inlet, outlet, wall, or None)
-      - time_history initialized with pressure and velocity from input
+    Build the initial domain directly as a FieldStore (timestep 0).
+
+    Vectorized equivalent of the per-cell classification in build_cell_dict:
+      - geometry_mask_flat (x-major) is reshaped to (nx, ny, nz) and classified
+        with mask_encoding (fluid, then solid, then boundary; anything else → fluid)
+      - boundary cells get a role by face test on their coordinates, one boundary
+        condition at a time, so the last matching condition wins; a condition
+        listing "wall" in apply_faces assigns "wall" to boundary cells that
+        match none of its domain faces
+      - pressure and velocity are filled from initial_conditions, then
+        overridden per cell by initial_fields["pressure"] ((N,), x-major) and
+        initial_fields["velocity"] ((N, 3)) when input_reader loaded them
+
+    Raises:
+        ValueError: if geometry_mask_flat does not hold nx*ny*nz entries.
     """
-
-    # Domain shape
     nx = config["domain_definition"]["nx"]
     ny = config["domain_definition"]["ny"]
     nz = config["domain_definition"]["nz"]
     shape = (nx, ny, nz)
 
-    # Geometry mask
-    mask_flat = config["geometry_definition"]["geometry_mask_flat"]
+    mask_flat = np.asarray(config["geometry_definition"]["geometry_mask_flat"])
     mask_encoding = config["geometry_definition"]["mask_encoding"]
+    if mask_flat.size != nx * ny * nz:
+        raise ValueError(f"geometry_mask_flat has {mask_flat.size} entries, expected {nx * ny * nz} for shape {shape}")
+    mask = mask_flat.reshape(shape, order="F")
 
-    # Initial conditions
     init_pressure = config["initial_conditions"]["initial_pressure"]
     init_velocity = config["initial_conditions"]["initial_velocity"]
 
-    # Boundary conditions
-    boundary_conditions = config.get("boundary_conditions", [])
-
-    cell_dict = {}
-
-    for flat_index, mask_value in enumerate(mask_flat):
-        i, j, k = flat_to_grid(flat_index, shape)
-
-        # Neighbor mapping
-        neighbors = get_stencil_neighbors(flat_index, shape)
-
-        # Geometry classification
-        if mask_value == mask_encoding["fluid"]:
-            cell_type = "fluid"
-        elif mask_value == mask_encoding["solid"]:
-            cell_type = "solid"
-        elif mask_value == mask_encoding["boundary"]:
-            cell_type = "boundary"
-        else:
-            cell_type = "fluid"  # fallback
-
-        # Boundary role assignment
-        boundary_role = None
-        if cell_type == "boundary":
-            # Match boundary conditions by face
-            for bc in boundary_conditions:
-                apply_faces = bc.get("apply_faces", [])
-                # Simplified: if any apply_faces match domain edge, assign role
-                if "x_min" in apply_faces and i == 0:
-                    boundary_role = bc["role"]
-                elif "x_max" in apply_faces and i == nx - 1:
-                    boundary_role = bc["role"]
-                elif "y_min" in apply_faces and j == 0:
-                    boundary_role = bc["role"]
-                elif "y_max" in apply_faces and j == ny - 1:
-                    boundary_role = bc["role"]
-                elif "z_min" in apply_faces and k == 0:
-                    boundary_role = bc["role"]
-                elif "z_max" in apply_faces and k == nz - 1:
-                    boundary_role = bc["role"]
-                elif "wall" in apply_faces:
-                    boundary_role = "wall"
-
-        # Initialize physics history
-        time_history = {
-            0: {
-                "pressure": init_pressure,
-                "velocity": {
-                    "vx": init_velocity[0],
-                    "vy": init_velocity[1],
-                    "vz": init_velocity[2],
-                },
-            }
-        }
-
-        cell_entry = {
-            "flat_index": flat_index,
-            "grid_index": [i, j, k],
-            **neighbors,
-            "cell_type": cell_type,
-            "boundary_role": boundary_role,
-            "time_history": time_history,
-        }
-
-        cell_dict[flat_index] = cell_entry
-
-        if debug and flat_index < 5:
-            print(f"🧱 Built cell {flat_index}: {cell_entry}")
+    store = FieldStore(shape, timestep=0)
+    store.pressure[...] = init_pressure
+    store.vx[...], store.vy[...], store.vz[...] = init_velocity[0], init_velocity[1], init_velocity[2]
+    fields = config["initial_conditions"].get("initial_fields", {})
+    if "pressure" in fields:
+        store.pressure[...] = np.asarray(fields["pressure"]).reshape(shape, order="F")
+    if "velocity" in fields:
+        velocity = np.asarray(fields["velocity"]).reshape(shape + (3,), order="F")
+        store.vx[...], store.vy[...], store.vz[...] = velocity[..., 0], velocity[..., 1], velocity[..., 2]
+
+    # Geometry classification, lowest precedence first
+    store.cell_type[...] = FLUID
+    if "boundary" in mask_encoding:
+        store.cell_type[mask == mask_encoding["boundary"]] = BOUNDARY
+    store.cell_type[mask == mask_encoding["solid"]] = SOLID
+    store.cell_type[mask == mask_encoding["fluid"]] = FLUID
+
+    # Boundary role assignment, visiting only the boundary cells
+    boundary = RunLengthMask.from_dense(store.cell_type).where(BOUNDARY)
+    for bc in config.get("boundary_conditions", []):
+        apply_faces = bc.get("apply_faces", [])
+        on_face = _on_faces(boundary, shape, apply_faces)
+        if "wall" in apply_faces:
+            store.boundary_role[tuple(axis[~on_face] for axis in boundary)] = store.role_code("wall")
+        if on_face.any():
+            store.boundary_role[tuple(axis[on_face] for axis in boundary)] = store.role_code(bc["role"])
+
+    if log.isEnabledFor(logging.DEBUG):
+        n_roles = int((store.boundary_role != NO_ROLE).sum())
+        log.debug("🧱 Built FieldStore %s: roles=%s, cells with role=%d", shape, store.roles, n_roles)
+
+    return store
+
+
+def build_cell_dict(config: dict) -> dict[int, dict]:
+    """
+    Build the per-cell dictionary from the simulation input config.
+    Each cell entry contains:
+      - flat_index
+      - grid_index [i, j, k]
+      - stencil-safe neighbor mapping
+      - geometry classification (fluid, solid, boundary)
+      - boundary role (inlet, outlet, wall, or None)
+      - time_history initialized with pressure and velocity from input
+
+    Compatibility call for code that needs a mutable legacy dict: it
+    materializes one dict per cell. The pipeline (main_solver) uses
+    build_field_store with a lazy CellDictView instead.
+    """
+    cell_dict = build_field_store(config).to_cell_dict()
+
+    if log.isEnabledFor(logging.DEBUG):
+        for flat_index in range(min(5, len(cell_dict))):
+            log.debug("🧱 Built cell %d: %s", flat_index, cell_dict[flat_index])
 
     return cell_dict
 
@@ -111,19 +127,22 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Build per-cell dictionary from simulation input JSON.")
     parser.add_argument("--input", required=True, help="Path to input JSON file (Step 0 output).")
     parser.add_argument("--output", required=True, help="Path to write cell_dict JSON output.")
+    parser.add_argument("--log-level", default=None,
+                        help=f"'level' or 'level,module=level,...' with levels {LEVELS} "
+                             "(default: $FLUID_SOLVER_LOG)")
     args = parser.parse_args()
+    configure(args.log_level)
 
     try:
         with open(args.input, "r") as f:
             config = json.load(f)
 
-        cell_dict = build_cell_dict(config)
+        cell_dict = CellDictView(build_field_store(config))
 
         with open(args.output, "w") as f:
-            json.dump(cell_dict, f, indent=2)
+            dump_cell_dict(cell_dict, f, indent=2)
 
-        if debug:
-            print(f"✅ Cell dictionary built and written to {args.output}")
+        log.debug("✅ Cell dictionary built and written to %s", args.output)
     except Exception as e:
         print(f"❌ Error running cell_builder: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,138 @@
+# src/step_1_solver_initialization/cell_dict_view.py
+# 🪟 Cell Dict View — read-only legacy cell_dict over FieldStore arrays
+#
+# CellDictView behaves like the dict returned by build_cell_dict (keys are flat
+# indices, values carry grid_index, flat_index_* neighbors, cell_type,
+# boundary_role and time_history) but builds each per-cell dict only when it is
+# accessed. Nothing is cached: N cells never turn into N resident dicts.
+#
+# The view is read-only. Writes to a returned cell dict are not reflected in
+# the underlying arrays; update the FieldStore instead.
+#
+# A view is a Mapping, not a dict, so plain json.dump(view, f) raises
+# TypeError. Serialise it with dump_cell_dict(view, f) or
+# json.dump(view, f, cls=CellDictEncoder); both stream one cell at a time.
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, TextIO
+
+import json
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.neighbor_mapper import build_neighbor_table
+
+log = get_logger(__name__)
+
+
+class CellDictView(Mapping):
+    """
+    Mapping flat_index → legacy cell dict, generated on access.
+
+    Parameters
+    ----------
+    *stores : FieldStore
+        One or more time levels over the same grid. Geometry (cell_type,
+        boundary_role) comes from the first; each store contributes
+        time_history[store.timestep].
+
+    Keys iterate as int like build_cell_dict; lookups also accept the str
+    keys step 2 uses after a JSON round trip.
+    """
+
+    def __init__(self, *stores: Any):
+        if not stores:
+            raise ValueError("CellDictView needs at least one FieldStore.")
+        shape = stores[0].shape
+        for store in stores[1:]:
+            if store.shape != shape:
+                raise ValueError(f"FieldStore shapes differ: {shape} vs {store.shape}")
+        self._stores = stores
+        self._neighbors, _ = build_neighbor_table(shape)
+
+    def _flat(self, key: Any) -> int:
+        try:
+            flat_index = int(key)
+        except (TypeError, ValueError):
+            raise KeyError(key) from None
+        if isinstance(key, float) or not 0 <= flat_index < self._stores[0].n_cells:
+            raise KeyError(key)
+        return flat_index
+
+    def __getitem__(self, key: Any) -> Dict[str, Any]:
+        flat_index = self._flat(key)
+        entry = self._stores[0].cell_entry(flat_index, self._neighbors)
+        if len(self._stores) > 1:
+            i, j, k = entry["grid_index"]
+            entry["time_history"] = {store.timestep: store.state_at(i, j, k) for store in self._stores}
+        return entry
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._stores[0].n_cells))
+
+    def __len__(self) -> int:
+        return self._stores[0].n_cells
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            self._flat(key)
+        except KeyError:
+            return False
+        return True
+
+    def to_dict(self) -> Dict[int, Dict[str, Any]]:
+        """Materialize the full legacy dict (same as build_cell_dict)."""
+        return {flat_index: self[flat_index] for flat_index in self}
+
+
+def iter_cell_dict_json(cell_dict: Mapping, indent: int | str | None = 2) -> Iterator[str]:
+    """
+    Yield the JSON text of a cell_dict (dict or CellDictView) cell by cell.
+
+    The chunks join to json.dumps(dict(cell_dict), indent=indent), but only one
+    cell dict exists at any moment.
+    """
+    if indent is None:
+        item_sep, key_sep, pad, close = ", ", ": ", "", "}"
+    else:
+        pad = "\n" + (indent if isinstance(indent, str) else " " * indent)
+        item_sep, key_sep, close = ",", ": ", "\n}"
+
+    yield "{"
+    first = True
+    for key in cell_dict:
+        body = json.dumps(cell_dict[key], indent=indent)
+        if indent is not None:
+            body = body.replace("\n", pad)
+        yield ("" if first else item_sep) + pad + json.dumps(str(key)) + key_sep + body
+        first = False
+    yield "}" if first else close
+
+
+def dump_cell_dict(cell_dict: Mapping, fp: TextIO, indent: int | None = 2) -> None:
+    """Write a cell_dict (dict or CellDictView) as JSON, one cell at a time."""
+    for chunk in iter_cell_dict_json(cell_dict, indent):
+        fp.write(chunk)
+
+    log.debug("🪟 Streamed %d cells to JSON", len(cell_dict))
+
+
+class CellDictEncoder(json.JSONEncoder):
+    """
+    JSONEncoder that streams a top-level CellDictView:
+
+        json.dump(CellDictView(store), f, cls=CellDictEncoder, indent=2)
+
+    Only indent is honoured for the view itself (same text as dump_cell_dict);
+    a view nested inside other data is materialised with to_dict().
+    """
+
+    def iterencode(self, o: Any, _one_shot: bool = False) -> Iterator[str]:
+        if isinstance(o, CellDictView):
+            return iter_cell_dict_json(o, self.indent)
+        return super().iterencode(o, _one_shot)
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, CellDictView):
+            return {str(key): value for key, value in o.to_dict().items()}
+        return super().default(o)
+
@@ -0,0 +1,254 @@
+# src/step_1_solver_initialization/field_store.py
+# 🗃️ Field Store — structure-of-arrays storage for pressure and velocity
+#
+# The legacy per-cell dictionary reaches a value through
+#   cell_dict[str(idx)]["time_history"][str(t)]["velocity"]["vx"]
+# which costs several hash lookups per access. FieldStore keeps one time level
+# of pressure, vx, vy, vz as contiguous float64 arrays shaped (nx, ny, nz) and
+# indexed [i, j, k], plus compact geometry codes, so operators can run on
+# whole arrays. The adapter methods convert from/to the cell_dict layout.
+#
+# Flat indices follow the x-major convention of indexing_utils:
+#   flat_index = i + nx * (j + ny * k)
+# which is Fortran order for an (nx, ny, nz) array.
+
+from typing import Dict, Any, Tuple
+
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.neighbor_mapper import (
+    build_neighbor_table,
+    get_stencil_neighbors,
+    neighbor_entry,
+)
+
+log = get_logger(__name__)
+
+# Cell type codes stored in FieldStore.cell_type
+FLUID = 0
+SOLID = 1
+BOUNDARY = 2
+CELL_TYPES = ("fluid", "solid", "boundary")
+
+# Sentinel stored in FieldStore.boundary_role for cells without a role
+NO_ROLE = -1
+
+FIELD_NAMES = ("pressure", "vx", "vy", "vz")
+GEOMETRY_NAMES = ("cell_type", "boundary_role")
+
+
+def _lookup(mapping: Dict[Any, Any], key: Any) -> Any:
+    """Fetch key from a dict whose keys may be int or str (JSON round-trips stringify keys)."""
+    if key in mapping:
+        return mapping[key]
+    alt = str(key) if not isinstance(key, str) else (int(key) if key.lstrip("-").isdigit() else None)
+    if alt is not None and alt in mapping:
+        return mapping[alt]
+    return None
+
+
+def _latest_timestep(time_history: Dict[Any, Any]) -> Any:
+    """Return the largest integer-valued key of a time_history (staging keys are skipped)."""
+    steps = [int(k) for k in time_history if str(k).lstrip("-").isdigit()]
+    if not steps:
+        raise ValueError("No committed timestep available in time_history.")
+    return max(steps)
+
+
+class FieldStore:
+    """
+    One time level of the flow field stored as (nx, ny, nz) NumPy arrays.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Grid resolution (nx, ny, nz).
+    timestep : int or str
+        time_history key this level corresponds to.
+    pressure, vx, vy, vz : np.ndarray
+        float64 arrays indexed [i, j, k].
+    cell_type : np.ndarray
+        uint8 codes (FLUID, SOLID, BOUNDARY).
+    boundary_role : np.ndarray
+        int8 index into ``roles`` or NO_ROLE.
+    roles : tuple of str
+        Boundary role names referenced by ``boundary_role``.
+    sparse : dict
+        Cached RunLengthMasks of cell_type / boundary_role, filled on first
+        use by run_length_mask.sparse_mask. Every derived store (copy,
+        z_window) starts with an empty cache.
+    """
+
+    __slots__ = ("shape", "timestep", "pressure", "vx", "vy", "vz",
+                 "cell_type", "boundary_role", "roles", "sparse")
+
+    def __init__(self, shape: Tuple[int, int, int], timestep: Any = 0, roles: Tuple[str, ...] = ()):
+        nx, ny, nz = (int(n) for n in shape)
+        if nx <= 0 or ny <= 0 or nz <= 0:
+            raise ValueError(f"Invalid grid resolution: nx={nx}, ny={ny}, nz={nz}")
+        self.shape = (nx, ny, nz)
+        self.timestep = timestep
+        self.pressure = np.zeros(self.shape, dtype=np.float64)
+        self.vx = np.zeros(self.shape, dtype=np.float64)
+        self.vy = np.zeros(self.shape, dtype=np.float64)
+        self.vz = np.zeros(self.shape, dtype=np.float64)
+        self.cell_type = np.zeros(self.shape, dtype=np.uint8)
+        self.boundary_role = np.full(self.shape, NO_ROLE, dtype=np.int8)
+        self.roles = tuple(roles)
+        self.sparse = {}
+
+    # ---------------- Basic helpers ----------------
+
+    @property
+    def n_cells(self) -> int:
+        nx, ny, nz = self.shape
+        return nx * ny * nz
+
+    def _derive(self, shape: Tuple[int, int, int], timestep: Any, take) -> "FieldStore":
+        """New FieldStore whose arrays are take(array) of this store's arrays."""
+        out = FieldStore.__new__(FieldStore)
+        out.shape = shape
+        out.timestep = timestep
+        for name in FIELD_NAMES + GEOMETRY_NAMES:
+            setattr(out, name, take(getattr(self, name)))
+        out.roles = self.roles
+        out.sparse = {}
+        return out
+
+    def copy(self, timestep: Any = None) -> "FieldStore":
+        """Deep copy of fields and geometry, optionally relabelled with a new timestep."""
+        return self._derive(self.shape, self.timestep if timestep is None else timestep, np.copy)
+
+    def empty_like(self, timestep: Any = None) -> "FieldStore":
+        """Copy of the geometry with uninitialised field arrays, for kernels that write every value."""
+        out = self._derive(self.shape, self.timestep if timestep is None else timestep, np.empty_like)
+        out.cell_type[...] = self.cell_type
+        out.boundary_role[...] = self.boundary_role
+        return out
+
+    def z_window(self, k_start: int, k_stop: int) -> "FieldStore":
+        """Planes k_start:k_stop as a FieldStore sharing memory with this one (no copy)."""
+        if not 0 <= k_start < k_stop <= self.shape[2]:
+            raise ValueError(f"Invalid z-window {k_start}:{k_stop} for nz={self.shape[2]}")
+        shape = (self.shape[0], self.shape[1], k_stop - k_start)
+        return self._derive(shape, self.timestep, lambda values: values[:, :, k_start:k_stop])
+
+    def flat(self, name: str) -> np.ndarray:
+        """Return a field as a 1D array in flat_index (x-major) order."""
+        return getattr(self, name).ravel(order="F")
+
+    def role_code(self, role: str) -> int:
+        """Return the boundary_role code for a role name, registering it if new."""
+        if role in self.roles:
+            return self.roles.index(role)
+        if len(self.roles) >= np.iinfo(np.int8).max:
+            raise ValueError("Too many distinct boundary roles for int8 storage.")
+        self.roles = self.roles + (role,)
+        return len(self.roles) - 1
+
+    # ---------------- cell_dict adapter ----------------
+
+    @classmethod
+    def from_cell_dict(cls, cell_dict: Dict[Any, Dict[str, Any]],
+                       shape: Tuple[int, int, int] | None = None,
+                       timestep: Any = None) -> "FieldStore":
+        """
+        Build a FieldStore from a legacy per-cell dictionary.
+
+        Parameters
+        ----------
+        cell_dict : dict
+            Cells keyed by flat_index (int or str), each with "grid_index",
+            "cell_type", "boundary_role" and "time_history".
+        shape : tuple of int, optional
+            Grid resolution. Inferred from the largest grid_index if omitted.
+        timestep : int or str, optional
+            time_history key to load. Defaults to the latest committed step.
+
+        Raises
+        ------
+        ValueError
+            If cell_dict is empty or a cell lacks the requested time level.
+        """
+        if not cell_dict:
+            raise ValueError("Cannot build FieldStore from an empty cell_dict.")
+
+        if shape is None:
+            maxima = [0, 0, 0]
+            for cell in cell_dict.values():
+                for axis, idx in enumerate(cell["grid_index"]):
+                    maxima[axis] = max(maxima[axis], idx)
+            shape = (maxima[0] + 1, maxima[1] + 1, maxima[2] + 1)
+
+        if timestep is None:
+            timestep = _latest_timestep(next(iter(cell_dict.values()))["time_history"])
+
+        store = cls(shape, timestep=timestep)
+        type_codes = {name: code for code, name in enumerate(CELL_TYPES)}
+
+        for key, cell in cell_dict.items():
+            i, j, k = cell["grid_index"]
+            state = _lookup(cell["time_history"], timestep)
+            if state is None:
+                raise ValueError(f"No time_history for timestep {timestep} in cell {key}")
+            store.pressure[i, j, k] = state["pressure"]
+            vel = state["velocity"]
+            store.vx[i, j, k] = vel["vx"]
+            store.vy[i, j, k] = vel["vy"]
+            store.vz[i, j, k] = vel["vz"]
+            store.cell_type[i, j, k] = type_codes.get(cell.get("cell_type"), FLUID)
+            role = cell.get("boundary_role")
+            if role is not None:
+                store.boundary_role[i, j, k] = store.role_code(role)
+
+        log.debug("🗃️ FieldStore loaded from cell_dict: shape=%s, timestep=%s", store.shape, timestep)
+
+        return store
+
+    def state_at(self, i: int, j: int, k: int) -> Dict[str, Any]:
+        """Return the legacy {"pressure", "velocity"} state dict for one cell."""
+        return {
+            "pressure": float(self.pressure[i, j, k]),
+            "velocity": {
+                "vx": float(self.vx[i, j, k]),
+                "vy": float(self.vy[i, j, k]),
+                "vz": float(self.vz[i, j, k]),
+            },
+        }
+
+    def cell_entry(self, flat_index: int, neighbors: np.ndarray | None = None) -> Dict[str, Any]:
+        """
+        Return the legacy cell_dict entry for one flat index (same layout as build_cell_dict).
+        neighbors is an optional precomputed build_neighbor_table(self.shape) table.
+        """
+        nx, ny, _ = self.shape
+        i = flat_index % nx
+        j = (flat_index // nx) % ny
+        k = flat_index // (nx * ny)
+        role = int(self.boundary_role[i, j, k])
+        stencil = (get_stencil_neighbors(flat_index, self.shape) if neighbors is None
+                   else neighbor_entry(neighbors, flat_index))
+        return {
+            "flat_index": flat_index,
+            "grid_index": [i, j, k],
+            **stencil,
+            "cell_type": CELL_TYPES[int(self.cell_type[i, j, k])],
+            "boundary_role": None if role == NO_ROLE else self.roles[role],
+            "time_history": {self.timestep: self.state_at(i, j, k)},
+        }
+
+    def to_cell_dict(self) -> Dict[int, Dict[str, Any]]:
+        """Export the full legacy cell_dict, keyed by flat_index like build_cell_dict."""
+        table, _ = build_neighbor_table(self.shape)
+        return {flat_index: self.cell_entry(flat_index, table) for flat_index in range(self.n_cells)}
+
+    def write_time_level(self, cell_dict: Dict[Any, Dict[str, Any]], key: Any = None) -> None:
+        """
+        Write this level's fields into each cell's time_history under key
+        (defaults to self.timestep). Only cells present in cell_dict are written.
+        """
+        key = self.timestep if key is None else key
+        for cell in cell_dict.values():
+            i, j, k = cell["grid_index"]
+            cell["time_history"][key] = self.state_at(i, j, k)
@@ -1,8 +1,9 @@
 # src/step_1_solver_initialization/indexing_utils.py
 # 🔁 Converts between flat_index and grid_index [x, y, z] using x-major (row-major) flattening logic
 
-# ✅ Centralized debug flag
-debug = False
+from src.solver_logging import get_logger
+
+log = get_logger(__name__)
 
 def grid_to_flat(x: int, y: int, z: int, shape: tuple[int, int, int]) -> int:
     """
@@ -11,10 +12,9 @@ def grid_to_flat(x: int, y: int, z: int, shape: tuple[int, int, int]) -> int:
     """
     nx, ny, nz = shape
     flat_index = x + nx * (y + ny * z)
-    if debug:
-        print(f"📐 grid_to_flat → (x={x}, y={y}, z={z}, shape={shape})")
-        print(f"   Formula: flat_index = x + nx*(y + ny*z)")
-        print(f"   Result: flat_index = {flat_index}")
+    log.debug("📐 grid_to_flat → (x=%s, y=%s, z=%s, shape=%s)\n"
+              "   Formula: flat_index = x + nx*(y + ny*z)\n"
+              "   Result: flat_index = %s", x, y, z, shape, flat_index)
     return flat_index
 
 def flat_to_grid(flat_index: int, shape: tuple[int, int, int]) -> list[int]:
@@ -29,28 +29,57 @@ def flat_to_grid(flat_index: int, shape: tuple[int, int, int]) -> list[int]:
     z = flat_index // (nx * ny)
     y = (flat_index % (nx * ny)) // nx
     x = flat_index % nx
-    if debug:
-        print(f"📐 flat_to_grid → flat_index={flat_index}, shape={shape}")
-        print(f"   Reverse mapping formulas:")
-        print(f"   z = flat_index // (nx*ny) → {z}")
-        print(f"   y = (flat_index % (nx*ny)) // nx → {y}")
-        print(f"   x = flat_index % nx → {x}")
-        print(f"   Result: (x={x}, y={y}, z={z})")
+    log.debug("📐 flat_to_grid → flat_index=%s, shape=%s\n"
+              "   Reverse mapping formulas:\n"
+              "   z = flat_index // (nx*ny) → %s\n"
+              "   y = (flat_index %% (nx*ny)) // nx → %s\n"
+              "   x = flat_index %% nx → %s\n"
+              "   Result: (x=%s, y=%s, z=%s)", flat_index, shape, z, y, x, x, y, z)
     return [x, y, z]
 
 def is_valid_grid_index(x: int, y: int, z: int, shape: tuple[int, int, int]) -> bool:
     nx, ny, nz = shape
     valid = 0 <= x < nx and 0 <= y < ny and 0 <= z < nz
-    if debug:
-        print(f"🔍 is_valid_grid_index → (x={x}, y={y}, z={z}, shape={shape}) → {valid}")
+    log.debug("🔍 is_valid_grid_index → (x=%s, y=%s, z=%s, shape=%s) → %s", x, y, z, shape, valid)
     return valid
 
 def is_valid_flat_index(flat_index: int, shape: tuple[int, int, int]) -> bool:
     nx, ny, nz = shape
     valid = 0 <= flat_index < nx * ny * nz
-    if debug:
-        print(f"🔍 is_valid_flat_index → flat_index={flat_index}, shape={shape} → {valid}")
+    log.debug("🔍 is_valid_flat_index → flat_index=%s, shape=%s → %s", flat_index, shape, valid)
     return valid
 
+# ---------------- Global ↔ local (domain decomposition) ----------------
+# A rank owns the block whose first global cell is offset = (x0, y0, z0) and
+# whose size is local_shape. Local indices count from that corner; flat
+# indices on either side use the same x-major formula.
+
+def global_to_local(x: int, y: int, z: int, offset: tuple[int, int, int]) -> list[int]:
+    """Global grid index → index inside the block starting at offset."""
+    local = [x - offset[0], y - offset[1], z - offset[2]]
+    log.debug("🧭 global_to_local → (%s, %s, %s) - offset %s = %s", x, y, z, offset, local)
+    return local
+
+def local_to_global(x: int, y: int, z: int, offset: tuple[int, int, int]) -> list[int]:
+    """Index inside the block starting at offset → global grid index."""
+    glob = [x + offset[0], y + offset[1], z + offset[2]]
+    log.debug("🧭 local_to_global → (%s, %s, %s) + offset %s = %s", x, y, z, offset, glob)
+    return glob
 
+def global_flat_to_local_flat(flat_index: int, shape: tuple[int, int, int],
+                              offset: tuple[int, int, int],
+                              local_shape: tuple[int, int, int]) -> int | None:
+    """
+    Global flat_index → flat index inside the block (x-major over local_shape),
+    or None when the cell is not owned by the block.
+    """
+    local = global_to_local(*flat_to_grid(flat_index, shape), offset)
+    if not is_valid_grid_index(*local, local_shape):
+        return None
+    return grid_to_flat(*local, local_shape)
 
+def local_flat_to_global_flat(local_flat: int, local_shape: tuple[int, int, int],
+                              offset: tuple[int, int, int],
+                              shape: tuple[int, int, int]) -> int:
+    """Flat index inside the block → global flat_index."""
+    return grid_to_flat(*local_to_global(*flat_to_grid(local_flat, local_shape), offset), shape)
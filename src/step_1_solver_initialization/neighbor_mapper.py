@@ -1,14 +1,29 @@
 # src/step_1_solver_initialization/neighbor_mapper.py
 # 🧭 Maps stencil-safe neighbors for each flat_index in a 3D grid
 
+import logging
+
+import numpy as np
+
+from src.solver_logging import get_logger
 from src.step_1_solver_initialization.indexing_utils import (
     grid_to_flat,
     flat_to_grid,
     is_valid_grid_index
 )
 
-# ✅ Centralized debug flag
-debug = False
+log = get_logger(__name__)
+
+# Column order of the neighbor table (same keys and order as get_stencil_neighbors)
+NEIGHBOR_KEYS = (
+    "flat_index_i_minus_1",
+    "flat_index_i_plus_1",
+    "flat_index_j_minus_1",
+    "flat_index_j_plus_1",
+    "flat_index_k_minus_1",
+    "flat_index_k_plus_1",
+)
+NO_NEIGHBOR = -1  # sentinel for out-of-bounds (or masked-out) neighbors
 
 def get_stencil_neighbors(flat_index: int, shape: tuple[int, int, int]) -> dict:
     """
@@ -16,9 +31,8 @@ def get_stencil_neighbors(flat_index: int, shape: tuple[int, int, int]) -> dict:
     If a neighbor is out of bounds, its value will be None.
     """
     x, y, z = flat_to_grid(flat_index, shape)
-    if debug:
-        print(f"🧭 get_stencil_neighbors → flat_index={flat_index}, shape={shape}")
-        print(f"   Coordinates: (x={x}, y={y}, z={z})")
+    log.debug("🧭 get_stencil_neighbors → flat_index=%s, shape=%s\n   Coordinates: (x=%s, y=%s, z=%s)",
+              flat_index, shape, x, y, z)
 
     neighbors = {}
 
@@ -27,41 +41,98 @@ def get_stencil_neighbors(flat_index: int, shape: tuple[int, int, int]) -> dict:
         nx = x + dx
         if is_valid_grid_index(nx, y, z, shape):
             neighbors[label] = grid_to_flat(nx, y, z, shape)
-            if debug:
-                print(f"   {label}: valid → {neighbors[label]} (from (x={nx}, y={y}, z={z}))")
+            log.debug("   %s: valid → %s (from (x=%s, y=%s, z=%s))", label, neighbors[label], nx, y, z)
         else:
             neighbors[label] = None
-            if debug:
-                print(f"   {label}: out of bounds → None")
+            log.debug("   %s: out of bounds → None", label)
 
     # j-direction neighbors
     for dy, label in [(-1, "flat_index_j_minus_1"), (1, "flat_index_j_plus_1")]:
         ny = y + dy
         if is_valid_grid_index(x, ny, z, shape):
             neighbors[label] = grid_to_flat(x, ny, z, shape)
-            if debug:
-                print(f"   {label}: valid → {neighbors[label]} (from (x={x}, y={ny}, z={z}))")
+            log.debug("   %s: valid → %s (from (x=%s, y=%s, z=%s))", label, neighbors[label], x, ny, z)
         else:
             neighbors[label] = None
-            if debug:
-                print(f"   {label}: out of bounds → None")
+            log.debug("   %s: out of bounds → None", label)
 
     # k-direction neighbors
     for dz, label in [(-1, "flat_index_k_minus_1"), (1, "flat_index_k_plus_1")]:
         nz = z + dz
         if is_valid_grid_index(x, y, nz, shape):
             neighbors[label] = grid_to_flat(x, y, nz, shape)
-            if debug:
-                print(f"   {label}: valid → {neighbors[label]} (from (x={x}, y={y}, z={nz}))")
+            log.debug("   %s: valid → %s (from (x=%s, y=%s, z=%s))", label, neighbors[label], x, y, nz)
         else:
             neighbors[label] = None
-            if debug:
-                print(f"   {label}: out of bounds → None")
+            log.debug("   %s: out of bounds → None", label)
 
-    if debug:
-        print(f"🧭 Neighbor mapping complete for flat_index={flat_index}\n")
+    log.debug("🧭 Neighbor mapping complete for flat_index=%s", flat_index)
 
     return neighbors
 
 
+def build_neighbor_table(shape: tuple[int, int, int], mask: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized get_stencil_neighbors for every cell at once.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Grid resolution (nx, ny, nz).
+    mask : np.ndarray, optional
+        Boolean array of existing cells, shaped (nx, ny, nz) or flat (x-major).
+        Neighbors outside the mask are reported as NO_NEIGHBOR too.
+
+    Returns
+    -------
+    (table, boundary) : tuple of np.ndarray
+        table: (N, 6) int32 neighbor flat indices, columns in NEIGHBOR_KEYS
+        order, NO_NEIGHBOR where get_stencil_neighbors would return None.
+        boundary: (N,) bool, True for cells with at least one missing neighbor.
+    """
+    nx, ny, nz = shape
+    n_cells = nx * ny * nz
+    if n_cells >= np.iinfo(np.int32).max:
+        raise ValueError(f"Grid of {n_cells} cells does not fit int32 neighbor indices.")
+
+    flat = np.arange(n_cells, dtype=np.int32)
+    coords = (flat % nx, (flat // nx) % ny, flat // (nx * ny))
+    strides = (1, nx, nx * ny)
+
+    table = np.empty((n_cells, 6), dtype=np.int32)
+    for axis, (coord, stride, size) in enumerate(zip(coords, strides, shape)):
+        table[:, 2 * axis] = np.where(coord > 0, flat - stride, NO_NEIGHBOR)
+        table[:, 2 * axis + 1] = np.where(coord < size - 1, flat + stride, NO_NEIGHBOR)
+
+    if mask is not None:
+        mask_flat = np.asarray(mask, dtype=bool)
+        if mask_flat.ndim == 3:
+            mask_flat = mask_flat.ravel(order="F")
+        missing = table == NO_NEIGHBOR
+        table[~missing & ~mask_flat[np.where(missing, 0, table)]] = NO_NEIGHBOR
+
+    boundary = (table == NO_NEIGHBOR).any(axis=1)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🧭 build_neighbor_table → shape=%s, boundary cells=%d", shape, int(boundary.sum()))
+
+    return table, boundary
+
+
+def gather_neighbors(values: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """
+    Fancy-index gather of a flat (x-major) field through a neighbor table.
+
+    Returns an (N, 6) array; missing neighbors take the cell's own value,
+    the same Neumann fallback the step-2 stencils use.
+    """
+    own = np.arange(table.shape[0])[:, None]
+    return np.asarray(values)[np.where(table == NO_NEIGHBOR, own, table)]
+
 
+def neighbor_entry(table: np.ndarray, flat_index: int) -> dict:
+    """Return the get_stencil_neighbors dict for one cell from a neighbor table."""
+    return {
+        key: (int(idx) if idx != NO_NEIGHBOR else None)
+        for key, idx in zip(NEIGHBOR_KEYS, table[flat_index])
+    }
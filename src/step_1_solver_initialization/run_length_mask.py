@@ -0,0 +1,166 @@
+# src/step_1_solver_initialization/run_length_mask.py
+# 🧩 Run-Length Mask — compact geometry codes for mostly-fluid domains
+#
+# A RunLengthMask stores only the cells whose code differs from a background
+# value (FLUID for cell_type, NO_ROLE for boundary_role), as runs of equal
+# codes along the x-major flat index:
+#   starts[r], lengths[r], codes[r]   (sorted by start, runs never touch
+#                                      another run with the same code)
+# so a domain that is 95% fluid costs memory and work in proportion to its
+# solid/boundary cells, not to nx*ny*nz. Point queries bisect the run starts;
+# cells()/where() expand only the special runs.
+#
+# sparse_mask(store, name) encodes store.cell_type or store.boundary_role on
+# first use and caches it in store.sparse. The cache belongs to one store:
+# copies own their geometry arrays and start with an empty cache, so editing a
+# copy's cell_type / boundary_role never reads the original's mask.
+
+import logging
+from typing import Any, Iterator, Tuple
+
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.field_store import BOUNDARY, FLUID, NO_ROLE, SOLID
+
+log = get_logger(__name__)
+
+
+class RunLengthMask:
+    """
+    Geometry codes of an (nx, ny, nz) grid as runs of non-background cells.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Grid resolution.
+    starts, lengths, codes : np.ndarray
+        One entry per run, in increasing x-major flat index order.
+    background : int
+        Code of every cell outside the runs.
+    """
+
+    __slots__ = ("shape", "starts", "lengths", "codes", "background")
+
+    def __init__(self, shape: Tuple[int, int, int], starts: np.ndarray, lengths: np.ndarray,
+                 codes: np.ndarray, background: int = FLUID):
+        self.shape = tuple(int(n) for n in shape)
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.codes = np.asarray(codes)
+        self.background = background
+
+    @classmethod
+    def from_dense(cls, dense: np.ndarray, background: int = FLUID) -> "RunLengthMask":
+        """Encode an (nx, ny, nz) code array (e.g. FieldStore.cell_type)."""
+        dense = np.asarray(dense)
+        flat = dense.ravel(order="F")
+        if flat.size == 0:
+            raise ValueError("Cannot encode an empty mask.")
+        starts = np.r_[0, np.flatnonzero(flat[1:] != flat[:-1]) + 1]
+        lengths = np.diff(np.r_[starts, flat.size])
+        codes = flat[starts]
+        keep = codes != background
+        mask = cls(dense.shape, starts[keep], lengths[keep], codes[keep], background)
+        if log.isEnabledFor(logging.DEBUG):  # count() sums every run
+            log.debug("🧩 RunLengthMask %s: %d runs, %d special cells", mask.shape, len(mask.starts), mask.count())
+        return mask
+
+    @property
+    def n_cells(self) -> int:
+        nx, ny, nz = self.shape
+        return nx * ny * nz
+
+    def to_dense(self, dtype: Any = None) -> np.ndarray:
+        """(nx, ny, nz) code array (dtype defaults to the encoded array's)."""
+        flat = np.full(self.n_cells, self.background, dtype=dtype or self.codes.dtype)
+        flat[self.cells()] = np.repeat(self.codes, self.lengths)
+        return flat.reshape(self.shape, order="F")
+
+    # ---------------- Queries ----------------
+
+    def count(self, code: int | None = None) -> int:
+        """Number of non-background cells (or of cells with one code)."""
+        lengths = self.lengths if code is None else self.lengths[self.codes == code]
+        return int(lengths.sum())
+
+    def codes_present(self) -> np.ndarray:
+        """Sorted non-background codes that occur in the grid."""
+        return np.unique(self.codes)
+
+    def code_at(self, flat_index: Any) -> Any:
+        """
+        Code of one cell or an array of cells, by x-major flat index.
+
+        Raises:
+            ValueError: if an index lies outside the grid.
+        """
+        flat = np.asarray(flat_index, dtype=np.int64)
+        if flat.size and (flat.min() < 0 or flat.max() >= self.n_cells):
+            raise ValueError(f"Flat index out of range for grid {self.shape}.")
+        if len(self.starts) == 0:
+            codes = np.full(flat.shape, self.background)
+        else:
+            run = np.maximum(np.searchsorted(self.starts, flat, side="right") - 1, 0)
+            inside = (flat >= self.starts[run]) & (flat < self.starts[run] + self.lengths[run])
+            codes = np.where(inside, self.codes[run], self.background)
+        return codes.item() if codes.ndim == 0 else codes
+
+    def is_solid(self, flat_index: Any) -> Any:
+        return self.code_at(flat_index) == SOLID
+
+    def is_boundary(self, flat_index: Any) -> Any:
+        return self.code_at(flat_index) == BOUNDARY
+
+    def cells(self, code: int | None = None) -> np.ndarray:
+        """Sorted flat indices of the non-background cells (or of one code)."""
+        select = slice(None) if code is None else self.codes == code
+        starts, lengths = self.starts[select], self.lengths[select]
+        offsets = np.r_[0, np.cumsum(lengths)[:-1]]
+        return np.arange(int(lengths.sum()), dtype=np.int64) + np.repeat(starts - offsets, lengths)
+
+    def where(self, code: int | None = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(i, j, k) index arrays of cells(code), for indexing (nx, ny, nz) fields."""
+        return np.unravel_index(self.cells(code), self.shape, order="F")
+
+    def iterate_active_cells(self, inactive: int = SOLID) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (start, stop) flat-index ranges of the cells whose code is not inactive.
+
+        Only the inactive runs are visited, so a mostly-fluid grid yields a
+        handful of long ranges.
+
+        Raises:
+            ValueError: if inactive is the background code.
+        """
+        if inactive == self.background:
+            raise ValueError(f"Inactive code {inactive} is the background; every cell would be skipped.")
+        position = 0
+        select = self.codes == inactive
+        for start, length in zip(self.starts[select].tolist(), self.lengths[select].tolist()):
+            if start > position:
+                yield position, start
+            position = start + length
+        if position < self.n_cells:
+            yield position, self.n_cells
+
+
+SPARSE_BACKGROUND = {"cell_type": FLUID, "boundary_role": NO_ROLE}
+
+
+def sparse_mask(store: Any, name: str = "cell_type") -> RunLengthMask:
+    """
+    RunLengthMask of a FieldStore geometry array ("cell_type" or "boundary_role").
+
+    Built on first use and cached in store.sparse; clear store.sparse after
+    editing that store's geometry arrays in place.
+
+    Raises:
+        KeyError: for any other array name.
+    """
+    if name not in SPARSE_BACKGROUND:
+        raise KeyError(f"No sparse mask for '{name}'. Expected one of {tuple(SPARSE_BACKGROUND)}.")
+    mask = store.sparse.get(name)
+    if mask is None:
+        mask = store.sparse[name] = RunLengthMask.from_dense(getattr(store, name), SPARSE_BACKGROUND[name])
+    return mask
@@ -0,0 +1,136 @@
+# src/step_2_time_stepping_loop/block_executor.py
+# 🧶 Block Executor — whole-grid operators over z-blocks in a thread pool
+#
+# Lighter-weight sibling of parallel_predictor.SlabPredictor: the grid is cut
+# into z-blocks and each block runs the vectorized operator on a zero-copy
+# FieldStore.z_window (block plus HALO_WIDTH planes on either side) in a
+# ThreadPoolExecutor. NumPy releases the GIL inside large ufunc calls, so the
+# blocks run concurrently without shared-memory plumbing. Block interiors are
+# written into the full-grid result, which matches the serial operator
+# exactly.
+#
+# Supported operators: laplacian, advection, divergence (collocated
+# diagnostic), mac_divergence (the staggered D of the projection, with its
+# active mask cut to each block), pressure_gradient and
+# the fused predictor (predict, same signature as SlabPredictor.predict;
+# like it, always the NumPy predictor).
+#
+# The kernels' timing spans are off in the worker threads (the active profiler
+# is per thread, see instrumentation.py); the caller's span times a run()
+# as a whole, e.g. the driver's "predictor" phase around predict().
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Tuple
+
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_2_time_stepping_loop.mac_advection_ops import advection_grid
+from src.step_2_time_stepping_loop.mac_diffusion import laplacian_velocity_grid
+from src.step_2_time_stepping_loop.mac_gradients import (
+    divergence_grid,
+    mac_divergence_grid,
+    pressure_gradient_grid,
+)
+from src.step_2_time_stepping_loop.mac_update_velocity import update_velocity_grid
+from src.step_2_time_stepping_loop.parallel_predictor import HALO_WIDTH, slab_bounds
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+
+log = get_logger(__name__)
+
+
+def _pressure_gradient_kernel(window: Any, dx: float, dy: float, dz: float) -> tuple:
+    return pressure_gradient_grid(window.pressure, dx, dy, dz)
+
+
+class BlockExecutor:
+    """
+    Thread pool running whole-grid operators block by block along z.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Thread count (defaults to os.cpu_count()). workers=1 calls the
+        operators directly on the full grid.
+    blocks_per_worker : int
+        z-blocks per thread; more blocks balance uneven thread progress.
+    halo : int
+        Planes read beyond each block (HALO_WIDTH covers every operator).
+
+    Use as a context manager, or call close(), to stop the threads.
+    """
+
+    def __init__(self, workers: int | None = None, blocks_per_worker: int = 1, halo: int = HALO_WIDTH):
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1 or blocks_per_worker < 1:
+            raise ValueError(f"Invalid thread layout: workers={self.workers}, blocks_per_worker={blocks_per_worker}")
+        self.blocks_per_worker = blocks_per_worker
+        self.halo = halo
+        self._executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+
+    def run(self, kernel: Callable[..., Any], store: Any, *args,
+            windowed: Tuple[str, ...] = (), **kwargs) -> Any:
+        """
+        Evaluate kernel(window, *args, **kwargs) block-parallel.
+
+        kernel must return one (nx, ny, nz_window) array or a tuple of them;
+        the result has the same structure over the full grid. Keyword
+        arguments named in windowed are full-grid arrays (or None) cut to the
+        same z-window as store.
+        """
+        if self._executor is None:
+            return kernel(store, *args, **kwargs)
+
+        nz = store.shape[2]
+
+        def block_task(bounds: Tuple[int, int]):
+            lo, hi = max(0, bounds[0] - self.halo), min(nz, bounds[1] + self.halo)
+            cut = {name: kwargs[name][:, :, lo:hi] for name in windowed if kwargs[name] is not None}
+            return bounds, lo, kernel(store.z_window(lo, hi), *args, **{**kwargs, **cut})
+
+        outputs = None
+        single = False
+        for (k_start, k_stop), lo, result in self._executor.map(
+                block_task, slab_bounds(nz, self.workers * self.blocks_per_worker)):
+            single = not isinstance(result, tuple)
+            parts = (result,) if single else result
+            if outputs is None:
+                outputs = tuple(np.empty(store.shape, dtype=np.float64) for _ in parts)
+            for out, part in zip(outputs, parts):
+                out[:, :, k_start:k_stop] = part[:, :, k_start - lo:k_stop - lo]
+
+        log.debug("🧶 %s over %d threads", getattr(kernel, "__name__", kernel), self.workers)
+        return outputs[0] if single else outputs
+
+    def laplacian(self, store: Any, dx: float, dy: float, dz: float) -> tuple:
+        return self.run(laplacian_velocity_grid, store, dx, dy, dz)
+
+    def advection(self, store: Any, dx: float, dy: float, dz: float, scheme: str = "central") -> tuple:
+        return self.run(advection_grid, store, dx, dy, dz, scheme=scheme)
+
+    def divergence(self, store: Any, dx: float, dy: float, dz: float) -> np.ndarray:
+        return self.run(divergence_grid, store, dx, dy, dz)
+
+    def mac_divergence(self, store: Any, dx: float, dy: float, dz: float,
+                       active: np.ndarray | None = None) -> np.ndarray:
+        """Staggered ∇·v of the projection (mac_divergence_grid), closed faces at inactive cells."""
+        return self.run(mac_divergence_grid, store, dx, dy, dz, active=active, windowed=("active",))
+
+    def pressure_gradient(self, store: Any, dx: float, dy: float, dz: float) -> tuple:
+        return self.run(_pressure_gradient_kernel, store, dx, dy, dz)
+
+    def predict(self, store: Any, params: SolverParameters) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Fused predictor (vx*, vy*, vz*); drop-in for SlabPredictor.predict."""
+        return self.run(update_velocity_grid, store, params)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "BlockExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
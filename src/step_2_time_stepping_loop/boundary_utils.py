@@ -1,7 +1,14 @@
 # src/step_2_time_stepping_loop/boundary_utils.py
 # 🧱 Step 2: Boundary Utilities — Enforce Boundary Conditions
 
-debug = False  # toggle to True for verbose GitHub Action logs
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.run_length_mask import RunLengthMask, sparse_mask
+
+log = get_logger(__name__)
 
 
 class BoundaryConditionError(Exception):
@@ -48,28 +55,13 @@ def enforce_boundary(state: dict, cell: dict, config: dict) -> dict:
     role = cell.get("boundary_role")
     if role is None:
         # No boundary → return unchanged
-        if debug:
-            print(f"Cell {cell['flat_index']} has no boundary role → state unchanged.")
+        log.debug("Cell %s has no boundary role → state unchanged.", cell.get("flat_index"))
         return state
 
-    # --- Validate boundary_conditions list ---
-    bc_list = config.get("boundary_conditions")
-    if not bc_list:
-        raise BoundaryConditionError("Configuration validation failed: 'boundary_conditions' list is missing or empty.")
-
-    # Find matching boundary condition by role
-    bc_match = next((bc for bc in bc_list if bc.get("role") == role), None)
-    if not bc_match:
-        raise BoundaryConditionError(f"No boundary condition found for role '{role}'.")
-
-    if debug:
-        print(f"Cell {cell['flat_index']} ({cell['grid_index']}) → applying boundary role '{role}'")
+    # --- Find and validate the matching boundary condition by role ---
+    bc_match = _condition_for_role(config, role)
 
-    # --- Validate boundary condition fields ---
-    if "apply_to" not in bc_match:
-        raise BoundaryConditionError(f"Boundary condition for role '{role}' is missing 'apply_to' field.")
-    if not isinstance(bc_match["apply_to"], list):
-        raise BoundaryConditionError(f"Boundary condition for role '{role}' has invalid 'apply_to' type (must be list).")
+    log.debug("Cell %s (%s) → applying boundary role '%s'", cell.get("flat_index"), cell.get("grid_index"), role)
 
     # --- Apply overrides ---
     new_state = {
@@ -81,28 +73,138 @@ def enforce_boundary(state: dict, cell: dict, config: dict) -> dict:
         },
     }
 
+    vel, pres = _overrides_for_role(bc_match, role)
+
+    if vel is not None:
+        new_state["velocity"]["vx"], new_state["velocity"]["vy"], new_state["velocity"]["vz"] = vel
+        log.debug("Cell %s → velocity overridden to %s", cell.get("flat_index"), vel)
+
+    if pres is not None:
+        new_state["pressure"] = pres
+        log.debug("Cell %s → pressure overridden to %s", cell.get("flat_index"), pres)
+
+    log.debug("✅ Final enforced state for cell %s: %s", cell.get("flat_index"), new_state)
+
+    return new_state
+
+
+# ---------------- Whole-grid helpers ----------------
+
+def _condition_for_role(config: dict, role: str) -> Dict[str, Any]:
+    """Return the validated boundary condition for a role (same checks as enforce_boundary)."""
+    bc_list = config.get("boundary_conditions")
+    if not bc_list:
+        raise BoundaryConditionError("Configuration validation failed: 'boundary_conditions' list is missing or empty.")
+    bc_match = next((bc for bc in bc_list if bc.get("role") == role), None)
+    if not bc_match:
+        raise BoundaryConditionError(f"No boundary condition found for role '{role}'.")
+    if "apply_to" not in bc_match:
+        raise BoundaryConditionError(f"Boundary condition for role '{role}' is missing 'apply_to' field.")
+    if not isinstance(bc_match["apply_to"], list):
+        raise BoundaryConditionError(f"Boundary condition for role '{role}' has invalid 'apply_to' type (must be list).")
+    return bc_match
+
+
+def _overrides_for_role(bc_match: Dict[str, Any], role: str) -> Tuple[Any, Any]:
+    """
+    Return the (velocity, pressure) overrides a boundary condition applies;
+    None for a quantity not listed in apply_to.
+    """
+    vel = pres = None
     if "velocity" in bc_match["apply_to"]:
         vel = bc_match.get("velocity")
         if vel is None:
             raise BoundaryConditionError(f"Boundary condition for role '{role}' requires 'velocity' but it is missing.")
         if len(vel) != 3:
             raise BoundaryConditionError(f"Boundary condition for role '{role}' has invalid 'velocity' length (expected 3).")
-        new_state["velocity"]["vx"], new_state["velocity"]["vy"], new_state["velocity"]["vz"] = vel
-        if debug:
-            print(f"Cell {cell['flat_index']} → velocity overridden to {vel}")
-
     if "pressure" in bc_match["apply_to"]:
         pres = bc_match.get("pressure")
         if pres is None:
             raise BoundaryConditionError(f"Boundary condition for role '{role}' requires 'pressure' but it is missing.")
-        new_state["pressure"] = pres
-        if debug:
-            print(f"Cell {cell['flat_index']} → pressure overridden to {pres}")
+    return vel, pres
 
-    if debug:
-        print(f"✅ Final enforced state for cell {cell['flat_index']}: {new_state}")
 
-    return new_state
+def _role_mask(store: Any, roles: RunLengthMask | None) -> RunLengthMask:
+    """roles if given (checked against the store), else the store's cached boundary_role mask."""
+    if roles is None:
+        return sparse_mask(store, "boundary_role")
+    if roles.shape != tuple(store.shape):
+        raise ValueError(f"Boundary role mask of shape {roles.shape} does not match the grid {store.shape}.")
+    return roles
 
 
+def pressure_dirichlet_grid(store: Any, config: dict,
+                            roles: RunLengthMask | None = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Locate cells whose boundary role fixes pressure.
 
+    Parameters
+    ----------
+    store : FieldStore
+        Provides boundary_role codes and role names.
+    config : dict
+        Full simulation config, must include "boundary_conditions".
+    roles : RunLengthMask, optional
+        boundary_role mask built once per run (see enforce_boundary_grid);
+        defaults to sparse_mask(store, "boundary_role").
+
+    Returns
+    -------
+    (mask, values) : tuple of np.ndarray
+        Boolean (nx, ny, nz) mask of pressure-Dirichlet cells and the imposed
+        pressure (0.0 elsewhere).
+
+    Raises
+    ------
+    BoundaryConditionError
+        Same conditions as enforce_boundary for the roles present in the grid.
+    ValueError
+        If roles does not match the grid shape.
+    """
+    mask = np.zeros(store.shape, dtype=bool)
+    values = np.zeros(store.shape, dtype=np.float64)
+    roles = _role_mask(store, roles)
+    for code in roles.codes_present():
+        role = store.roles[code]
+        bc_match = _condition_for_role(config, role)
+        # a "neumann" role keeps the zero-gradient treatment of the Poisson operator
+        if "pressure" not in bc_match["apply_to"] or bc_match.get("type") == "neumann":
+            continue
+        _, pres = _overrides_for_role(bc_match, role)
+        cells = roles.where(code)
+        mask[cells] = True
+        values[cells] = pres
+        log.debug("Role '%s' → pressure Dirichlet p=%s on %d cells", role, pres, len(cells[0]))
+    return mask, values
+
+
+def enforce_boundary_grid(store: Any, config: dict, roles: RunLengthMask | None = None) -> None:
+    """
+    Apply enforce_boundary to every cell of a FieldStore in place: cells with a
+    boundary role get the role's velocity and/or pressure overrides. Only the
+    role cells are visited (via the sparse boundary_role mask).
+
+    The geometry is fixed for a run while the driver loads a new FieldStore
+    every step, so pass the run's mask as roles (PressureProjection.roles)
+    instead of rescanning store.boundary_role; without it the store's cached
+    sparse_mask is used.
+
+    Raises
+    ------
+    BoundaryConditionError
+        Same conditions as enforce_boundary for the roles present in the grid.
+    ValueError
+        If roles does not match the grid shape.
+    """
+    roles = _role_mask(store, roles)
+    for code in roles.codes_present():
+        role = store.roles[code]
+        bc_match = _condition_for_role(config, role)
+        vel, pres = _overrides_for_role(bc_match, role)
+        cells = roles.where(code)
+        if vel is not None:
+            store.vx[cells], store.vy[cells], store.vz[cells] = vel
+        if pres is not None:
+            store.pressure[cells] = pres
+
+        log.debug("Role '%s' → overrides %s on %d cells", role, bc_match["apply_to"], len(cells[0]))
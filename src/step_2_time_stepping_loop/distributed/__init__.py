@@ -0,0 +1,17 @@
+# src/step_2_time_stepping_loop/distributed/__init__.py
+# 📦 Public API for multi-rank runs: Cartesian blocks, transports, halo exchange
+
+from .decomposition import CartesianDecomposition, choose_dims
+from .transport import MpiTransport, PipeTransport, Transport, default_transport, run_local
+from .runner import DistributedDomain
+
+__all__ = [
+    "CartesianDecomposition",
+    "choose_dims",
+    "Transport",
+    "PipeTransport",
+    "MpiTransport",
+    "default_transport",
+    "run_local",
+    "DistributedDomain",
+]
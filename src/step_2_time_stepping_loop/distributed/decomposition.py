@@ -0,0 +1,112 @@
+# src/step_2_time_stepping_loop/distributed/decomposition.py
+# 🧱 Cartesian Decomposition — (nx, ny, nz) split into a 3D grid of rank blocks
+#
+# Ranks are laid out x-major over the process grid dims = (px, py, pz):
+#   rank = cx + px * (cy + py * cz)
+# the same formula indexing_utils uses for cells. Each axis is cut into
+# contiguous blocks with slab_bounds, so block sizes differ by at most one.
+# Global ↔ local cell indices go through indexing_utils.global_to_local /
+# local_to_global with the block offset.
+
+import math
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.indexing_utils import flat_to_grid, grid_to_flat
+from src.step_2_time_stepping_loop.parallel_predictor import HALO_WIDTH, slab_bounds
+
+log = get_logger(__name__)
+
+
+def _divisors(n: int) -> List[int]:
+    small = [d for d in range(1, math.isqrt(n) + 1) if n % d == 0]
+    return small + [n // d for d in reversed(small) if d * d != n]
+
+
+def _factorizations(n_ranks: int) -> Iterator[Tuple[int, int, int]]:
+    """Every (px, py, pz) with px * py * pz == n_ranks, px and then py ascending."""
+    for px in _divisors(n_ranks):
+        for py in _divisors(n_ranks // px):
+            yield px, py, n_ranks // (px * py)
+
+
+def choose_dims(n_ranks: int, shape: Tuple[int, int, int], min_extent: int = HALO_WIDTH) -> Tuple[int, int, int]:
+    """
+    Process grid for n_ranks that minimizes the halo traffic.
+
+    Every split axis keeps at least min_extent cells per block, so a halo of
+    that width comes from the adjacent rank only.
+
+    Raises:
+        ValueError: if no factorization of n_ranks satisfies min_extent.
+    """
+    n_cells = shape[0] * shape[1] * shape[2]
+    best, best_cost = None, None
+    for dims in _factorizations(n_ranks):
+        if any(p > 1 and n // p < min_extent for n, p in zip(shape, dims)):
+            continue
+        # cells crossing internal cuts: (p - 1) cut planes of area N / n per axis
+        cost = sum((p - 1) * n_cells // n for n, p in zip(shape, dims))
+        if best_cost is None or cost < best_cost:
+            best, best_cost = dims, cost
+    if best is None:
+        raise ValueError(f"Cannot split {shape} over {n_ranks} ranks with blocks of at least {min_extent} cells.")
+    return best
+
+
+class CartesianDecomposition:
+    """
+    Block layout of a (nx, ny, nz) grid over a (px, py, pz) process grid.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Global grid resolution.
+    n_ranks : int
+        Number of ranks (ignored when dims is given).
+    dims : tuple of int, optional
+        Explicit process grid; chosen with choose_dims otherwise.
+    min_extent : int
+        Smallest block size allowed along a split axis (the halo width).
+    """
+
+    def __init__(self, shape: Tuple[int, int, int], n_ranks: int = 1,
+                 dims: Tuple[int, int, int] | None = None, min_extent: int = HALO_WIDTH):
+        self.shape = tuple(int(n) for n in shape)
+        self.dims = tuple(dims) if dims is not None else choose_dims(n_ranks, self.shape, min_extent)
+        self.n_ranks = int(np.prod(self.dims))
+        for n, p in zip(self.shape, self.dims):
+            if p > 1 and n // p < min_extent:
+                raise ValueError(f"Blocks of {n} cells over {p} ranks are thinner than {min_extent} cells.")
+        self._cuts = [slab_bounds(n, p) for n, p in zip(self.shape, self.dims)]
+        log.debug("🧱 Decomposition %s → dims %s", self.shape, self.dims)
+
+    def coords(self, rank: int) -> List[int]:
+        return flat_to_grid(rank, self.dims)
+
+    def rank_of(self, coords: Tuple[int, int, int]) -> int:
+        return grid_to_flat(*coords, self.dims)
+
+    def bounds(self, rank: int) -> List[Tuple[int, int]]:
+        """[(x0, x1), (y0, y1), (z0, z1)] of the block owned by rank."""
+        return [self._cuts[axis][c] for axis, c in enumerate(self.coords(rank))]
+
+    def offset(self, rank: int) -> Tuple[int, int, int]:
+        return tuple(lo for lo, _ in self.bounds(rank))
+
+    def local_shape(self, rank: int) -> Tuple[int, int, int]:
+        return tuple(hi - lo for lo, hi in self.bounds(rank))
+
+    def neighbor(self, rank: int, axis: int, step: int) -> int | None:
+        """Rank step blocks away along axis, or None past the domain edge."""
+        coords = self.coords(rank)
+        coords[axis] += step
+        if not 0 <= coords[axis] < self.dims[axis]:
+            return None
+        return self.rank_of(coords)
+
+    def block_slices(self, rank: int) -> Tuple[slice, slice, slice]:
+        """Slices selecting rank's block from a global (nx, ny, nz) array."""
+        return tuple(slice(lo, hi) for lo, hi in self.bounds(rank))
@@ -0,0 +1,441 @@
+# src/step_2_time_stepping_loop/distributed/runner.py
+# 🛰️ Distributed Runner — one Cartesian block per rank, halos over a Transport
+#
+# Each rank stores its block padded with `width` ghost planes on every side.
+# exchange_halos fills the ghosts axis by axis (x, then y, then z), sending
+# the full padded extent of the other axes, so edge and corner ghosts arrive
+# through two or three hops. Pairs are scheduled by coordinate parity (even
+# blocks swap with the block above, then odd ones do), which keeps every
+# blocking Pipe exchange matched. Ghosts past the domain edge repeat the edge
+# plane: the clamped-neighbor (Neumann) fallback of the serial operators.
+#
+# With HALO_WIDTH ghosts the fused grid predictor on a padded block gives the
+# serial values on the block interior. advance() runs a whole projection step
+# on the block: predictor, boundary overrides, a matrix-free CG for the same
+# −∇²φ = b that PoissonSystem assembles (faces touching a solid or the domain
+# edge closed, pressure-Dirichlet roles moved to the right-hand side, floating
+# regions solved with zero mean) and the velocity correction with the
+# staggered G/D pair. Each matvec costs one width-1 exchange; dot products,
+# residual norms and per-region means are allreduced.
+#
+# No rank needs the global grid. scatter() cuts the input on rank 0 and sends
+# each rank its block, or (root=None) lets every rank slice its own block
+# from a source it can read piecewise, such as memory-mapped sidecar arrays.
+# assemble() works on the padded block: regions of unknowns are labelled per
+# block and joined across block faces on rank 0, which only handles one
+# entry per local region. gather() collects blocks on rank 0 alone.
+
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from scipy import ndimage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.field_store import FIELD_NAMES, GEOMETRY_NAMES, SOLID, FieldStore
+from src.step_2_time_stepping_loop.boundary_utils import enforce_boundary_grid, pressure_dirichlet_grid
+from src.step_2_time_stepping_loop.distributed.decomposition import CartesianDecomposition
+from src.step_2_time_stepping_loop.distributed.transport import Transport
+from src.step_2_time_stepping_loop.instrumentation import count, span
+from src.step_2_time_stepping_loop.mac_gradients import mac_divergence_grid, open_faces, pressure_gradient_grid
+from src.step_2_time_stepping_loop.mac_update_velocity import update_velocity_grid
+from src.step_2_time_stepping_loop.parallel_predictor import HALO_WIDTH
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+from src.step_2_time_stepping_loop.pressure_solver import coupled_cells
+
+log = get_logger(__name__)
+
+
+def _plane(axis: int, start: int, stop: int) -> Tuple[slice, slice, slice]:
+    index = [slice(None)] * 3
+    index[axis] = slice(start, stop)
+    return tuple(index)
+
+
+class DistributedDomain:
+    """
+    This rank's share of a decomposed grid.
+
+    Parameters
+    ----------
+    transport : Transport
+        Messaging layer (PipeTransport, MpiTransport, or a single-rank Transport).
+    shape : tuple of int
+        Global grid resolution.
+    dims : tuple of int, optional
+        Process grid; chosen from transport.size otherwise.
+    width : int
+        Ghost planes kept around the block (HALO_WIDTH for the predictor).
+    """
+
+    def __init__(self, transport: Transport, shape: Tuple[int, int, int],
+                 dims: Tuple[int, int, int] | None = None, width: int = HALO_WIDTH):
+        self.transport = transport
+        self.decomposition = CartesianDecomposition(shape, transport.size, dims, min_extent=width)
+        if self.decomposition.n_ranks != transport.size:
+            raise ValueError(f"Process grid {self.decomposition.dims} needs {self.decomposition.n_ranks} ranks, "
+                             f"transport has {transport.size}.")
+        self.rank = transport.rank
+        self.width = width
+        self.offset = self.decomposition.offset(self.rank)
+        self.local_shape = self.decomposition.local_shape(self.rank)
+        self.unknown = None  # pressure operator, set by assemble()
+
+    # ---------------- Layout ----------------
+
+    def interior(self, padded: np.ndarray, width: int | None = None) -> np.ndarray:
+        """View of the owned cells of a padded block array."""
+        w = self.width if width is None else width
+        return padded[w:padded.shape[0] - w, w:padded.shape[1] - w, w:padded.shape[2] - w]
+
+    def inside(self, width: int | None = None) -> np.ndarray:
+        """Bool mask of a padded block marking the cells inside the global domain."""
+        w = self.width if width is None else width
+        axes = []
+        for n, lo, size in zip(self.decomposition.shape, self.offset, self.local_shape):
+            index = np.arange(lo - w, lo + size + w)
+            axes.append((index >= 0) & (index < n))
+        return axes[0][:, None, None] & axes[1][None, :, None] & axes[2][None, None, :]
+
+    def scatter(self, store: Any, root: int | None = 0) -> FieldStore:
+        """
+        This rank's padded FieldStore, halos exchanged.
+
+        With root set, only that rank reads store (a FieldStore of the whole
+        grid) and sends every other rank its block; the others may pass None.
+        With root=None every rank cuts its own block from its own store, which
+        may be any object with FieldStore's attributes whose arrays slice
+        without loading the whole grid (np.load(..., mmap_mode="r")).
+        """
+        names = FIELD_NAMES + GEOMETRY_NAMES
+        if root is None:
+            block = self.decomposition.block_slices(self.rank)
+            meta, values = (store.timestep, store.roles), [getattr(store, name)[block] for name in names]
+        elif self.rank == root:
+            for dest in range(self.transport.size):
+                block = self.decomposition.block_slices(dest)
+                message = ((store.timestep, store.roles),
+                           [np.ascontiguousarray(getattr(store, name)[block]) for name in names])
+                if dest == root:
+                    meta, values = message
+                else:
+                    self.transport.send(dest, message)
+        else:
+            meta, values = self.transport.recv(root)
+
+        local = FieldStore(tuple(n + 2 * self.width for n in self.local_shape), timestep=meta[0], roles=meta[1])
+        for name, value in zip(names, values):
+            self.interior(getattr(local, name))[...] = value
+            self.exchange_halos(getattr(local, name))
+        return local
+
+    def gather(self, block: np.ndarray, root: int = 0) -> np.ndarray | None:
+        """The global array assembled from every rank's block on root (None elsewhere)."""
+        blocks = self.transport.gather(np.ascontiguousarray(block), root)
+        if blocks is None:
+            return None
+        full = np.empty(self.decomposition.shape, dtype=blocks[0].dtype)
+        for rank, values in enumerate(blocks):
+            full[self.decomposition.block_slices(rank)] = values
+        return full
+
+    def block_store(self, local: FieldStore) -> FieldStore:
+        """This rank's owned cells of a padded FieldStore, as an unpadded copy."""
+        out = FieldStore(self.local_shape, timestep=local.timestep, roles=local.roles)
+        for name in FIELD_NAMES + GEOMETRY_NAMES:
+            getattr(out, name)[...] = self.interior(getattr(local, name))
+        return out
+
+    def gather_store(self, local: FieldStore, root: int = 0) -> FieldStore | None:
+        """Global FieldStore of every rank's block on root (None elsewhere)."""
+        out = FieldStore(self.decomposition.shape, timestep=local.timestep, roles=local.roles) \
+            if self.rank == root else None
+        for name in FIELD_NAMES + GEOMETRY_NAMES:
+            full = self.gather(self.interior(getattr(local, name)), root)
+            if out is not None:
+                getattr(out, name)[...] = full
+        return out
+
+    # ---------------- Halo exchange ----------------
+
+    def exchange_halos(self, padded: np.ndarray, width: int | None = None) -> np.ndarray:
+        """Fill the ghost planes of a padded block in place (returns it)."""
+        w = self.width if width is None else width
+        coords = self.decomposition.coords(self.rank)
+        for axis in range(3):
+            n = padded.shape[axis]
+            for phase in (0, 1):
+                step = 1 if coords[axis] % 2 == phase else -1
+                peer = self.decomposition.neighbor(self.rank, axis, step)
+                if peer is None:
+                    continue
+                if step == 1:
+                    send, ghost = _plane(axis, n - 2 * w, n - w), _plane(axis, n - w, n)
+                else:
+                    send, ghost = _plane(axis, w, 2 * w), _plane(axis, 0, w)
+                padded[ghost] = self.transport.sendrecv(peer, np.ascontiguousarray(padded[send]))
+            # domain edges: repeat the edge plane (Neumann fallback)
+            if self.decomposition.neighbor(self.rank, axis, -1) is None:
+                padded[_plane(axis, 0, w)] = padded[_plane(axis, w, w + 1)]
+            if self.decomposition.neighbor(self.rank, axis, 1) is None:
+                padded[_plane(axis, n - w, n)] = padded[_plane(axis, n - w - 1, n - w)]
+        return padded
+
+    def exchange_store(self, local: FieldStore) -> None:
+        for name in FIELD_NAMES:
+            self.exchange_halos(getattr(local, name))
+
+    # ---------------- Phase 1 ----------------
+
+    def predict(self, local: FieldStore, params: SolverParameters) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Predictor (vx*, vy*, vz*) on this rank's block, after a halo exchange."""
+        self.exchange_store(local)
+        return tuple(self.interior(v).copy() for v in update_velocity_grid(local, params))
+
+    # ---------------- Phase 2 ----------------
+
+    def assemble(self, local: FieldStore | None = None, config: Dict[str, Any] | None = None) -> None:
+        """
+        Build this rank's share of the pressure operator (once per geometry).
+
+        local is this rank's padded FieldStore from scatter(). Unknowns are the
+        active (non-solid), non-Dirichlet cells, as in PoissonSystem. Each
+        region of unknowns without a pressure-Dirichlet neighbour floats and
+        is solved with zero mean. Without a store every cell is fluid and
+        every domain edge zero-gradient.
+
+        Raises
+        ------
+        BoundaryConditionError
+            Same conditions as pressure_dirichlet_grid.
+        """
+        inside = self.inside()
+        if local is None:
+            active = inside
+            dirichlet = np.zeros(inside.shape, dtype=bool)
+            values = np.zeros(inside.shape, dtype=np.float64)
+        else:
+            active = (local.cell_type != SOLID) & inside
+            dirichlet, values = pressure_dirichlet_grid(local, config)
+            dirichlet &= active
+        # coupled_cells and the Dirichlet-neighbour test look one cell past the block, inside the halo
+        unknown = self.interior(active & ~dirichlet & coupled_cells(active))
+        touches = np.zeros(unknown.shape, dtype=bool)
+        w = self.width
+        for axis in range(3):
+            for step in (-1, 1):
+                index = [slice(w, n - w) for n in dirichlet.shape]
+                index[axis] = slice(w + step, dirichlet.shape[axis] - w + step)
+                touches |= dirichlet[tuple(index)]
+
+        self.region, self.floating, self.region_size = self._label_regions(unknown, touches & unknown)
+        self.active = active
+        self.dirichlet = self.interior(dirichlet)
+        self.dirichlet_pressure = self.interior(values)
+        self.unknown = unknown
+        # open faces of the width-1 padding the operator works on
+        self.faces = open_faces(self.interior(self.active, self.width - 1))
+        if self.rank == 0:
+            log.debug("🛰️ Distributed operator: %d unknowns, %d regions (%d floating)",
+                      int(self.region_size.sum()), self.floating.size - 1, int(self.floating.sum()))
+
+    def _label_regions(self, unknown: np.ndarray, anchors: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Label the regions of unknowns joined through faces, across blocks.
+
+        Each rank labels its block; rank 0 merges labels that meet across a
+        block face and sends back the merged numbering. Returns the block of
+        region labels (0 off the unknowns), and per region whether it floats
+        (no cell in anchors) and its size in cells.
+        """
+        labels, n_local = ndimage.label(unknown)
+        counts = np.zeros(self.transport.size, dtype=np.int64)
+        counts[self.rank] = n_local
+        counts = self.transport.allreduce(counts, "sum")
+        first = int(counts[:self.rank].sum())
+        labels[unknown] += first  # globally unique ids, first + 1 ... first + n_local
+
+        # pairs of ids that face each other across this block's faces
+        work = np.zeros(tuple(n + 2 for n in labels.shape), dtype=labels.dtype)
+        self.interior(work, 1)[...] = labels
+        self.exchange_halos(work, 1)
+        work[~self.inside(1)] = 0
+        pairs = []
+        for axis in range(3):
+            for side in (0, -1):
+                own = np.take(labels, side, axis=axis)
+                ghost = np.take(work, side, axis=axis)[1:-1, 1:-1]
+                joined = (own > 0) & (ghost > 0)
+                pairs.append(np.stack([own[joined], ghost[joined]], axis=1))
+        pairs = np.unique(np.concatenate(pairs), axis=0)
+
+        sizes = np.bincount(labels[unknown] - first, minlength=n_local + 1)[1:]
+        anchored = np.zeros(n_local + 1, dtype=bool)
+        anchored[labels[anchors] - first] = True
+        gathered = self.transport.gather((pairs, sizes, anchored[1:]), 0)
+
+        if self.rank == 0:
+            pairs = np.concatenate([entry[0] for entry in gathered])
+            n_ids = int(counts.sum()) + 1
+            graph = coo_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(n_ids, n_ids))
+            _, component = connected_components(graph, directed=False)
+            # id 0 (off the unknowns) is a component of its own: number it 0, the others from 1
+            merged = np.where(component == component[0], 0, component + (component < component[0]))
+            n_regions = int(merged.max()) + 1
+            region_size = np.bincount(merged[1:], weights=np.concatenate([entry[1] for entry in gathered]),
+                                      minlength=n_regions).astype(np.int64)
+            anchored = np.bincount(merged[1:], weights=np.concatenate([entry[2] for entry in gathered]),
+                                   minlength=n_regions) > 0
+            floating = ~anchored
+            floating[0] = False  # region 0: solid and Dirichlet cells
+            region_size[0] = 0
+            merged_info = (merged, floating, region_size)
+        else:
+            merged_info = None
+        merged, floating, region_size = self.transport.broadcast(merged_info, 0)
+        return merged[labels], floating, region_size
+
+    def _neg_laplacian(self, work: np.ndarray, x: np.ndarray, spacings: Tuple[float, float, float]) -> np.ndarray:
+        """−∇²x on the unknowns of the block (x is the interior, work a width-1 padded buffer)."""
+        self.interior(work, 1)[...] = x
+        self.exchange_halos(work, 1)
+        out = np.zeros_like(work)
+        for axis, (h, face) in enumerate(zip(spacings, self.faces)):
+            n = work.shape[axis]
+            lower, upper = _plane(axis, 0, n - 1), _plane(axis, 1, n)
+            flux = np.where(face[lower], work[upper] - work[lower], 0.0) / (h * h)
+            out[lower] -= flux
+            out[upper] += flux
+        return np.where(self.unknown, self.interior(out, 1), 0.0)
+
+    def _dot(self, a: np.ndarray, b: np.ndarray) -> float:
+        return float(self.transport.allreduce(float(np.vdot(a, b)), "sum"))
+
+    def _remove_floating_mean(self, x: np.ndarray) -> np.ndarray:
+        """x minus its mean over each floating region (anchored unknowns unchanged)."""
+        sums = np.bincount(self.region.ravel(), weights=x.ravel(), minlength=self.floating.size)
+        sums = self.transport.allreduce(sums, "sum")
+        mean = np.where(self.floating, sums / np.maximum(self.region_size, 1), 0.0)
+        return x - np.where(self.unknown, mean[self.region], 0.0)
+
+    def solve_poisson(self, rhs: np.ndarray, spacings: Tuple[float, float, float],
+                      dirichlet_values: np.ndarray | None = None, tolerance: float = 1e-6,
+                      max_iterations: int | None = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Distributed CG for −∇²φ = rhs on the operator built by assemble().
+
+        rhs and dirichlet_values (φ on this rank's Dirichlet cells) are
+        blocks. Floating regions are solved with zero mean, as in the serial
+        solvers; assemble() runs with the all-fluid, zero-gradient box if it
+        has not been called. max_iterations defaults to 10 × the unknowns,
+        as scipy's cg does. Returns the block of φ (0 on solid cells) and an
+        info dict (method, iterations, relative residual ‖b − Aφ‖/‖b‖,
+        converged).
+        """
+        if self.unknown is None:
+            self.assemble()
+        singular = bool(self.floating.any())
+        work = np.zeros(tuple(n + 2 for n in rhs.shape))
+        g = np.zeros(rhs.shape)
+        if dirichlet_values is not None:
+            g[self.dirichlet] = dirichlet_values[self.dirichlet]
+        # known Dirichlet values move to the right-hand side
+        b = np.where(self.unknown, rhs, 0.0) - self._neg_laplacian(work, g, spacings)
+        if singular:
+            b = self._remove_floating_mean(b)
+
+        x = np.zeros_like(b)
+        r = b.copy()
+        p = r.copy()
+        rr = self._dot(r, r)
+        b_norm = np.sqrt(rr)
+        info = {"method": "cg", "iterations": 0, "residual": 0.0, "converged": True}
+        if b_norm == 0.0:
+            return g, info
+
+        converged = False
+        for iteration in range(1, (max_iterations or 10 * int(self.region_size[1:].sum())) + 1):
+            ap = self._neg_laplacian(work, p, spacings)
+            alpha = rr / self._dot(p, ap)
+            x += alpha * p
+            r -= alpha * ap
+            rr_new = self._dot(r, r)
+            info["iterations"] = iteration
+            if np.sqrt(rr_new) <= tolerance * b_norm:
+                converged = True
+                break
+            p *= rr_new / rr
+            p += r
+            rr = rr_new
+
+        if singular:
+            x = self._remove_floating_mean(x)
+        residual = b - self._neg_laplacian(work, x, spacings)
+        info["residual"] = float(np.sqrt(self._dot(residual, residual))) / b_norm
+        info["converged"] = converged
+        if self.rank == 0:
+            if not converged:
+                log.warning("⚠️ Distributed pressure solve did not converge: %d iterations, relative residual "
+                            "%.3e (tolerance %.1e)", info["iterations"], info["residual"], tolerance)
+            log.debug("🛰️ Distributed CG: %s", info)
+        return x + g, info
+
+    # ---------------- Timestep ----------------
+
+    def advance(self, local: FieldStore, config: Dict[str, Any], params: SolverParameters,
+                tolerance: float = 1e-6, max_iterations: int | None = None) -> Dict[str, Any]:
+        """
+        One projection timestep on this rank's padded block, in place.
+
+        The phases of timestep_driver on the block: predictor v*, boundary
+        overrides, pressure increment φ, then p += φ, v = v* − (Δt/ρ)∇φ and
+        the overrides again. Call assemble(store, config) once per run first.
+
+        Returns the step diagnostics: "pressure_solver" (method, iterations,
+        residual, converged) plus "divergence_l2" and "divergence_linf" of
+        v^{n+1} over the whole domain, on every rank.
+
+        Raises
+        ------
+        ValueError
+            If assemble() has not been called.
+        """
+        if self.unknown is None:
+            raise ValueError("DistributedDomain.assemble(store, config) must run before advance().")
+        spacings = (params.dx, params.dy, params.dz)
+
+        with span("predictor"):
+            for name, values in zip(("vx", "vy", "vz"), self.predict(local, params)):
+                self.interior(getattr(local, name))[...] = values
+            with span("boundary"):
+                enforce_boundary_grid(local, config)
+            self.exchange_store(local)
+
+        with span("poisson_solve"):
+            # ∇²φ = (ρ/Δt) ∇·v*  →  −∇²φ = −(ρ/Δt) ∇·v*
+            div = self.interior(mac_divergence_grid(local, *spacings, active=self.active))
+            increment = np.where(self.dirichlet, self.dirichlet_pressure - self.interior(local.pressure), 0.0)
+            phi, info = self.solve_poisson(div * (-params.rho / params.dt), spacings, increment,
+                                           tolerance=tolerance, max_iterations=max_iterations)
+        count("poisson_iterations", info["iterations"])
+
+        with span("correction"):
+            padded = np.zeros(local.shape)
+            self.interior(padded)[...] = phi
+            self.exchange_halos(padded)
+            local.pressure += padded
+            scale = params.dt / params.rho
+            for name, grad in zip(("vx", "vy", "vz"), pressure_gradient_grid(padded, *spacings, active=self.active)):
+                grad *= scale
+                getattr(local, name)[...] -= grad
+            enforce_boundary_grid(local, config)
+            self.exchange_store(local)
+            div = self.interior(mac_divergence_grid(local, *spacings, active=self.active))
+
+        n_total = float(np.prod(self.decomposition.shape))
+        return {
+            "divergence_l2": float(np.sqrt(self.transport.allreduce(float(np.sum(div * div)), "sum") / n_total)),
+            "divergence_linf": float(self.transport.allreduce(float(np.abs(div).max()), "max")),
+            "pressure_solver": info,
+        }
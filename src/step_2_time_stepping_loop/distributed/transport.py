@@ -0,0 +1,226 @@
+# src/step_2_time_stepping_loop/distributed/transport.py
+# 📡 Transport — point-to-point messages and reductions between ranks
+#
+# Two interchangeable implementations:
+#   MpiTransport  — mpi4py COMM_WORLD (multi-node runs under mpirun)
+#   PipeTransport — full mesh of multiprocessing Pipes between local processes,
+#                   the stand-in used when mpi4py is missing and in the tests
+# run_local(target, size) starts size processes wired with PipeTransport and
+# returns target's results ordered by rank; a rank that dies without reporting
+# fails the run instead of leaving the parent blocked on the result queue.
+#
+# Pipe sends block once the OS buffer is full, so paired exchanges go through
+# sendrecv (the lower rank sends first) and reductions go through rank 0.
+# gather and broadcast move whole blocks between one root and the others
+# (scattering the input, collecting the result) without an allreduce.
+
+import multiprocessing
+import queue
+import time
+import traceback
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from src.solver_logging import get_logger
+
+try:
+    from mpi4py import MPI
+    HAVE_MPI = True
+except ImportError:
+    HAVE_MPI = False
+
+log = get_logger(__name__)
+
+REDUCE_OPS = ("sum", "max", "min")
+POLL_INTERVAL = 0.5  # seconds between liveness checks in run_local
+
+
+def _reduce(op: str, a: Any, b: Any) -> Any:
+    if op == "sum":
+        return a + b
+    if op == "max":
+        return np.maximum(a, b)
+    return np.minimum(a, b)
+
+
+class Transport:
+    """Messaging between size ranks; subclasses provide send and recv."""
+
+    rank: int = 0
+    size: int = 1
+
+    def send(self, dest: int, obj: Any) -> None:
+        raise NotImplementedError
+
+    def recv(self, source: int) -> Any:
+        raise NotImplementedError
+
+    def sendrecv(self, peer: int, obj: Any) -> Any:
+        """Send obj to peer and return what peer sent back."""
+        if self.rank < peer:
+            self.send(peer, obj)
+            return self.recv(peer)
+        received = self.recv(peer)
+        self.send(peer, obj)
+        return received
+
+    def allreduce(self, value: Any, op: str = "sum") -> Any:
+        """Combine value (scalar or array) over all ranks; every rank gets the result."""
+        if op not in REDUCE_OPS:
+            raise ValueError(f"Unknown reduction '{op}'. Expected one of {REDUCE_OPS}.")
+        if self.size == 1:
+            return value
+        if self.rank != 0:
+            self.send(0, value)
+            return self.recv(0)
+        total = value
+        for source in range(1, self.size):
+            total = _reduce(op, total, self.recv(source))
+        for dest in range(1, self.size):
+            self.send(dest, total)
+        return total
+
+    def gather(self, value: Any, root: int = 0) -> List[Any] | None:
+        """Every rank's value, ordered by rank, on root (None on the other ranks)."""
+        if self.rank != root:
+            self.send(root, value)
+            return None
+        return [value if source == root else self.recv(source) for source in range(self.size)]
+
+    def broadcast(self, value: Any, root: int = 0) -> Any:
+        """root's value on every rank (the argument is ignored elsewhere)."""
+        if self.rank != root:
+            return self.recv(root)
+        for dest in range(self.size):
+            if dest != root:
+                self.send(dest, value)
+        return value
+
+
+class PipeTransport(Transport):
+    """Transport over a full mesh of multiprocessing Pipes (one host)."""
+
+    def __init__(self, rank: int, size: int, connections: Dict[int, Any]):
+        self.rank = rank
+        self.size = size
+        self._connections = connections
+
+    @classmethod
+    def mesh(cls, size: int) -> List["PipeTransport"]:
+        """One transport per rank, every pair of ranks joined by a Pipe."""
+        connections: List[Dict[int, Any]] = [{} for _ in range(size)]
+        for a in range(size):
+            for b in range(a + 1, size):
+                connections[a][b], connections[b][a] = multiprocessing.Pipe()
+        return [cls(rank, size, connections[rank]) for rank in range(size)]
+
+    def send(self, dest: int, obj: Any) -> None:
+        self._connections[dest].send(obj)
+
+    def recv(self, source: int) -> Any:
+        return self._connections[source].recv()
+
+
+class MpiTransport(Transport):
+    """Transport over an mpi4py communicator (COMM_WORLD by default)."""
+
+    def __init__(self, comm: Any = None):
+        if not HAVE_MPI:
+            raise ImportError("mpi4py is required for MpiTransport.")
+        self._comm = comm if comm is not None else MPI.COMM_WORLD
+        self.rank = self._comm.Get_rank()
+        self.size = self._comm.Get_size()
+
+    def send(self, dest: int, obj: Any) -> None:
+        self._comm.send(obj, dest=dest)
+
+    def recv(self, source: int) -> Any:
+        return self._comm.recv(source=source)
+
+    def sendrecv(self, peer: int, obj: Any) -> Any:
+        return self._comm.sendrecv(obj, dest=peer, source=peer)
+
+    def allreduce(self, value: Any, op: str = "sum") -> Any:
+        if op not in REDUCE_OPS:
+            raise ValueError(f"Unknown reduction '{op}'. Expected one of {REDUCE_OPS}.")
+        return self._comm.allreduce(value, op={"sum": MPI.SUM, "max": MPI.MAX, "min": MPI.MIN}[op])
+
+    def gather(self, value: Any, root: int = 0) -> List[Any] | None:
+        return self._comm.gather(value, root=root)
+
+    def broadcast(self, value: Any, root: int = 0) -> Any:
+        return self._comm.bcast(value, root=root)
+
+
+def default_transport() -> Transport:
+    """MpiTransport when mpi4py is importable, otherwise a single-rank Transport."""
+    return MpiTransport() if HAVE_MPI else Transport()
+
+
+def _rank_main(target: Callable[..., Any], transport: Transport, results: Any, args: tuple) -> None:
+    try:
+        results.put((transport.rank, True, target(transport, *args)))
+    except Exception:
+        results.put((transport.rank, False, traceback.format_exc()))
+
+
+def _collect(results: Any, collected: Dict[int, Any], failures: List[str], wait: float) -> None:
+    """Move everything already queued by the ranks into collected / failures."""
+    while True:
+        try:
+            rank, ok, payload = results.get(timeout=wait)
+        except queue.Empty:
+            return
+        if ok:
+            collected[rank] = payload
+        else:
+            failures.append(f"rank {rank}:\n{payload}")
+        wait = 0.0
+
+
+def run_local(target: Callable[..., Any], size: int, *args, timeout: float | None = None,
+              poll_interval: float = POLL_INTERVAL) -> List[Any]:
+    """
+    Run target(transport, *args) on size local processes over PipeTransport.
+
+    Returns the per-rank results ordered by rank. The parent polls the result
+    queue every poll_interval seconds and checks that the ranks still owing a
+    result are alive, so a rank killed without reporting (signal, OOM, hard
+    crash) ends the run instead of hanging it. timeout (seconds, None for no
+    limit) bounds the whole run.
+
+    Raises:
+        RuntimeError: if any rank raised (the message carries its traceback),
+            exited without a result (with its exit code), or the run timed out.
+    """
+    context = multiprocessing.get_context()
+    results = context.Queue()
+    processes = [context.Process(target=_rank_main, args=(target, transport, results, args))
+                 for transport in PipeTransport.mesh(size)]
+    for process in processes:
+        process.start()
+
+    collected: Dict[int, Any] = {}
+    failures: List[str] = []
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while len(collected) < size and not failures:
+        # ranks found dead before the drain below had flushed their result by then
+        dead = [rank for rank, process in enumerate(processes)
+                if rank not in collected and not process.is_alive()]
+        _collect(results, collected, failures, poll_interval)
+        failures += [f"rank {rank}: exited with code {processes[rank].exitcode} without a result"
+                     for rank in dead if rank not in collected]
+        if not failures and deadline is not None and time.monotonic() > deadline:
+            missing = [rank for rank in range(size) if rank not in collected]
+            failures.append(f"ranks {missing}: no result within {timeout} s")
+
+    for process in processes:
+        if failures:
+            process.terminate()
+        process.join()
+
+    if failures:
+        raise RuntimeError("Distributed run failed on " + "\n".join(failures))
+    log.debug("📡 run_local: %d ranks finished", size)
+    return [collected[rank] for rank in range(size)]
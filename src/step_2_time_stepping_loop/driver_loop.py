@@ -6,65 +6,283 @@
 #   2. Pressure Correction (p^{n+1})
 #   3. Velocity Correction (v^{n+1})
 #
-# Currently: Phase 1 implemented, Phases 2 & 3 are placeholders.
+# Phase 1 runs per cell on the dict (fused update_velocity) or on arrays
+# (predictor_backend); Phases 2 and 3 run on FieldStore arrays and commit
+# time_history[str(t+1)].
+#
+# Passing an instrumentation.Profiler times every phase (predictor, load_state,
+# boundary, poisson_assembly, poisson_solve, correction, history_commit) and
+# records the step's cells/second. load_state is reading time levels out of the
+# cell_dict into a FieldStore; history_commit is writing them back.
+#
+# distributed_driver runs the same three phases on a Cartesian block per rank
+# (distributed.DistributedDomain) over a FieldStore instead of the cell_dict.
+
+import logging
+import time
+from typing import Dict, Any, List, Tuple
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.field_store import FieldStore
+from src.step_1_solver_initialization.run_length_mask import RunLengthMask
+from src.step_2_time_stepping_loop.instrumentation import Profiler, activate, active_profiler, count, span
+from src.step_2_time_stepping_loop.mac_update_velocity import TERM_NAMES, update_velocity
+from src.step_2_time_stepping_loop.block_executor import BlockExecutor
+from src.step_2_time_stepping_loop.boundary_utils import enforce_boundary, enforce_boundary_grid
+from src.step_2_time_stepping_loop.distributed import DistributedDomain, Transport
+from src.step_2_time_stepping_loop.mac_correct_velocity import correct_velocity
+from src.step_2_time_stepping_loop.parallel_predictor import SlabPredictor
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters, build_solver_parameters
+from src.step_2_time_stepping_loop.predictor_backend import predict_velocity, select_predictor_backend
+from src.step_2_time_stepping_loop.pressure_solver import PressureProjection, load_pressure_solver_settings
+from src.step_2_time_stepping_loop.time_history import FieldRing, prune_time_history, set_current_step, tracking
+
+log = get_logger(__name__)
 
-from typing import Dict, Any
-from src.step_2_time_stepping_loop.mac_update_velocity import (
-    update_velocity_x,
-    update_velocity_y,
-    update_velocity_z,
-)
-from src.step_2_time_stepping_loop.boundary_utils import enforce_boundary
 
-debug = False
+def _grid_shape(config: Dict[str, Any]) -> tuple:
+    domain = config["domain_definition"]
+    return (domain["nx"], domain["ny"], domain["nz"])
 
 
-def timestep_driver(cell_dict: Dict[str, Any], config: Dict[str, Any], timestep: int) -> None:
+def _predict_phase(cell_dict: Dict[str, Any], config: Dict[str, Any], timestep: int,
+                   params: SolverParameters, backend: str, terms: bool,
+                   pool: Any, roles: RunLengthMask | None = None) -> Tuple[FieldStore, Dict[str, float] | None]:
     """
-    Orchestrate one full timestep of the solver.
-    Currently implements Phase 1 (velocity prediction).
-    Phases 2 and 3 are placeholders.
+    Phase 1: stage v* as time_history["{t+1}_predictor"]; returns (star, predictor terms).
+
+    roles is the run's boundary_role mask (PressureProjection.roles) once a
+    projection exists; the first step scans star's geometry instead.
+
+    Raises:
+        ValueError: if a pool is given with a backend other than "numpy".
     """
+    if pool is not None and backend != "numpy":
+        raise ValueError(f"A predictor pool runs the NumPy predictor; backend '{backend}' cannot use it "
+                         "(use 'numpy', or drop the pool: the numba kernel is already parallel over z).")
     next_timestep = timestep + 1
+    shape = _grid_shape(config)
+    predictor_terms = None
 
-    # ---------------- Phase 1: Velocity Prediction ----------------
-    for flat_idx_str, cell in cell_dict.items():
-        flat_idx = int(flat_idx_str)
+    if backend == "python":
+        if terms:
+            predictor_terms = dict.fromkeys(TERM_NAMES, 0.0)
+        # profiler looked up once per step; untimed runs open no span per cell
+        boundary_span = span("boundary") if active_profiler() is not None else None
+        trace = log.isEnabledFor(logging.DEBUG)  # checked once, not per cell
+        for flat_idx_str, cell in cell_dict.items():
+            flat_idx = int(flat_idx_str)
+
+            # fused: shared face velocities for all three components
+            result = update_velocity(cell_dict, flat_idx, config, timestep, params, terms=terms)
+            if terms:
+                result, cell_terms = result
+                for name, value in cell_terms.items():
+                    predictor_terms[name] = max(predictor_terms[name], value)
+            vx_star, vy_star, vz_star = result
+
+            prev_state = cell["time_history"].get(str(timestep))
+            if prev_state is None:
+                raise ValueError(f"No time_history for timestep {timestep} in cell {flat_idx}")
+
+            # Stage predictor velocities (not final!)
+            new_state = {
+                "pressure": prev_state["pressure"],  # pressure unchanged until Phase 2
+                "velocity": {"vx": vx_star, "vy": vy_star, "vz": vz_star},
+            }
+
+            # Enforce boundary overrides
+            if boundary_span is None:
+                new_state = enforce_boundary(new_state, cell, config)
+            else:
+                with boundary_span:
+                    new_state = enforce_boundary(new_state, cell, config)
+
+            # Store provisional state under a staging key
+            cell["time_history"][f"{next_timestep}_predictor"] = new_state
+
+            if trace and flat_idx < 5:
+                log.debug("[Phase 1] cell=%d, v*=%s", flat_idx, new_state["velocity"])
+
+        with span("load_state"):
+            star = FieldStore.from_cell_dict(cell_dict, shape=shape, timestep=f"{next_timestep}_predictor")
+        return star, predictor_terms
+
+    with span("load_state"):
+        current = FieldStore.from_cell_dict(cell_dict, shape=shape, timestep=timestep)
+    star = current.copy(timestep=f"{next_timestep}_predictor")
+    if pool is not None and not terms:
+        result = pool.predict(current, params)
+    else:
+        if pool is not None:
+            log.debug("[Phase 1] terms requested: pool bypassed, %s predictor runs serially", backend)
+        result = predict_velocity(current, params, backend, terms=terms)
+    if terms:
+        result, predictor_terms = result
+    star.vx[...], star.vy[...], star.vz[...] = result
+    with span("boundary"):
+        enforce_boundary_grid(star, config, roles)
+    with span("history_commit"):
+        star.write_time_level(cell_dict)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("[Phase 1] %s predictor: max|v*|=%s", backend, float(abs(star.vx).max()))
+    return star, predictor_terms
 
-        vx_star = update_velocity_x(cell_dict, flat_idx, config, timestep)
-        vy_star = update_velocity_y(cell_dict, flat_idx, config, timestep)
-        vz_star = update_velocity_z(cell_dict, flat_idx, config, timestep)
 
-        prev_state = cell["time_history"].get(str(timestep))
-        if prev_state is None:
-            raise ValueError(f"No time_history for timestep {timestep} in cell {flat_idx}")
+def timestep_driver(cell_dict: Dict[str, Any], config: Dict[str, Any], timestep: int,
+                    params: SolverParameters | None = None,
+                    projection: PressureProjection | None = None,
+                    ring: FieldRing | None = None,
+                    backend: str | None = None,
+                    terms: bool = False,
+                    pool: SlabPredictor | BlockExecutor | None = None,
+                    profiler: Profiler | None = None) -> Dict[str, Any]:
+    """
+    Orchestrate one full timestep of the solver: velocity prediction,
+    pressure Poisson solve and velocity correction. The corrected state is
+    committed as time_history[str(timestep + 1)].
+
+    params should be built once per run with build_solver_parameters(config)
+    and reused for every timestep; it is built here if omitted. The same holds
+    for projection (the assembled Poisson system and the boundary role mask
+    the overrides of every phase reuse).
+
+    With a ring (FieldRing over load_retention_policy(config)) the committed
+    level is pushed into it and cell time_history entries outside the
+    retention policy, including spent "_predictor" staging, are pruned.
+
+    backend selects the Phase 1 predictor ("python" per-cell dict operators,
+    "numpy" or "numba" arrays); see predictor_backend.select_predictor_backend.
+
+    A pool (SlabPredictor over the grid shape for processes, or a
+    BlockExecutor for threads, created once per run) runs the NumPy
+    predictor block-parallel, so it requires backend "numpy"; any other
+    backend raises ValueError (the numba kernel is parallel over z on its
+    own). It is bypassed when terms=True: the predictor terms come from a
+    serial predict_velocity call.
 
-        # Stage predictor velocities (not final!)
-        new_state = {
-            "pressure": prev_state["pressure"],  # pressure unchanged until Phase 2
-            "velocity": {"vx": vx_star, "vy": vy_star, "vz": vz_star},
-        }
+    With terms=True the diagnostics also carry "predictor_terms": the largest
+    per-cell magnitude of each predictor term (diffusion, advection, pressure,
+    force).
 
-        # Enforce boundary overrides
-        new_state = enforce_boundary(new_state, cell, config)
+    With a profiler (instrumentation.Profiler, shared by all steps of a run)
+    phases (and, on the array backends, operator families) are timed and the
+    step is recorded with its cells/second; write the report with
+    profiler.write_report(path).
 
-        # Store provisional state under a staging key
-        cell["time_history"][f"{next_timestep}_predictor"] = new_state
+    While the call runs, time_history.current_step(cell_dict) is timestep,
+    then timestep + 1 once the step is committed; it is cleared on return.
 
-        if debug and flat_idx < 5:
-            print(f"[Phase 1] cell={flat_idx}, v*={new_state['velocity']}")
+    Returns the step diagnostics: "pressure_solver" (method, iterations,
+    residual, converged) plus "divergence_l2" and "divergence_linf" of v^{n+1}.
+    """
+    with activate(profiler), tracking(cell_dict, timestep):
+        start = time.perf_counter_ns()
+        diagnostics = _advance(cell_dict, config, timestep, params, projection, ring, backend, terms, pool)
+        if profiler is not None:
+            nx, ny, nz = _grid_shape(config)
+            profiler.end_step(timestep, nx * ny * nz, time.perf_counter_ns() - start)
+    return diagnostics
+
+
+def _advance(cell_dict: Dict[str, Any], config: Dict[str, Any], timestep: int,
+             params: SolverParameters | None, projection: PressureProjection | None,
+             ring: FieldRing | None, backend: str | None, terms: bool, pool: Any) -> Dict[str, Any]:
+    """Phases 1–3 of timestep_driver."""
+    next_timestep = timestep + 1
+    # operators asked for the "latest" level of cell_dict resolve it in O(1)
+    # (timestep_driver tracks timestep for the duration of the call)
+    if params is None:
+        params = build_solver_parameters(config)
+
+    # ---------------- Phase 1: Velocity Prediction ----------------
+    if backend is None:
+        backend = select_predictor_backend(config)
+    with span("predictor"):
+        star, predictor_terms = _predict_phase(cell_dict, config, timestep, params, backend, terms, pool,
+                                               roles=projection.roles if projection is not None else None)
 
     # ---------------- Phase 2: Pressure Correction ----------------
-    # TODO: assemble RHS from divergence of v*, solve Poisson equation for p^{n+1}
-    # cell["time_history"][f"{next_timestep}_pressure"] = {...}
+    # ∇²φ = (ρ/Δt) ∇·v*, p^{n+1} = p* + φ (see pressure_solver.py)
+    if projection is None:
+        with span("poisson_assembly"):
+            projection = PressureProjection(star, config, params)
+    with span("poisson_solve"):
+        phi, solver_info = projection.project(star)
+    count("poisson_iterations", int(solver_info.get("iterations") or 0))
+
+    log.debug("[Phase 2] pressure solve: %s", solver_info)
 
     # ---------------- Phase 3: Velocity Correction ----------------
-    # TODO: subtract ∇p^{n+1} from v*, produce divergence-free v^{n+1}
-    # cell["time_history"][str(next_timestep)] = {...}
-    # apply enforce_boundary here for the second time
+    # v^{n+1} = v* − (Δt/ρ)∇φ, boundary overrides re-applied (see mac_correct_velocity.py)
+    with span("correction"):
+        corrected, diagnostics = correct_velocity(star, phi, config, params, timestep=next_timestep,
+                                                  roles=projection.roles)
+    with span("history_commit"):
+        corrected.write_time_level(cell_dict, str(next_timestep))
+    diagnostics["pressure_solver"] = solver_info
+    if predictor_terms is not None:
+        diagnostics["predictor_terms"] = predictor_terms
+    set_current_step(cell_dict, next_timestep)
+
+    if ring is not None:
+        with span("history_commit"):
+            ring.push(corrected)
+            prune_time_history(cell_dict, ring.policy, next_timestep, warn=False)
 
-    if debug:
-        print(f"✅ Phase 1 complete for timestep {timestep} → {next_timestep}")
+    log.debug("✅ Timestep %s → %s complete: %s", timestep, next_timestep, diagnostics)
 
+    return diagnostics
 
 
+def distributed_driver(transport: Transport, store: Any, config: Dict[str, Any], timesteps: int,
+                       params: SolverParameters | None = None,
+                       dims: Tuple[int, int, int] | None = None,
+                       profiler: Profiler | None = None,
+                       root: int | None = 0,
+                       gather: bool = True) -> Tuple[FieldStore | None, List[Dict[str, Any]]]:
+    """
+    Advance a FieldStore by timesteps projection steps, one Cartesian block
+    per rank of transport (distributed.run_local for local processes,
+    distributed.default_transport() under mpirun).
+
+    Every rank passes the same config. With root set (default rank 0) only
+    that rank needs the global store and scatters the blocks; the others may
+    pass None. With root=None every rank passes a store it can slice its own
+    block from without loading the rest (see DistributedDomain.scatter).
+    The Poisson operator is assembled once from the block geometry (solids,
+    pressure-Dirichlet roles) and each step runs predictor → pressure solve →
+    correction on the blocks. The pressure solve is always the distributed
+    CG; pressure_solver tolerance and max_iterations apply.
+
+    Returns the store after the last step and the per-step diagnostics, as
+    timestep_driver reports them. With gather the store is the global one on
+    rank 0 and None on the other ranks; without it every rank gets its own
+    block (DistributedDomain.block_store).
+    """
+    if params is None:
+        params = build_solver_parameters(config)
+    settings = load_pressure_solver_settings(config)
+    shape = store.shape if root is None else transport.broadcast(store.shape if transport.rank == root else None, root)
+    domain = DistributedDomain(transport, shape, dims)
+    history = []
+    with activate(profiler):
+        local = domain.scatter(store, root)
+        with span("poisson_assembly"):
+            domain.assemble(local, config)
+        first = int(local.timestep)
+        n_cells = shape[0] * shape[1] * shape[2]
+        for timestep in range(first, first + timesteps):
+            start = time.perf_counter_ns()
+            diagnostics = domain.advance(local, config, params, tolerance=settings["tolerance"],
+                                         max_iterations=settings["max_iterations"])
+            local.timestep = timestep + 1
+            history.append(diagnostics)
+            if profiler is not None:
+                profiler.end_step(timestep, n_cells, time.perf_counter_ns() - start)
+            if transport.rank == 0:
+                log.debug("✅ Distributed timestep %s → %s complete: %s", timestep, timestep + 1, diagnostics)
+    if not gather:
+        return domain.block_store(local), history
+    return domain.gather_store(local), history
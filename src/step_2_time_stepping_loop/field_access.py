@@ -1,9 +1,12 @@
 # src/step_2_time_stepping_loop/field_access.py
 # 🧱 Step 2: Field Access — Build Neighbor Maps
 
+import logging
 from typing import Dict, Any
 
-debug = True  # toggle to True for verbose GitHub Action logs
+from src.solver_logging import get_logger
+
+log = get_logger(__name__)  # FLUID_SOLVER_LOG="field_access=debug" for per-cell traces
 
 ORDER_6 = ("xp", "xm", "yp", "ym", "zp", "zm")
 
@@ -40,9 +43,10 @@ def build_neighbor_map(cell_dict: Dict[str, Any], timestep: int) -> Dict[int, Di
     - Pressure neighbors can be added similarly if needed.
     """
     neighbor_map: Dict[int, Dict[str, Dict[str, float]]] = {}
+    trace = log.isEnabledFor(logging.DEBUG)  # checked once, not per cell
 
-    if debug:
-        print(f"🔍 Building neighbor map for timestep {timestep}... total cells: {len(cell_dict)}")
+    if trace:
+        log.debug("🔍 Building neighbor map for timestep %s... total cells: %d", timestep, len(cell_dict))
 
     for flat_idx_str, cell in cell_dict.items():
         flat_idx = int(flat_idx_str)
@@ -64,8 +68,9 @@ def build_neighbor_map(cell_dict: Dict[str, Any], timestep: int) -> Dict[int, Di
                 vx_neighbors[direction] = vx_c
                 vy_neighbors[direction] = vy_c
                 vz_neighbors[direction] = vz_c
-                if debug and flat_idx < 5:
-                    print(f"Cell {flat_idx} {cell['grid_index']} → {direction} boundary → clamped to vx={vx_c}, vy={vy_c}, vz={vz_c}")
+                if trace and flat_idx < 5:
+                    log.debug("Cell %d %s → %s boundary → clamped to vx=%s, vy=%s, vz=%s",
+                              flat_idx, cell["grid_index"], direction, vx_c, vy_c, vz_c)
             else:
                 neighbor_state = cell_dict[str(neighbor_idx)]["time_history"].get(str(timestep))
                 if neighbor_state is None:
@@ -73,9 +78,10 @@ def build_neighbor_map(cell_dict: Dict[str, Any], timestep: int) -> Dict[int, Di
                 vx_neighbors[direction] = neighbor_state["velocity"]["vx"]
                 vy_neighbors[direction] = neighbor_state["velocity"]["vy"]
                 vz_neighbors[direction] = neighbor_state["velocity"]["vz"]
-                if debug and flat_idx < 5:
-                    print(f"Cell {flat_idx} {cell['grid_index']} → {direction} neighbor {neighbor_idx} → "
-                          f"vx={vx_neighbors[direction]}, vy={vy_neighbors[direction]}, vz={vz_neighbors[direction]}")
+                if trace and flat_idx < 5:
+                    log.debug("Cell %d %s → %s neighbor %s → vx=%s, vy=%s, vz=%s",
+                              flat_idx, cell["grid_index"], direction, neighbor_idx,
+                              vx_neighbors[direction], vy_neighbors[direction], vz_neighbors[direction])
 
         neighbor_map[flat_idx] = {
             "vx_neighbors": vx_neighbors,
@@ -83,11 +89,10 @@ def build_neighbor_map(cell_dict: Dict[str, Any], timestep: int) -> Dict[int, Di
             "vz_neighbors": vz_neighbors,
         }
 
-        if debug and flat_idx < 5:
-            print(f"✅ Cell {flat_idx} neighbor map: {neighbor_map[flat_idx]}")
+        if trace and flat_idx < 5:
+            log.debug("✅ Cell %d neighbor map: %s", flat_idx, neighbor_map[flat_idx])
 
-    if debug:
-        print("✅ Neighbor map build complete.")
+    log.debug("✅ Neighbor map build complete.")
 
     return neighbor_map
 
@@ -3,7 +3,9 @@
 
 from typing import Tuple, Literal
 
-debug = False  # toggle to True for verbose GitHub Action logs
+from src.solver_logging import get_logger
+
+log = get_logger(__name__)
 
 
 def compute_grid_spacings(
@@ -57,9 +59,8 @@ def compute_grid_spacings(
     z_min = dd["z_min"]; z_max = dd["z_max"]
     nx = dd["nx"]; ny = dd["ny"]; nz = dd["nz"]
 
-    if debug:
-        print(f"🔍 Domain definition: x=({x_min},{x_max}), y=({y_min},{y_max}), z=({z_min},{z_max}), "
-              f"nx={nx}, ny={ny}, nz={nz}, mode={mode}")
+    log.debug("🔍 Domain definition: x=(%s,%s), y=(%s,%s), z=(%s,%s), nx=%s, ny=%s, nz=%s, mode=%s",
+              x_min, x_max, y_min, y_max, z_min, z_max, nx, ny, nz, mode)
 
     # Basic type/validity checks
     for name, v in (("nx", nx), ("ny", ny), ("nz", nz)):
@@ -84,16 +85,14 @@ def compute_grid_spacings(
     dy = (y_max - y_min) / float(denom_y)
     dz = (z_max - z_min) / float(denom_z)
 
-    if debug:
-        print(f"📐 Computed spacings: dx={dx}, dy={dy}, dz={dz}")
+    log.debug("📐 Computed spacings: dx=%s, dy=%s, dz=%s", dx, dy, dz)
 
     # Final sanity checks
     for name, h in (("dx", dx), ("dy", dy), ("dz", dz)):
         if h <= 0.0 or not (h < float("inf")):
             raise ValueError(f"Configuration error: computed {name} must be > 0 and finite, got {h}.")
 
-    if debug:
-        print("✅ Grid spacing computation complete.")
+    log.debug("✅ Grid spacing computation complete.")
 
     return dx, dy, dz
 
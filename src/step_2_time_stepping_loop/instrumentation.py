@@ -0,0 +1,158 @@
+# src/step_2_time_stepping_loop/instrumentation.py
+# ⏱️ Instrumentation — opt-in phase/operator timing spans and counters
+#
+# A Profiler collects perf_counter_ns spans (count and total per name),
+# integer counters, and one record per timestep with cells/second. It is
+# switched on only inside `with activate(profiler):` (timestep_driver does this
+# when given a profiler). Outside of that, span() hands back one shared no-op
+# context manager, so instrumented hot paths pay a function call and nothing
+# else.
+#
+# The active profiler is per thread: activate() in the driver thread does not
+# reach worker threads (BlockExecutor), so Profiler updates, which are not
+# locked, only ever come from the thread that activated it. Work farmed out to
+# threads is timed as a whole by the caller's span.
+#
+# Spans are inclusive and may nest: "predictor" contains "advection", etc.
+# Span names used by the solver:
+#   phases    predictor, load_state, boundary, poisson_assembly, poisson_solve,
+#             correction, history_commit
+#   operators interpolation, diffusion, advection, pressure_gradient (array
+#             predictor only; the per-cell predictor is timed as a whole)
+#
+# write_report(path) writes JSON (.json) or CSV (.csv).
+
+import csv
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List
+
+from src.solver_logging import get_logger
+
+log = get_logger(__name__)
+
+_NO_SPAN = nullcontext()
+
+class _ActiveProfiler(threading.local):
+    """Profiler receiving this thread's span()/count() calls, None when off."""
+    profiler = None
+
+
+_active = _ActiveProfiler()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+class Profiler:
+    """Accumulates span timings, counters and per-step throughput."""
+
+    def __init__(self, echo_steps: bool = True):
+        self.echo_steps = echo_steps
+        self.spans: Dict[str, List[int]] = {}  # name → [count, total_ns]
+        self.counters: Dict[str, int] = {}
+        self.steps: List[Dict[str, Any]] = []
+
+    def add(self, name: str, elapsed_ns: int) -> None:
+        entry = self.spans.get(name)
+        if entry is None:
+            self.spans[name] = [1, elapsed_ns]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed_ns
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def end_step(self, timestep: int, cells: int, elapsed_ns: int) -> Dict[str, Any]:
+        """Record one finished timestep (and log its line at info when echo_steps)."""
+        seconds = elapsed_ns / 1e9
+        record = {
+            "timestep": timestep,
+            "cells": cells,
+            "elapsed_ns": elapsed_ns,
+            "cells_per_second": cells / seconds if seconds > 0 else float("inf"),
+        }
+        self.steps.append(record)
+        if self.echo_steps:
+            log.info("⏱️ step %s: %.2f ms, %.3e cells/s", timestep, elapsed_ns / 1e6, record["cells_per_second"])
+        return record
+
+    def report(self) -> Dict[str, Any]:
+        """Spans (count, total_ns, mean_ns, share of all steps), counters and steps."""
+        run_ns = sum(step["elapsed_ns"] for step in self.steps)
+        spans = {
+            name: {
+                "count": count,
+                "total_ns": total,
+                "mean_ns": total / count,
+                "share": total / run_ns if run_ns else None,
+            }
+            for name, (count, total) in sorted(self.spans.items(), key=lambda item: -item[1][1])
+        }
+        return {"spans": spans, "counters": dict(self.counters), "steps": list(self.steps)}
+
+    def write_report(self, path: str) -> None:
+        """Write report() as JSON, or as CSV rows when path ends with .csv."""
+        report = self.report()
+        with open(path, "w", newline="") as f:
+            if path.endswith(".csv"):
+                _write_csv(report, f)
+            else:
+                json.dump(report, f, indent=2)
+        log.info("⏱️ Timing report written to %s", path)
+
+
+def _write_csv(report: Dict[str, Any], f: Any) -> None:
+    writer = csv.writer(f)
+    writer.writerow(["kind", "name", "count", "total_ms", "mean_us", "cells_per_second"])
+    for name, s in report["spans"].items():
+        writer.writerow(["span", name, s["count"], s["total_ns"] / 1e6, s["mean_ns"] / 1e3, ""])
+    for name, value in report["counters"].items():
+        writer.writerow(["counter", name, value, "", "", ""])
+    for step in report["steps"]:
+        writer.writerow(["step", step["timestep"], step["cells"], step["elapsed_ns"] / 1e6, "",
+                         step["cells_per_second"]])
+
+
+@contextmanager
+def activate(profiler: Profiler | None) -> Iterator[Profiler | None]:
+    """Route this thread's span()/count() to profiler for the block (None: no-op)."""
+    previous = _active.profiler
+    _active.profiler = profiler if profiler is not None else previous
+    try:
+        yield profiler
+    finally:
+        _active.profiler = previous
+
+
+def active_profiler() -> Profiler | None:
+    """Profiler span()/count() currently report to, None when instrumentation is off."""
+    return _active.profiler
+
+
+def span(name: str):
+    """Timing span on the active profiler; a shared no-op when none is active."""
+    profiler = _active.profiler
+    return _NO_SPAN if profiler is None else _Span(profiler, name)
+
+
+def count(name: str, amount: int = 1) -> None:
+    profiler = _active.profiler
+    if profiler is not None:
+        profiler.count(name, amount)
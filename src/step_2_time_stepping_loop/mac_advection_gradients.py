@@ -32,28 +32,33 @@
 # Numerical meaning: The solver avoids undefined values and maintains stability.
 # Default behavior: In many CFD codes, when ghost cells are not explicitly defined, the Neumann condition is the safe default.
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
 
 # Import face interpolation functions
 from src.step_2_time_stepping_loop.mac_interpolation.vx import (
     vx_i_plus_half,
     vx_i_minus_half,
     vx_i_plus_three_half,
+    vx_i_minus_three_half,
 )
 
 from src.step_2_time_stepping_loop.mac_interpolation.vy import (
     vy_j_plus_half,
     vy_j_minus_half,
     vy_j_plus_three_half,
+    vy_j_minus_three_half,
 )
 
 from src.step_2_time_stepping_loop.mac_interpolation.vz import (
     vz_k_plus_half,
     vz_k_minus_half,
     vz_k_plus_three_half,
+    vz_k_minus_three_half,
 )
 
-debug = False  # toggle for verbose logging
+from src.step_2_time_stepping_loop.parameter_utils import ADVECTION_SCHEMES
 
 # ---------------- Utilities ----------------
 
@@ -65,65 +70,216 @@ def _neighbor_index(cell_dict: Dict[str, Any], center: int, key: str) -> Optiona
     return d.get(key, None)
 
 # ---------------- Gradient helpers ----------------
+#
+# Per-cell counterparts of _grad_at_face_grid below, with the same schemes and
+# stencil points: along the staggered axis the interpolation kernels give
+# v(-1/2), v(+3/2), v(-3/2) and v(+3/2) of the next cell; along a transverse
+# axis the own face value of the neighbours, a missing neighbour reusing the
+# nearest existing cell (the grid path's edge clamping).
+# _grad_vx_at_xface & co. keep their unrolled central stencils (the default
+# python predictor's hot path) and hand "upwind" / "quick" to _grad_at_face.
+
+# (+1/2, -1/2, +3/2, -3/2) face kernels of each component, and its axis' neighbour keys
+_FACE_KERNELS = (
+    (vx_i_plus_half, vx_i_minus_half, vx_i_plus_three_half, vx_i_minus_three_half),
+    (vy_j_plus_half, vy_j_minus_half, vy_j_plus_three_half, vy_j_minus_three_half),
+    (vz_k_plus_half, vz_k_minus_half, vz_k_plus_three_half, vz_k_minus_three_half),
+)
+_AXIS_KEYS = (
+    ("flat_index_i_minus_1", "flat_index_i_plus_1"),
+    ("flat_index_j_minus_1", "flat_index_j_plus_1"),
+    ("flat_index_k_minus_1", "flat_index_k_plus_1"),
+)
+
+
+def _derivative(f, fm1, fp1, fm2, fp2, h, scheme, velocity):
+    """Scalar _derivative_grid: first derivative of a face value with the selected scheme."""
+    if scheme == "central":
+        return (fp1 - fm1) / (2.0 * h)
+    if scheme == "upwind":
+        return (f - fm1) / h if velocity > 0.0 else (fp1 - f) / h
+    if scheme == "quick":
+        if velocity > 0.0:
+            return (3.0 * fp1 + 3.0 * f - 7.0 * fm1 + fm2) / (8.0 * h)
+        return (-fp2 + 7.0 * fp1 - 3.0 * f - 3.0 * fm1) / (8.0 * h)
+    raise ValueError(f"Unknown advection scheme '{scheme}'. Expected one of {ADVECTION_SCHEMES}.")
+
+
+def _grad_at_face(cell_dict, center, axis, spacings, timestep=None, scheme="central", velocities=None):
+    """
+    Gradients {"dx", "dy", "dz"} of the axis component at its own face of one cell.
 
-def _grad_vx_at_xface(cell_dict, center, dx, dy, dz, timestep=None):
+    velocities are the advecting (u, v, w) at the face, needed by "upwind"
+    and "quick"; they default to the three own-face values of center.
+    """
+    plus_half, minus_half, plus_three_half, minus_three_half = _FACE_KERNELS[axis]
+    if scheme != "central" and velocities is None:
+        velocities = tuple(kernels[0](cell_dict, center, timestep) for kernels in _FACE_KERNELS)
+    quick = scheme == "quick"
+    f = plus_half(cell_dict, center, timestep)
+    grads = {}
+    for d, name in enumerate(("dx", "dy", "dz")):
+        minus_key, plus_key = _AXIS_KEYS[d]
+        fm2 = fp2 = None
+        if d == axis:
+            fm1 = minus_half(cell_dict, center, timestep)
+            fp1 = plus_three_half(cell_dict, center, timestep)
+            if quick:
+                fm2 = minus_three_half(cell_dict, center, timestep)
+                nxt = _neighbor_index(cell_dict, center, plus_key)
+                fp2 = plus_three_half(cell_dict, nxt, timestep) if nxt is not None else fp1
+        else:
+            m1 = _neighbor_index(cell_dict, center, minus_key)
+            p1 = _neighbor_index(cell_dict, center, plus_key)
+            fm1 = plus_half(cell_dict, m1, timestep) if m1 is not None else f
+            fp1 = plus_half(cell_dict, p1, timestep) if p1 is not None else f
+            if quick:
+                m2 = _neighbor_index(cell_dict, m1, minus_key) if m1 is not None else None
+                p2 = _neighbor_index(cell_dict, p1, plus_key) if p1 is not None else None
+                fm2 = plus_half(cell_dict, m2, timestep) if m2 is not None else fm1
+                fp2 = plus_half(cell_dict, p2, timestep) if p2 is not None else fp1
+        grads[name] = _derivative(f, fm1, fp1, fm2, fp2, spacings[d], scheme,
+                                  None if velocities is None else velocities[d])
+    return grads
+
+
+def _grad_vx_at_xface(cell_dict, center, dx, dy, dz, timestep=None, scheme="central", velocities=None):
     """Gradients of v_x at the x-face (i+1/2)."""
+    if scheme != "central":
+        return _grad_at_face(cell_dict, center, 0, (dx, dy, dz), timestep, scheme, velocities)
     dvx_dx = (vx_i_plus_three_half(cell_dict, center, timestep) -
               vx_i_minus_half(cell_dict, center, timestep)) / (2.0 * dx)
 
     j_plus = _neighbor_index(cell_dict, center, "flat_index_j_plus_1")
     j_minus = _neighbor_index(cell_dict, center, "flat_index_j_minus_1")
-    vx_j_plus = vx_i_plus_half(cell_dict, j_plus, timestep) if j_plus else vx_i_plus_half(cell_dict, center, timestep)
-    vx_j_minus = vx_i_plus_half(cell_dict, j_minus, timestep) if j_minus else vx_i_plus_half(cell_dict, center, timestep)
+    vx_j_plus = vx_i_plus_half(cell_dict, j_plus, timestep) if j_plus is not None else vx_i_plus_half(cell_dict, center, timestep)
+    vx_j_minus = vx_i_plus_half(cell_dict, j_minus, timestep) if j_minus is not None else vx_i_plus_half(cell_dict, center, timestep)
     dvx_dy = (vx_j_plus - vx_j_minus) / (2.0 * dy)
 
     k_plus = _neighbor_index(cell_dict, center, "flat_index_k_plus_1")
     k_minus = _neighbor_index(cell_dict, center, "flat_index_k_minus_1")
-    vx_k_plus = vx_i_plus_half(cell_dict, k_plus, timestep) if k_plus else vx_i_plus_half(cell_dict, center, timestep)
-    vx_k_minus = vx_i_plus_half(cell_dict, k_minus, timestep) if k_minus else vx_i_plus_half(cell_dict, center, timestep)
+    vx_k_plus = vx_i_plus_half(cell_dict, k_plus, timestep) if k_plus is not None else vx_i_plus_half(cell_dict, center, timestep)
+    vx_k_minus = vx_i_plus_half(cell_dict, k_minus, timestep) if k_minus is not None else vx_i_plus_half(cell_dict, center, timestep)
     dvx_dz = (vx_k_plus - vx_k_minus) / (2.0 * dz)
 
     return {"dx": dvx_dx, "dy": dvx_dy, "dz": dvx_dz}
 
 
-def _grad_vy_at_yface(cell_dict, center, dx, dy, dz, timestep=None):
+def _grad_vy_at_yface(cell_dict, center, dx, dy, dz, timestep=None, scheme="central", velocities=None):
     """Gradients of v_y at the y-face (j+1/2)."""
+    if scheme != "central":
+        return _grad_at_face(cell_dict, center, 1, (dx, dy, dz), timestep, scheme, velocities)
     dvy_dy = (vy_j_plus_three_half(cell_dict, center, timestep) -
               vy_j_minus_half(cell_dict, center, timestep)) / (2.0 * dy)
 
     i_plus = _neighbor_index(cell_dict, center, "flat_index_i_plus_1")
     i_minus = _neighbor_index(cell_dict, center, "flat_index_i_minus_1")
-    vy_i_plus = vy_j_plus_half(cell_dict, i_plus, timestep) if i_plus else vy_j_plus_half(cell_dict, center, timestep)
-    vy_i_minus = vy_j_plus_half(cell_dict, i_minus, timestep) if i_minus else vy_j_plus_half(cell_dict, center, timestep)
+    vy_i_plus = vy_j_plus_half(cell_dict, i_plus, timestep) if i_plus is not None else vy_j_plus_half(cell_dict, center, timestep)
+    vy_i_minus = vy_j_plus_half(cell_dict, i_minus, timestep) if i_minus is not None else vy_j_plus_half(cell_dict, center, timestep)
     dvy_dx = (vy_i_plus - vy_i_minus) / (2.0 * dx)
 
     k_plus = _neighbor_index(cell_dict, center, "flat_index_k_plus_1")
     k_minus = _neighbor_index(cell_dict, center, "flat_index_k_minus_1")
-    vy_k_plus = vy_j_plus_half(cell_dict, k_plus, timestep) if k_plus else vy_j_plus_half(cell_dict, center, timestep)
-    vy_k_minus = vy_j_plus_half(cell_dict, k_minus, timestep) if k_minus else vy_j_plus_half(cell_dict, center, timestep)
+    vy_k_plus = vy_j_plus_half(cell_dict, k_plus, timestep) if k_plus is not None else vy_j_plus_half(cell_dict, center, timestep)
+    vy_k_minus = vy_j_plus_half(cell_dict, k_minus, timestep) if k_minus is not None else vy_j_plus_half(cell_dict, center, timestep)
     dvy_dz = (vy_k_plus - vy_k_minus) / (2.0 * dz)
 
     return {"dx": dvy_dx, "dy": dvy_dy, "dz": dvy_dz}
 
 
-def _grad_vz_at_zface(cell_dict, center, dx, dy, dz, timestep=None):
+def _grad_vz_at_zface(cell_dict, center, dx, dy, dz, timestep=None, scheme="central", velocities=None):
     """Gradients of v_z at the z-face (k+1/2)."""
+    if scheme != "central":
+        return _grad_at_face(cell_dict, center, 2, (dx, dy, dz), timestep, scheme, velocities)
     dvz_dz = (vz_k_plus_three_half(cell_dict, center, timestep) -
               vz_k_minus_half(cell_dict, center, timestep)) / (2.0 * dz)
 
     i_plus = _neighbor_index(cell_dict, center, "flat_index_i_plus_1")
     i_minus = _neighbor_index(cell_dict, center, "flat_index_i_minus_1")
-    vz_i_plus = vz_k_plus_half(cell_dict, i_plus, timestep) if i_plus else vz_k_plus_half(cell_dict, center, timestep)
-    vz_i_minus = vz_k_plus_half(cell_dict, i_minus, timestep) if i_minus else vz_k_plus_half(cell_dict, center, timestep)
+    vz_i_plus = vz_k_plus_half(cell_dict, i_plus, timestep) if i_plus is not None else vz_k_plus_half(cell_dict, center, timestep)
+    vz_i_minus = vz_k_plus_half(cell_dict, i_minus, timestep) if i_minus is not None else vz_k_plus_half(cell_dict, center, timestep)
     dvz_dx = (vz_i_plus - vz_i_minus) / (2.0 * dx)
 
     j_plus = _neighbor_index(cell_dict, center, "flat_index_j_plus_1")
     j_minus = _neighbor_index(cell_dict, center, "flat_index_j_minus_1")
-    vz_j_plus = vz_k_plus_half(cell_dict, j_plus, timestep) if j_plus else vz_k_plus_half(cell_dict, center, timestep)
-    vz_j_minus = vz_k_plus_half(cell_dict, j_minus, timestep) if j_minus else vz_k_plus_half(cell_dict, center, timestep)
+    vz_j_plus = vz_k_plus_half(cell_dict, j_plus, timestep) if j_plus is not None else vz_k_plus_half(cell_dict, center, timestep)
+    vz_j_minus = vz_k_plus_half(cell_dict, j_minus, timestep) if j_minus is not None else vz_k_plus_half(cell_dict, center, timestep)
     dvz_dy = (vz_j_plus - vz_j_minus) / (2.0 * dy)
 
     return {"dx": dvz_dx, "dy": dvz_dy, "dz": dvz_dz}
 
 
+# ---------------- Whole-grid gradient helpers ----------------
+#
+# The face array F = v(+1/2) of a component is differenced along each axis.
+# Stencil points along the staggered axis come from the interpolation kernels
+# (v(-1/2), v(+3/2), v(-3/2)) so "central" reproduces the per-cell helpers
+# above exactly; along transverse axes F is shifted with edge clamping, which
+# is the same "reuse the central cell" Neumann fallback.
+#
+# Schemes (a = advecting velocity, h = spacing):
+#   central: (F[+1] - F[-1]) / 2h
+#   upwind:  a > 0 → (F - F[-1]) / h,  else (F[+1] - F) / h
+#   quick:   a > 0 → (3F[+1] + 3F - 7F[-1] + F[-2]) / 8h
+#            else  → (-F[+2] + 7F[+1] - 3F - 3F[-1]) / 8h
+
+def _shift_clamped(values: np.ndarray, axis: int, step: int) -> np.ndarray:
+    """Return values shifted by step cells along axis, clamping at the domain edge."""
+    n = values.shape[axis]
+    index = np.clip(np.arange(n) + step, 0, n - 1)
+    return np.take(values, index, axis=axis)
+
+
+def _derivative_grid(f, fm1, fp1, fm2, fp2, h, scheme, velocity):
+    """First derivative of a face array with the selected scheme."""
+    if scheme == "central":
+        return (fp1 - fm1) / (2.0 * h)
+    if scheme == "upwind":
+        return np.where(velocity > 0.0, (f - fm1) / h, (fp1 - f) / h)
+    if scheme == "quick":
+        return np.where(velocity > 0.0,
+                        (3.0 * fp1 + 3.0 * f - 7.0 * fm1 + fm2) / (8.0 * h),
+                        (-fp2 + 7.0 * fp1 - 3.0 * f - 3.0 * fm1) / (8.0 * h))
+    raise ValueError(f"Unknown advection scheme '{scheme}'. Expected one of {ADVECTION_SCHEMES}.")
+
+
+def _grad_at_face_grid(faces: Dict[str, np.ndarray], axis: int,
+                       spacings: Tuple[float, float, float], scheme: str,
+                       velocities: Tuple[np.ndarray, np.ndarray, np.ndarray]
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gradients (∂/∂x, ∂/∂y, ∂/∂z) of one component at its own face for every cell.
 
+    Parameters
+    ----------
+    faces : dict
+        Output of vx_faces_grid / vy_faces_grid / vz_faces_grid for the component.
+    axis : int
+        Staggered axis of the component (0, 1, 2).
+    spacings : tuple of float
+        (dx, dy, dz).
+    scheme : str
+        One of ADVECTION_SCHEMES.
+    velocities : tuple of np.ndarray
+        Advecting velocities (u, v, w), used for upwind-biased schemes.
+    """
+    own = "ijk"[axis]
+    f = faces[f"{own}_plus_half"]
+    quick = scheme == "quick"
+    grads = []
+    for d in range(3):
+        fm2 = fp2 = None
+        if d == axis:
+            fm1 = faces[f"{own}_minus_half"]
+            fp1 = faces[f"{own}_plus_three_half"]
+            if quick:
+                fm2 = faces[f"{own}_minus_three_half"]
+                fp2 = _shift_clamped(fp1, d, 1)
+        else:
+            fm1 = _shift_clamped(f, d, -1)
+            fp1 = _shift_clamped(f, d, 1)
+            if quick:
+                fm2 = _shift_clamped(f, d, -2)
+                fp2 = _shift_clamped(f, d, 2)
+        grads.append(_derivative_grid(f, fm1, fp1, fm2, fp2, spacings[d], scheme, velocities[d]))
+    return tuple(grads)
@@ -5,48 +5,109 @@
 # Boundary Fallback Theory in CFD:
 # Same rationale as in mac_advection_gradients.py — when neighbors are missing,
 # reuse the central cell’s velocity to enforce a zero-gradient (Neumann) condition.
+#
+# adv_vx/vy/vz take the same scheme ("central", "upwind", "quick") as
+# advection_grid and reproduce it cell by cell.
+
+import logging
+from typing import Any, Tuple
+
+import numpy as np
 
-from src.step_2_time_stepping_loop.mac_interpolation.vx import vx_i_plus_half
-from src.step_2_time_stepping_loop.mac_interpolation.vy import vy_j_plus_half
-from src.step_2_time_stepping_loop.mac_interpolation.vz import vz_k_plus_half
+from src.solver_logging import get_logger
+from src.step_2_time_stepping_loop.mac_interpolation.vx import vx_i_plus_half, vx_faces_grid
+from src.step_2_time_stepping_loop.mac_interpolation.vy import vy_j_plus_half, vy_faces_grid
+from src.step_2_time_stepping_loop.mac_interpolation.vz import vz_k_plus_half, vz_faces_grid
 
 # Import gradient helpers
 from src.step_2_time_stepping_loop.mac_advection_gradients import (
     _grad_vx_at_xface,
     _grad_vy_at_yface,
     _grad_vz_at_zface,
+    _grad_at_face_grid,
+    ADVECTION_SCHEMES,
 )
 
+log = get_logger(__name__)
 
-def adv_vx(cell_dict, center, dx, dy, dz, timestep=None):
+
+def adv_vx(cell_dict, center, dx, dy, dz, timestep=None, scheme="central"):
     """Adv(v_x) at the x-face (i+1/2)."""
     u_face = vx_i_plus_half(cell_dict, center, timestep)
     # collocate v and w by sampling at the same face location
     v_face = vy_j_plus_half(cell_dict, center, timestep)
     w_face = vz_k_plus_half(cell_dict, center, timestep)
 
-    grads = _grad_vx_at_xface(cell_dict, center, dx, dy, dz, timestep)
+    grads = _grad_vx_at_xface(cell_dict, center, dx, dy, dz, timestep, scheme, (u_face, v_face, w_face))
     return u_face * grads["dx"] + v_face * grads["dy"] + w_face * grads["dz"]
 
 
-def adv_vy(cell_dict, center, dx, dy, dz, timestep=None):
+def adv_vy(cell_dict, center, dx, dy, dz, timestep=None, scheme="central"):
     """Adv(v_y) at the y-face (j+1/2)."""
     v_face = vy_j_plus_half(cell_dict, center, timestep)
     u_face = vx_i_plus_half(cell_dict, center, timestep)
     w_face = vz_k_plus_half(cell_dict, center, timestep)
 
-    grads = _grad_vy_at_yface(cell_dict, center, dx, dy, dz, timestep)
+    grads = _grad_vy_at_yface(cell_dict, center, dx, dy, dz, timestep, scheme, (u_face, v_face, w_face))
     return u_face * grads["dx"] + v_face * grads["dy"] + w_face * grads["dz"]
 
 
-def adv_vz(cell_dict, center, dx, dy, dz, timestep=None):
+def adv_vz(cell_dict, center, dx, dy, dz, timestep=None, scheme="central"):
     """Adv(v_z) at the z-face (k+1/2)."""
     w_face = vz_k_plus_half(cell_dict, center, timestep)
     u_face = vx_i_plus_half(cell_dict, center, timestep)
     v_face = vy_j_plus_half(cell_dict, center, timestep)
 
-    grads = _grad_vz_at_zface(cell_dict, center, dx, dy, dz, timestep)
+    grads = _grad_vz_at_zface(cell_dict, center, dx, dy, dz, timestep, scheme, (u_face, v_face, w_face))
     return u_face * grads["dx"] + v_face * grads["dy"] + w_face * grads["dz"]
 
 
+# ---------------- Whole-grid engine ----------------
+
+def advection_grid(store: Any, dx: float, dy: float, dz: float,
+                   scheme: str = "central",
+                   out: Tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute (Adv(v_x), Adv(v_y), Adv(v_z)) = u·∇v for every cell in one pass.
+
+    Face interpolations are computed once per component and shared by all three
+    operators; the advecting velocities are sampled at the same faces as
+    adv_vx / adv_vy / adv_vz.
+
+    Parameters
+    ----------
+    store : FieldStore
+        Any object exposing vx, vy, vz arrays shaped (nx, ny, nz).
+    dx, dy, dz : float
+        Grid spacings.
+    scheme : {"central", "upwind", "quick"}
+        "central" reproduces adv_vx/adv_vy/adv_vz. "upwind" is first-order
+        upwind, "quick" the third-order upwind-biased QUICK stencil.
+    out : tuple of three np.ndarray, optional
+        Preallocated (nx, ny, nz) float64 buffers for the results.
+
+    Raises
+    ------
+    ValueError
+        If scheme is not one of ADVECTION_SCHEMES.
+    """
+    if scheme not in ADVECTION_SCHEMES:
+        raise ValueError(f"Unknown advection scheme '{scheme}'. Expected one of {ADVECTION_SCHEMES}.")
+
+    spacings = (dx, dy, dz)
+    faces = (vx_faces_grid(store.vx), vy_faces_grid(store.vy), vz_faces_grid(store.vz))
+    velocities = (faces[0]["i_plus_half"], faces[1]["j_plus_half"], faces[2]["k_plus_half"])
+
+    results = []
+    for axis in range(3):
+        gx, gy, gz = _grad_at_face_grid(faces[axis], axis, spacings, scheme, velocities)
+        target = np.empty_like(gx) if out is None else out[axis]
+        np.multiply(velocities[0], gx, out=target)
+        target += velocities[1] * gy
+        target += velocities[2] * gz
+        results.append(target)
 
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Adv grid (%s): max|Adv|=%s", scheme, [float(np.abs(r).max()) for r in results])
+    return tuple(results)
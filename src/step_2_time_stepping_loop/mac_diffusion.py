@@ -1,10 +1,16 @@
 # src/step_2_time_stepping_loop/mac_diffusion.py
-from typing import Dict, Any
+import logging
+from typing import Dict, Any, Tuple
+
+import numpy as np
+
+from src.solver_logging import get_logger
 from src.step_2_time_stepping_loop.mac_diffusion_x import laplacian_vx
 from src.step_2_time_stepping_loop.mac_diffusion_y import laplacian_vy
 from src.step_2_time_stepping_loop.mac_diffusion_z import laplacian_vz
+from src.step_2_time_stepping_loop.mac_interpolation.base import _pad_edge, _shift, _unit
 
-debug = False  # toggle for verbose logging
+log = get_logger(__name__)
 
 def laplacian_velocity(cell_dict: Dict[str, Any], center: int,
                        dx: float, dy: float, dz: float,
@@ -17,9 +23,84 @@ def laplacian_velocity(cell_dict: Dict[str, Any], center: int,
         "vy": laplacian_vy(cell_dict, center, dx, dy, dz, timestep),
         "vz": laplacian_vz(cell_dict, center, dx, dy, dz, timestep),
     }
-    if debug:
-        print(f"∇²v at cell {center}: {out}")
+    log.debug("∇²v at cell %s: %s", center, out)
+    return out
+
+
+# ---------------- Whole-grid operator ----------------
+
+def _laplacian_component_grid(values: np.ndarray, axis: int,
+                              spacings: Tuple[float, float, float],
+                              out: np.ndarray | None = None) -> np.ndarray:
+    """
+    ∇² of one velocity component for every cell, using the same stencils as
+    laplacian_vx / laplacian_vy / laplacian_vz:
+
+      - staggered axis:   (v(+3/2) - 2*v(+1/2) + v(-1/2)) / h^2
+      - transverse axes:  (v(+1) - 2*v(+1/2) + v(-1)) / h^2
+
+    Edge padding reproduces the Neumann fallback of the interpolation functions.
+    The result is written into out when given (no output allocation).
+    """
+    padded = _pad_edge(np.asarray(values, dtype=np.float64))
+    center = _shift(padded, (0, 0, 0))
+    plus1 = _shift(padded, _unit(axis, 1))
+
+    # 2 * v(+1/2), shared by all three second differences
+    two_half = center + plus1
+
+    if out is None:
+        out = np.empty(center.shape, dtype=np.float64)
+
+    # staggered axis: v(+3/2) + v(-1/2) - 2*v(+1/2)
+    np.add(plus1, _shift(padded, _unit(axis, 2)), out=out)
+    out += center
+    out += _shift(padded, _unit(axis, -1))
+    out *= 0.5
+    out -= two_half
+    out /= spacings[axis] ** 2
+
+    for other in range(3):
+        if other == axis:
+            continue
+        # transverse: v(+1) + v(-1) - 2*v(+1/2), with v(±1) = 0.5*(v + v_neighbor)
+        term = _shift(padded, _unit(other, 1)) + _shift(padded, _unit(other, -1))
+        term += 2.0 * center
+        term *= 0.5
+        term -= two_half
+        term /= spacings[other] ** 2
+        out += term
+
     return out
 
 
+def laplacian_velocity_grid(store: Any, dx: float, dy: float, dz: float,
+                            out: Tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+                            ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute ∇²v = (∇²vx, ∇²vy, ∇²vz) for the whole grid in one call.
+
+    Parameters
+    ----------
+    store : FieldStore
+        Any object exposing vx, vy, vz arrays shaped (nx, ny, nz).
+    dx, dy, dz : float
+        Grid spacings.
+    out : tuple of three np.ndarray, optional
+        Preallocated (nx, ny, nz) float64 buffers, reused between timesteps.
 
+    Returns
+    -------
+    (lap_vx, lap_vy, lap_vz) : tuple of np.ndarray
+        The out buffers when given, otherwise newly allocated arrays.
+    """
+    spacings = (dx, dy, dz)
+    if out is None:
+        out = (None, None, None)
+    result = tuple(
+        _laplacian_component_grid(getattr(store, comp), axis, spacings, out[axis])
+        for axis, comp in enumerate(("vx", "vy", "vz"))
+    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("∇²v grid: shape=%s, max|∇²v|=%s", result[0].shape, [float(np.abs(r).max()) for r in result])
+    return result
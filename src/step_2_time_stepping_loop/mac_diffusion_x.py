@@ -1,12 +1,14 @@
 # src/step_2_time_stepping_loop/mac_diffusion_x.py
 from typing import Dict, Any
+
+from src.solver_logging import get_logger
 from src.step_2_time_stepping_loop.mac_interpolation.vx import (
     vx_i_plus_half, vx_i_minus_half, vx_i_plus_three_half,
     vx_j_plus_one, vx_j_minus_one,
     vx_k_plus_one, vx_k_minus_one,
 )
 
-debug = False
+log = get_logger(__name__)
 
 def laplacian_vx(cell_dict: Dict[str, Any], center: int,
                  dx: float, dy: float, dz: float,
@@ -43,8 +45,7 @@ def laplacian_vx(cell_dict: Dict[str, Any], center: int,
     d2vx_dz2 = (vx_kplus - 2.0 * vx_k + vx_kminus) / (dz * dz)
 
     out = d2vx_dx2 + d2vx_dy2 + d2vx_dz2
-    if debug:
-        print(f"∇²vx at cell {center}: dx2={d2vx_dx2}, dy2={d2vx_dy2}, dz2={d2vx_dz2}, result={out}")
+    log.debug("∇²vx at cell %s: dx2=%s, dy2=%s, dz2=%s, result=%s", center, d2vx_dx2, d2vx_dy2, d2vx_dz2, out)
     return out
 
 
@@ -1,12 +1,14 @@
 # src/step_2_time_stepping_loop/mac_diffusion_y.py
 from typing import Dict, Any
+
+from src.solver_logging import get_logger
 from src.step_2_time_stepping_loop.mac_interpolation.vy import (
     vy_j_plus_half, vy_j_minus_half, vy_j_plus_three_half,
     vy_i_plus_one, vy_i_minus_one,
     vy_k_plus_one, vy_k_minus_one,
 )
 
-debug = False  # toggle for verbose logging
+log = get_logger(__name__)
 
 def laplacian_vy(cell_dict: Dict[str, Any], center: int,
                  dx: float, dy: float, dz: float,
@@ -43,8 +45,7 @@ def laplacian_vy(cell_dict: Dict[str, Any], center: int,
     d2vy_dz2 = (vy_kp1 - 2.0 * vy_k + vy_km1) / (dz * dz)
 
     out = d2vy_dx2 + d2vy_dy2 + d2vy_dz2
-    if debug:
-        print(f"∇²vy at cell {center}: dx2={d2vy_dx2}, dy2={d2vy_dy2}, dz2={d2vy_dz2}, result={out}")
+    log.debug("∇²vy at cell %s: dx2=%s, dy2=%s, dz2=%s, result=%s", center, d2vy_dx2, d2vy_dy2, d2vy_dz2, out)
     return out
 
 
@@ -1,12 +1,14 @@
 # src/step_2_time_stepping_loop/mac_diffusion_z.py
 from typing import Dict, Any
+
+from src.solver_logging import get_logger
 from src.step_2_time_stepping_loop.mac_interpolation.vz import (
     vz_k_plus_half, vz_k_minus_half, vz_k_plus_three_half,
     vz_i_plus_one, vz_i_minus_one,
     vz_j_plus_one, vz_j_minus_one,
 )
 
-debug = False  # toggle for verbose logging
+log = get_logger(__name__)
 
 def laplacian_vz(cell_dict: Dict[str, Any], center: int,
                  dx: float, dy: float, dz: float,
@@ -43,8 +45,7 @@ def laplacian_vz(cell_dict: Dict[str, Any], center: int,
     d2vz_dy2 = (vz_jp1 - 2.0 * vz_j + vz_jm1) / (dy * dy)
 
     out = d2vz_dx2 + d2vz_dy2 + d2vz_dz2
-    if debug:
-        print(f"∇²vz at cell {center}: dx2={d2vz_dx2}, dy2={d2vz_dy2}, dz2={d2vz_dz2}, result={out}")
+    log.debug("∇²vz at cell %s: dx2=%s, dy2=%s, dz2=%s, result=%s", center, d2vz_dx2, d2vz_dy2, d2vz_dz2, out)
     return out
 
 
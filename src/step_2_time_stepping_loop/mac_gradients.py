@@ -1,7 +1,12 @@
 # src/step_2_time_stepping_loop/mac_gradients.py
 # 🧮 Step 2: MAC Gradients — Compute ∇ operators using face-centered values
 
+import logging
 from typing import Dict, Any
+
+import numpy as np
+
+from src.solver_logging import get_logger
 from src.step_2_time_stepping_loop.mac_interpolation import (
     vx_i_plus_half,
     vx_i_minus_half,
@@ -10,8 +15,10 @@ from src.step_2_time_stepping_loop.mac_interpolation import (
     vz_k_plus_half,
     vz_k_minus_half,
 )
+from src.step_2_time_stepping_loop.mac_interpolation.base import _pad_edge, _shift, _unit
+from src.step_2_time_stepping_loop.time_history import latest_committed_step
 
-debug = False  # toggle for verbose logging
+log = get_logger(__name__)
 
 
 def _resolve_pressure(cell_dict: Dict[str, Any], flat_index: int, timestep: int | None) -> float:
@@ -19,19 +26,17 @@ def _resolve_pressure(cell_dict: Dict[str, Any], flat_index: int, timestep: int
     Helper to fetch pressure from a cell at a given timestep.
     Defaults to latest timestep if None is provided.
     """
-    history_keys = list(cell_dict[str(flat_index)]["time_history"].keys())
-    if not history_keys:
+    time_history = cell_dict[str(flat_index)]["time_history"]
+    if not time_history:
         raise ValueError(f"No time_history available for cell {flat_index}")
     if timestep is None:
-        timestep = max(map(int, history_keys))
-        if debug:
-            print(f"ℹ️ Using latest timestep {timestep} for cell {flat_index}")
-    state = cell_dict[str(flat_index)]["time_history"].get(str(timestep))
+        timestep = latest_committed_step(time_history, cell_dict)
+        log.debug("ℹ️ Using latest timestep %s for cell %s", timestep, flat_index)
+    state = time_history.get(str(timestep))
     if state is None:
         raise ValueError(f"No time_history for timestep {timestep} in cell {flat_index}")
     value = float(state["pressure"])
-    if debug:
-        print(f"🔎 _resolve_pressure: cell={flat_index}, timestep={timestep}, pressure={value}")
+    log.debug("🔎 _resolve_pressure: cell=%s, timestep=%s, pressure=%s", flat_index, timestep, value)
     return value
 
 
@@ -46,8 +51,7 @@ def grad_p_x(cell_dict: Dict[str, Any], i_cell: int, dx: float, timestep: int |
     ip1 = cell_dict[str(i_cell)].get("flat_index_i_plus_1")
     p_ip1 = _resolve_pressure(cell_dict, ip1, timestep) if ip1 is not None else p_i
     out = (p_ip1 - p_i) / dx
-    if debug:
-        print(f"∂p/∂x at i+1/2 between {i_cell} and {ip1} -> {out}")
+    log.debug("∂p/∂x at i+1/2 between %s and %s -> %s", i_cell, ip1, out)
     return out
 
 
@@ -60,8 +64,7 @@ def grad_p_y(cell_dict: Dict[str, Any], j_cell: int, dy: float, timestep: int |
     jp1 = cell_dict[str(j_cell)].get("flat_index_j_plus_1")
     p_jp1 = _resolve_pressure(cell_dict, jp1, timestep) if jp1 is not None else p_j
     out = (p_jp1 - p_j) / dy
-    if debug:
-        print(f"∂p/∂y at j+1/2 between {j_cell} and {jp1} -> {out}")
+    log.debug("∂p/∂y at j+1/2 between %s and %s -> %s", j_cell, jp1, out)
     return out
 
 
@@ -74,8 +77,45 @@ def grad_p_z(cell_dict: Dict[str, Any], k_cell: int, dz: float, timestep: int |
     kp1 = cell_dict[str(k_cell)].get("flat_index_k_plus_1")
     p_kp1 = _resolve_pressure(cell_dict, kp1, timestep) if kp1 is not None else p_k
     out = (p_kp1 - p_k) / dz
-    if debug:
-        print(f"∂p/∂z at k+1/2 between {k_cell} and {kp1} -> {out}")
+    log.debug("∂p/∂z at k+1/2 between %s and %s -> %s", k_cell, kp1, out)
+    return out
+
+
+def open_faces(active: np.ndarray) -> tuple:
+    """
+    Per axis, a bool array marking the +1/2 faces of every cell that carry
+    flux: both neighbours active and not on the upper domain edge.
+    """
+    out = []
+    for axis in range(3):
+        face = np.zeros(active.shape, dtype=bool)
+        inner = [slice(None)] * 3
+        upper = [slice(None)] * 3
+        inner[axis], upper[axis] = slice(0, -1), slice(1, None)
+        face[tuple(inner)] = active[tuple(inner)] & active[tuple(upper)]
+        out.append(face)
+    return tuple(out)
+
+
+def pressure_gradient_grid(pressure: np.ndarray, dx: float, dy: float, dz: float,
+                           active: np.ndarray | None = None) -> tuple:
+    """
+    Compute (∂p/∂x, ∂p/∂y, ∂p/∂z) at the +1/2 faces of every cell, matching
+    grad_p_x/y/z: forward difference, ghost pressure = current cell at the
+    upper domain edge.
+
+    With an ``active`` mask (cell_type != SOLID) faces touching an inactive
+    cell get zero gradient, so the result is the operator G of the staggered
+    pair (see mac_divergence_grid).
+    """
+    padded = _pad_edge(np.asarray(pressure, dtype=np.float64))
+    center = _shift(padded, (0, 0, 0))
+    out = tuple((_shift(padded, _unit(axis, 1)) - center) / h for axis, h in enumerate((dx, dy, dz)))
+    if active is not None:
+        for grad, face in zip(out, open_faces(active)):
+            grad[~face] = 0.0
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("∇p grid: max|∂p|=%s", [float(np.abs(g).max()) for g in out])
     return out
 
 
@@ -101,9 +141,67 @@ def divergence(cell_dict: Dict[str, Any], center: int, dx: float, dy: float, dz:
     dvz_dz = (vz_plus - vz_minus) / dz
 
     out = dvx_dx + dvy_dy + dvz_dz
-    if debug:
-        print(f"∇·v at cell {center}: dvx_dx={dvx_dx}, dvy_dy={dvy_dy}, dvz_dz={dvz_dz}, total={out}")
+    log.debug("∇·v at cell %s: dvx_dx=%s, dvy_dy=%s, dvz_dz=%s, total=%s", center, dvx_dx, dvy_dy, dvz_dz, out)
+    return out
+
+
+def divergence_grid(store: Any, dx: float, dy: float, dz: float,
+                    out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Compute ∇·v for every cell, matching divergence() per cell:
+
+        (v(+1/2) - v(-1/2)) / h   summed over x, y, z
+
+    With v(±1/2) = 0.5*(v + v_neighbor) this reduces to (v_+1 - v_-1) / 2h,
+    and edge padding gives the same Neumann fallback at domain faces.
+    """
+    spacings = (dx, dy, dz)
+    if out is None:
+        out = np.zeros(store.shape, dtype=np.float64)
+    else:
+        out[...] = 0.0
+    for axis, comp in enumerate(("vx", "vy", "vz")):
+        padded = _pad_edge(np.asarray(getattr(store, comp), dtype=np.float64))
+        term = _shift(padded, _unit(axis, 1)) - _shift(padded, _unit(axis, -1))
+        term *= 0.5 / spacings[axis]
+        out += term
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("∇·v grid: max|∇·v|=%s", float(np.abs(out).max()))
     return out
 
 
+def mac_divergence_grid(store: Any, dx: float, dy: float, dz: float,
+                        active: np.ndarray | None = None, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Staggered ∇·v used by the pressure projection.
+
+    vx[i, j, k] is read as the flux through the +1/2 face of the cell (the face
+    where pressure_gradient_grid lives), and the divergence is the backward
+    difference
+
+        (v[i] - v[i-1]) / h   summed over x, y, z
 
+    with zero flux through closed faces: the domain edges and, given an
+    ``active`` mask, every face touching an inactive cell. This D is the
+    negative adjoint of the masked forward gradient G, so −D·G is exactly the
+    compact 7-point Laplacian assembled by PoissonSystem and diagonalised by
+    SpectralPoissonSolver, and one projection drives D·v to the solver
+    tolerance. divergence_grid stays the collocated per-cell diagnostic.
+    """
+    spacings = (dx, dy, dz)
+    if active is None:
+        active = np.ones(store.shape, dtype=bool)
+    if out is None:
+        out = np.zeros(store.shape, dtype=np.float64)
+    else:
+        out[...] = 0.0
+    for axis, (comp, face) in enumerate(zip(("vx", "vy", "vz"), open_faces(active))):
+        flux = np.where(face, getattr(store, comp), 0.0)
+        lower = [slice(None)] * 3
+        upper = [slice(None)] * 3
+        lower[axis], upper[axis] = slice(0, -1), slice(1, None)
+        out += flux / spacings[axis]
+        out[tuple(upper)] -= flux[tuple(lower)] / spacings[axis]
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("∇·v staggered: max|∇·v|=%s", float(np.abs(out).max()))
+    return out
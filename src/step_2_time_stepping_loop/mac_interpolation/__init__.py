@@ -11,6 +11,7 @@ from .vx import (
     vx_j_minus_one,
     vx_k_plus_one,
     vx_k_minus_one,
+    vx_faces_grid,
 )
 
 from .vy import (
@@ -22,6 +23,7 @@ from .vy import (
     vy_i_minus_one,
     vy_k_plus_one,
     vy_k_minus_one,
+    vy_faces_grid,
 )
 
 from .vz import (
@@ -33,6 +35,7 @@ from .vz import (
     vz_i_minus_one,
     vz_j_plus_one,
     vz_j_minus_one,
+    vz_faces_grid,
 )
 
 # Optional: expose helpers if you want them available outside
@@ -48,6 +51,7 @@ __all__ = [
     "vx_j_minus_one",
     "vx_k_plus_one",
     "vx_k_minus_one",
+    "vx_faces_grid",
     # vy
     "vy_j_plus_half",
     "vy_j_minus_half",
@@ -57,6 +61,7 @@ __all__ = [
     "vy_i_minus_one",
     "vy_k_plus_one",
     "vy_k_minus_one",
+    "vy_faces_grid",
     # vz
     "vz_k_plus_half",
     "vz_k_minus_half",
@@ -66,6 +71,7 @@ __all__ = [
     "vz_i_minus_one",
     "vz_j_plus_one",
     "vz_j_minus_one",
+    "vz_faces_grid",
     # base helpers
     "_resolve_timestep",
     "_get_velocity",
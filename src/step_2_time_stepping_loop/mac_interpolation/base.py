@@ -1,23 +1,32 @@
 # src/step_2_time_stepping_loop/mac_interpolation/base.py
 # ⚙️ Shared helpers for MAC Interpolation modules
 
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
-debug = False  # toggle to True for verbose GitHub Action logs
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_2_time_stepping_loop.time_history import latest_committed_step
+
+log = get_logger(__name__)
+
+# Padding width for whole-grid kernels: ±3/2 faces reach two cells out
+GRID_PAD = 2
+
+_AXIS_LABELS = ("i", "j", "k")
 
 
 def _resolve_timestep(cell_dict: Dict[str, Any], flat_index: int, timestep: int | None) -> int:
     """
     Resolve timestep: if None, pick the latest available in time_history.
     """
-    history_keys = list(cell_dict[str(flat_index)]["time_history"].keys())
-    if not history_keys:
+    time_history = cell_dict[str(flat_index)]["time_history"]
+    if not time_history:
         raise ValueError(f"No time_history available for cell {flat_index}")
     if timestep is None:
-        # default to latest
-        timestep = max(map(int, history_keys))
-        if debug:
-            print(f"ℹ️ Using latest timestep {timestep} for cell {flat_index}")
+        # default to latest (O(1) while the driver tracks this cell_dict)
+        timestep = latest_committed_step(time_history, cell_dict)
+        log.debug("ℹ️ Using latest timestep %s for cell %s", timestep, flat_index)
     return timestep
 
 
@@ -30,9 +39,75 @@ def _get_velocity(cell_dict: Dict[str, Any], flat_index: int, timestep: int | No
     if state is None:
         raise ValueError(f"No time_history for timestep {timestep} in cell {flat_index}")
     value = float(state["velocity"][comp])
-    if debug:
-        print(f"🔎 _get_velocity: cell={flat_index}, timestep={timestep}, comp={comp}, value={value}")
+    log.debug("🔎 _get_velocity: cell=%s, timestep=%s, comp=%s, value=%s", flat_index, timestep, comp, value)
     return value
 
 
 
+
+
+# ---------------- Whole-grid helpers ----------------
+
+def _pad_edge(values: np.ndarray) -> np.ndarray:
+    """
+    Pad a (nx, ny, nz) component by GRID_PAD cells on every side, repeating the
+    edge value. Reading a padded neighbor then reproduces the Neumann fallback
+    of the scalar functions (missing neighbor → nearest existing cell).
+    """
+    return np.pad(values, GRID_PAD, mode="edge")
+
+
+def _shift(padded: np.ndarray, offset: Tuple[int, int, int]) -> np.ndarray:
+    """Return a view of the padded array shifted by offset cells (di, dj, dk)."""
+    return padded[tuple(
+        slice(GRID_PAD + o, padded.shape[axis] - GRID_PAD + o)
+        for axis, o in enumerate(offset)
+    )]
+
+
+def _unit(axis: int, step: int) -> Tuple[int, int, int]:
+    offset = [0, 0, 0]
+    offset[axis] = step
+    return tuple(offset)
+
+
+def _face_values_grid(values: np.ndarray, axis: int) -> Dict[str, np.ndarray]:
+    """
+    Compute every face value used by the scalar interpolation API for one
+    velocity component, for all cells at once.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Cell-centered component shaped (nx, ny, nz).
+    axis : int
+        Axis the component is staggered along (0 for vx, 1 for vy, 2 for vz).
+
+    Returns
+    -------
+    dict
+        Keys mirror the scalar function suffixes, e.g. for vx:
+        "i_plus_half", "i_minus_half", "i_plus_three_half", "i_minus_three_half",
+        "j_plus_one", "j_minus_one", "k_plus_one", "k_minus_one".
+    """
+    padded = _pad_edge(np.asarray(values, dtype=np.float64))
+    center = _shift(padded, (0, 0, 0))
+    plus1 = _shift(padded, _unit(axis, 1))
+    minus1 = _shift(padded, _unit(axis, -1))
+    own = _AXIS_LABELS[axis]
+
+    faces = {
+        f"{own}_plus_half": 0.5 * (center + plus1),
+        f"{own}_minus_half": 0.5 * (center + minus1),
+        f"{own}_plus_three_half": 0.5 * (plus1 + _shift(padded, _unit(axis, 2))),
+        f"{own}_minus_three_half": 0.5 * (minus1 + _shift(padded, _unit(axis, -2))),
+    }
+    for other in range(3):
+        if other == axis:
+            continue
+        label = _AXIS_LABELS[other]
+        faces[f"{label}_plus_one"] = 0.5 * (center + _shift(padded, _unit(other, 1)))
+        faces[f"{label}_minus_one"] = 0.5 * (center + _shift(padded, _unit(other, -1)))
+
+    log.debug("🔎 _face_values_grid: axis=%s, shape=%s, faces=%s", axis, values.shape, list(faces))
+    return faces
@@ -7,9 +7,14 @@
 # - This enforces a zero-gradient (Neumann) boundary condition
 
 from typing import Dict, Any
-from .base import _get_velocity
 
-debug = False  # toggle to True for verbose GitHub Action logs
+import numpy as np
+
+from src.solver_logging import get_logger
+
+from .base import _get_velocity, _face_values_grid
+
+log = get_logger(__name__)
 
 
 def vx_i_plus_half(cell_dict: Dict[str, Any], i_cell: int, timestep: int | None = None) -> float:
@@ -22,8 +27,7 @@ def vx_i_plus_half(cell_dict: Dict[str, Any], i_cell: int, timestep: int | None
         return v_i  # Neumann fallback
     v_ip1 = _get_velocity(cell_dict, ip1, timestep, "vx")
     out = 0.5 * (v_i + v_ip1)
-    if debug:
-        print(f"vx_i+1/2 between {i_cell} and {ip1} -> {out}")
+    log.debug("vx_i+1/2 between %s and %s -> %s", i_cell, ip1, out)
     return out
 
 
@@ -37,8 +41,7 @@ def vx_i_minus_half(cell_dict: Dict[str, Any], i_cell: int, timestep: int | None
         return v_i  # Neumann fallback
     v_im1 = _get_velocity(cell_dict, im1, timestep, "vx")
     out = 0.5 * (v_i + v_im1)
-    if debug:
-        print(f"vx_i-1/2 between {im1} and {i_cell} -> {out}")
+    log.debug("vx_i-1/2 between %s and %s -> %s", im1, i_cell, out)
     return out
 
 
@@ -56,8 +59,7 @@ def vx_i_plus_three_half(cell_dict: Dict[str, Any], i_cell: int, timestep: int |
     v_ip1 = _get_velocity(cell_dict, ip1, timestep, "vx")
     v_ip2 = _get_velocity(cell_dict, ip2, timestep, "vx")
     out = 0.5 * (v_ip1 + v_ip2)
-    if debug:
-        print(f"vx_i+3/2 between {ip1} and {ip2} -> {out}")
+    log.debug("vx_i+3/2 between %s and %s -> %s", ip1, ip2, out)
     return out
 
 
@@ -75,8 +77,7 @@ def vx_i_minus_three_half(cell_dict: Dict[str, Any], i_cell: int, timestep: int
     v_im1 = _get_velocity(cell_dict, im1, timestep, "vx")
     v_im2 = _get_velocity(cell_dict, im2, timestep, "vx")
     out = 0.5 * (v_im1 + v_im2)
-    if debug:
-        print(f"vx_i-3/2 between {im1} and {im2} -> {out}")
+    log.debug("vx_i-3/2 between %s and %s -> %s", im1, im2, out)
     return out
 
 def vx_j_plus_one(cell_dict: Dict[str, Any], i_cell: int, timestep: int | None = None) -> float:
@@ -89,8 +90,7 @@ def vx_j_plus_one(cell_dict: Dict[str, Any], i_cell: int, timestep: int | None =
         return v_i  # Neumann fallback
     v_jp1 = _get_velocity(cell_dict, jp1, timestep, "vx")
     out = 0.5 * (v_i + v_jp1)
-    if debug:
-        print(f"vx_j+1 between {i_cell} and {jp1} -> {out}")
+    log.debug("vx_j+1 between %s and %s -> %s", i_cell, jp1, out)
     return out
 
 
@@ -104,8 +104,7 @@ def vx_j_minus_one(cell_dict: Dict[str, Any], i_cell: int, timestep: int | None
         return v_i  # Neumann fallback
     v_jm1 = _get_velocity(cell_dict, jm1, timestep, "vx")
     out = 0.5 * (v_i + v_jm1)
-    if debug:
-        print(f"vx_j-1 between {jm1} and {i_cell} -> {out}")
+    log.debug("vx_j-1 between %s and %s -> %s", jm1, i_cell, out)
     return out
 
 
@@ -119,8 +118,7 @@ def vx_k_plus_one(cell_dict: Dict[str, Any], i_cell: int, timestep: int | None =
         return v_i  # Neumann fallback
     v_kp1 = _get_velocity(cell_dict, kp1, timestep, "vx")
     out = 0.5 * (v_i + v_kp1)
-    if debug:
-        print(f"vx_k+1 between {i_cell} and {kp1} -> {out}")
+    log.debug("vx_k+1 between %s and %s -> %s", i_cell, kp1, out)
     return out
 
 
@@ -134,8 +132,18 @@ def vx_k_minus_one(cell_dict: Dict[str, Any], i_cell: int, timestep: int | None
         return v_i  # Neumann fallback
     v_km1 = _get_velocity(cell_dict, km1, timestep, "vx")
     out = 0.5 * (v_i + v_km1)
-    if debug:
-        print(f"vx_k-1 between {km1} and {i_cell} -> {out}")
+    log.debug("vx_k-1 between %s and %s -> %s", km1, i_cell, out)
     return out
 
 
+# ---------------- Whole-grid kernel ----------------
+
+def vx_faces_grid(vx: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Interpolate vx at every face used by the per-cell functions above, for the
+    whole grid in one slicing pass. Returns (nx, ny, nz) arrays keyed
+    "i_plus_half", "i_minus_half", "i_plus_three_half", "i_minus_three_half",
+    "j_plus_one", "j_minus_one", "k_plus_one", "k_minus_one".
+    Domain edges use the same Neumann fallback as the scalar API.
+    """
+    return _face_values_grid(vx, 0)
@@ -7,9 +7,14 @@
 # - This enforces a zero-gradient (Neumann) boundary condition
 
 from typing import Dict, Any
-from .base import _get_velocity
 
-debug = False  # toggle to True for verbose GitHub Action logs
+import numpy as np
+
+from src.solver_logging import get_logger
+
+from .base import _get_velocity, _face_values_grid
+
+log = get_logger(__name__)
 
 
 def vy_j_plus_half(cell_dict: Dict[str, Any], j_cell: int, timestep: int | None = None) -> float:
@@ -22,8 +27,7 @@ def vy_j_plus_half(cell_dict: Dict[str, Any], j_cell: int, timestep: int | None
         return v_j  # Neumann fallback
     v_jp1 = _get_velocity(cell_dict, jp1, timestep, "vy")
     out = 0.5 * (v_j + v_jp1)
-    if debug:
-        print(f"vy_j+1/2 between {j_cell} and {jp1} -> {out}")
+    log.debug("vy_j+1/2 between %s and %s -> %s", j_cell, jp1, out)
     return out
 
 
@@ -37,8 +41,7 @@ def vy_j_minus_half(cell_dict: Dict[str, Any], j_cell: int, timestep: int | None
         return v_j  # Neumann fallback
     v_jm1 = _get_velocity(cell_dict, jm1, timestep, "vy")
     out = 0.5 * (v_j + v_jm1)
-    if debug:
-        print(f"vy_j-1/2 between {jm1} and {j_cell} -> {out}")
+    log.debug("vy_j-1/2 between %s and %s -> %s", jm1, j_cell, out)
     return out
 
 
@@ -56,8 +59,7 @@ def vy_j_plus_three_half(cell_dict: Dict[str, Any], j_cell: int, timestep: int |
     v_jp1 = _get_velocity(cell_dict, jp1, timestep, "vy")
     v_jp2 = _get_velocity(cell_dict, jp2, timestep, "vy")
     out = 0.5 * (v_jp1 + v_jp2)
-    if debug:
-        print(f"vy_j+3/2 between {jp1} and {jp2} -> {out}")
+    log.debug("vy_j+3/2 between %s and %s -> %s", jp1, jp2, out)
     return out
 
 
@@ -75,8 +77,7 @@ def vy_j_minus_three_half(cell_dict: Dict[str, Any], j_cell: int, timestep: int
     v_jm1 = _get_velocity(cell_dict, jm1, timestep, "vy")
     v_jm2 = _get_velocity(cell_dict, jm2, timestep, "vy")
     out = 0.5 * (v_jm1 + v_jm2)
-    if debug:
-        print(f"vy_j-3/2 between {jm1} and {jm2} -> {out}")
+    log.debug("vy_j-3/2 between %s and %s -> %s", jm1, jm2, out)
     return out
 
 def vy_i_plus_one(cell_dict: Dict[str, Any], j_cell: int, timestep: int | None = None) -> float:
@@ -89,8 +90,7 @@ def vy_i_plus_one(cell_dict: Dict[str, Any], j_cell: int, timestep: int | None =
         return v_j  # Neumann fallback
     v_ip1 = _get_velocity(cell_dict, ip1, timestep, "vy")
     out = 0.5 * (v_j + v_ip1)
-    if debug:
-        print(f"vy_i+1 between {j_cell} and {ip1} -> {out}")
+    log.debug("vy_i+1 between %s and %s -> %s", j_cell, ip1, out)
     return out
 
 
@@ -104,8 +104,7 @@ def vy_i_minus_one(cell_dict: Dict[str, Any], j_cell: int, timestep: int | None
         return v_j  # Neumann fallback
     v_im1 = _get_velocity(cell_dict, im1, timestep, "vy")
     out = 0.5 * (v_j + v_im1)
-    if debug:
-        print(f"vy_i-1 between {im1} and {j_cell} -> {out}")
+    log.debug("vy_i-1 between %s and %s -> %s", im1, j_cell, out)
     return out
 
 
@@ -119,8 +118,7 @@ def vy_k_plus_one(cell_dict: Dict[str, Any], j_cell: int, timestep: int | None =
         return v_j  # Neumann fallback
     v_kp1 = _get_velocity(cell_dict, kp1, timestep, "vy")
     out = 0.5 * (v_j + v_kp1)
-    if debug:
-        print(f"vy_k+1 between {j_cell} and {kp1} -> {out}")
+    log.debug("vy_k+1 between %s and %s -> %s", j_cell, kp1, out)
     return out
 
 
@@ -134,9 +132,18 @@ def vy_k_minus_one(cell_dict: Dict[str, Any], j_cell: int, timestep: int | None
         return v_j  # Neumann fallback
     v_km1 = _get_velocity(cell_dict, km1, timestep, "vy")
     out = 0.5 * (v_j + v_km1)
-    if debug:
-        print(f"vy_k-1 between {km1} and {j_cell} -> {out}")
+    log.debug("vy_k-1 between %s and %s -> %s", km1, j_cell, out)
     return out
 
 
+# ---------------- Whole-grid kernel ----------------
 
+def vy_faces_grid(vy: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Interpolate vy at every face used by the per-cell functions above, for the
+    whole grid in one slicing pass. Returns (nx, ny, nz) arrays keyed
+    "j_plus_half", "j_minus_half", "j_plus_three_half", "j_minus_three_half",
+    "i_plus_one", "i_minus_one", "k_plus_one", "k_minus_one".
+    Domain edges use the same Neumann fallback as the scalar API.
+    """
+    return _face_values_grid(vy, 1)
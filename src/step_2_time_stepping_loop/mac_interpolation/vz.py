@@ -7,9 +7,14 @@
 # - This enforces a zero-gradient (Neumann) boundary condition
 
 from typing import Dict, Any
-from .base import _get_velocity
 
-debug = False  # toggle to True for verbose GitHub Action logs
+import numpy as np
+
+from src.solver_logging import get_logger
+
+from .base import _get_velocity, _face_values_grid
+
+log = get_logger(__name__)
 
 
 def vz_k_plus_half(cell_dict: Dict[str, Any], k_cell: int, timestep: int | None = None) -> float:
@@ -22,8 +27,7 @@ def vz_k_plus_half(cell_dict: Dict[str, Any], k_cell: int, timestep: int | None
         return v_k  # Neumann fallback
     v_kp1 = _get_velocity(cell_dict, kp1, timestep, "vz")
     out = 0.5 * (v_k + v_kp1)
-    if debug:
-        print(f"vz_k+1/2 between {k_cell} and {kp1} -> {out}")
+    log.debug("vz_k+1/2 between %s and %s -> %s", k_cell, kp1, out)
     return out
 
 
@@ -37,8 +41,7 @@ def vz_k_minus_half(cell_dict: Dict[str, Any], k_cell: int, timestep: int | None
         return v_k  # Neumann fallback
     v_km1 = _get_velocity(cell_dict, km1, timestep, "vz")
     out = 0.5 * (v_k + v_km1)
-    if debug:
-        print(f"vz_k-1/2 between {km1} and {k_cell} -> {out}")
+    log.debug("vz_k-1/2 between %s and %s -> %s", km1, k_cell, out)
     return out
 
 
@@ -56,8 +59,7 @@ def vz_k_plus_three_half(cell_dict: Dict[str, Any], k_cell: int, timestep: int |
     v_kp1 = _get_velocity(cell_dict, kp1, timestep, "vz")
     v_kp2 = _get_velocity(cell_dict, kp2, timestep, "vz")
     out = 0.5 * (v_kp1 + v_kp2)
-    if debug:
-        print(f"vz_k+3/2 between {kp1} and {kp2} -> {out}")
+    log.debug("vz_k+3/2 between %s and %s -> %s", kp1, kp2, out)
     return out
 
 
@@ -75,8 +77,7 @@ def vz_k_minus_three_half(cell_dict: Dict[str, Any], k_cell: int, timestep: int
     v_km1 = _get_velocity(cell_dict, km1, timestep, "vz")
     v_km2 = _get_velocity(cell_dict, km2, timestep, "vz")
     out = 0.5 * (v_km1 + v_km2)
-    if debug:
-        print(f"vz_k-3/2 between {km1} and {km2} -> {out}")
+    log.debug("vz_k-3/2 between %s and %s -> %s", km1, km2, out)
     return out
 
 def vz_i_plus_one(cell_dict: Dict[str, Any], k_cell: int, timestep: int | None = None) -> float:
@@ -89,8 +90,7 @@ def vz_i_plus_one(cell_dict: Dict[str, Any], k_cell: int, timestep: int | None =
         return v_k  # Neumann fallback
     v_ip1 = _get_velocity(cell_dict, ip1, timestep, "vz")
     out = 0.5 * (v_k + v_ip1)
-    if debug:
-        print(f"vz_i+1 between {k_cell} and {ip1} -> {out}")
+    log.debug("vz_i+1 between %s and %s -> %s", k_cell, ip1, out)
     return out
 
 
@@ -104,8 +104,7 @@ def vz_i_minus_one(cell_dict: Dict[str, Any], k_cell: int, timestep: int | None
         return v_k  # Neumann fallback
     v_im1 = _get_velocity(cell_dict, im1, timestep, "vz")
     out = 0.5 * (v_k + v_im1)
-    if debug:
-        print(f"vz_i-1 between {im1} and {k_cell} -> {out}")
+    log.debug("vz_i-1 between %s and %s -> %s", im1, k_cell, out)
     return out
 
 
@@ -119,8 +118,7 @@ def vz_j_plus_one(cell_dict: Dict[str, Any], k_cell: int, timestep: int | None =
         return v_k  # Neumann fallback
     v_jp1 = _get_velocity(cell_dict, jp1, timestep, "vz")
     out = 0.5 * (v_k + v_jp1)
-    if debug:
-        print(f"vz_j+1 between {k_cell} and {jp1} -> {out}")
+    log.debug("vz_j+1 between %s and %s -> %s", k_cell, jp1, out)
     return out
 
 
@@ -134,9 +132,18 @@ def vz_j_minus_one(cell_dict: Dict[str, Any], k_cell: int, timestep: int | None
         return v_k  # Neumann fallback
     v_jm1 = _get_velocity(cell_dict, jm1, timestep, "vz")
     out = 0.5 * (v_k + v_jm1)
-    if debug:
-        print(f"vz_j-1 between {jm1} and {k_cell} -> {out}")
+    log.debug("vz_j-1 between %s and %s -> %s", jm1, k_cell, out)
     return out
 
 
+# ---------------- Whole-grid kernel ----------------
 
+def vz_faces_grid(vz: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Interpolate vz at every face used by the per-cell functions above, for the
+    whole grid in one slicing pass. Returns (nx, ny, nz) arrays keyed
+    "k_plus_half", "k_minus_half", "k_plus_three_half", "k_minus_three_half",
+    "i_plus_one", "i_minus_one", "j_plus_one", "j_minus_one".
+    Domain edges use the same Neumann fallback as the scalar API.
+    """
+    return _face_values_grid(vz, 2)
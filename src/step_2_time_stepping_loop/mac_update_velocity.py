@@ -9,6 +9,8 @@
 #   - center: flat index of central cell
 #   - config: full input configuration (JSON dict)
 #   - timestep: current timestep index (None -> latest available)
+#   - params: optional SolverParameters built once per run (avoids re-validating
+#     the config for every cell and component)
 #
 # Outputs:
 #   - v_x*, v_y*, v_z* at MAC faces (predictor velocities)
@@ -17,75 +19,228 @@
 #   - Boundary handling: underlying interpolation/gradient operators apply Neumann fallbacks.
 #   - Integration: predictor velocities should be staged (e.g., under "{timestep+1}_predictor")
 #     and NOT committed as final until PPE (Phase 2) and velocity correction (Phase 3) are applied.
-
+#   - update_velocity / update_velocity_grid are the fused forms of the three
+#     predictor components, optionally with per-term magnitudes (TERM_NAMES).
+#     Only update_velocity_grid interpolates every face once and feeds it to the
+#     diffusion, advection and own-face terms. update_velocity shares just the
+#     advecting velocities u(i+1/2), v(j+1/2), w(k+1/2); its Laplacian and
+#     advection-gradient stencils still interpolate their neighbour faces
+#     through the per-cell operators.
+#   - Every form advects with params.advection_scheme ("central", "upwind",
+#     "quick"), so the per-cell and grid predictors agree for each scheme.
+
+import logging
 from typing import Dict, Any
 
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_2_time_stepping_loop.instrumentation import span
 from src.step_2_time_stepping_loop.mac_diffusion import laplacian_vx, laplacian_vy, laplacian_vz
 from src.step_2_time_stepping_loop.mac_advection_ops import adv_vx, adv_vy, adv_vz
-from src.step_2_time_stepping_loop.mac_gradients import grad_p_x, grad_p_y, grad_p_z
-from src.step_2_time_stepping_loop.mac_interpolation.vx import vx_i_plus_half
-from src.step_2_time_stepping_loop.mac_interpolation.vy import vy_j_plus_half
-from src.step_2_time_stepping_loop.mac_interpolation.vz import vz_k_plus_half
-from src.step_2_time_stepping_loop.parameter_utils import load_solver_parameters
+from src.step_2_time_stepping_loop.mac_advection_gradients import (
+    _grad_vx_at_xface,
+    _grad_vy_at_yface,
+    _grad_vz_at_zface,
+    _grad_at_face_grid,
+)
+from src.step_2_time_stepping_loop.mac_gradients import grad_p_x, grad_p_y, grad_p_z, pressure_gradient_grid
+from src.step_2_time_stepping_loop.mac_interpolation.vx import vx_i_plus_half, vx_faces_grid
+from src.step_2_time_stepping_loop.mac_interpolation.vy import vy_j_plus_half, vy_faces_grid
+from src.step_2_time_stepping_loop.mac_interpolation.vz import vz_k_plus_half, vz_faces_grid
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters, build_solver_parameters
 
-debug = False  # toggle for verbose logging
+log = get_logger(__name__)
 
 
 def update_velocity_x(cell_dict: Dict[str, Any], center: int,
-                      config: Dict[str, Any], timestep: int | None = None) -> float:
+                      config: Dict[str, Any], timestep: int | None = None,
+                      params: SolverParameters | None = None) -> float:
     """Predict intermediate v_x* at i+1/2 face."""
-    params = load_solver_parameters(config)
+    if params is None:
+        params = build_solver_parameters(config)
     v_n: float = vx_i_plus_half(cell_dict, center, timestep)
-    lap: float = laplacian_vx(cell_dict, center, params["dx"], timestep)
-    adv: float = adv_vx(cell_dict, center, params["dx"], params["dy"], params["dz"], timestep)
-    gradp: float = grad_p_x(cell_dict, center, params["dx"], timestep)
+    lap: float = laplacian_vx(cell_dict, center, params.dx, params.dy, params.dz, timestep)
+    adv: float = adv_vx(cell_dict, center, params.dx, params.dy, params.dz, timestep, params.advection_scheme)
+    gradp: float = grad_p_x(cell_dict, center, params.dx, timestep)
 
-    v_star: float = v_n + (params["dt"] / params["rho"]) * (
-        params["mu"] * lap - params["rho"] * adv - gradp + params["Fx"]
+    v_star: float = v_n + (params.dt / params.rho) * (
+        params.mu * lap - params.rho * adv - gradp + params.Fx
     )
 
-    if debug:
-        print(f"[Update vx] center={center}, v_n={v_n}, lap={lap}, adv={adv}, gradp={gradp}, Fx={params['Fx']} -> v*={v_star}")
+    log.debug("[Update vx] center=%s, v_n=%s, lap=%s, adv=%s, gradp=%s, Fx=%s -> v*=%s",
+              center, v_n, lap, adv, gradp, params.Fx, v_star)
 
     return v_star
 
 
 def update_velocity_y(cell_dict: Dict[str, Any], center: int,
-                      config: Dict[str, Any], timestep: int | None = None) -> float:
+                      config: Dict[str, Any], timestep: int | None = None,
+                      params: SolverParameters | None = None) -> float:
     """Predict intermediate v_y* at j+1/2 face."""
-    params = load_solver_parameters(config)
+    if params is None:
+        params = build_solver_parameters(config)
     v_n: float = vy_j_plus_half(cell_dict, center, timestep)
-    lap: float = laplacian_vy(cell_dict, center, params["dy"], timestep)
-    adv: float = adv_vy(cell_dict, center, params["dx"], params["dy"], params["dz"], timestep)
-    gradp: float = grad_p_y(cell_dict, center, params["dy"], timestep)
+    lap: float = laplacian_vy(cell_dict, center, params.dx, params.dy, params.dz, timestep)
+    adv: float = adv_vy(cell_dict, center, params.dx, params.dy, params.dz, timestep, params.advection_scheme)
+    gradp: float = grad_p_y(cell_dict, center, params.dy, timestep)
 
-    v_star: float = v_n + (params["dt"] / params["rho"]) * (
-        params["mu"] * lap - params["rho"] * adv - gradp + params["Fy"]
+    v_star: float = v_n + (params.dt / params.rho) * (
+        params.mu * lap - params.rho * adv - gradp + params.Fy
     )
 
-    if debug:
-        print(f"[Update vy] center={center}, v_n={v_n}, lap={lap}, adv={adv}, gradp={gradp}, Fy={params['Fy']} -> v*={v_star}")
+    log.debug("[Update vy] center=%s, v_n=%s, lap=%s, adv=%s, gradp=%s, Fy=%s -> v*=%s",
+              center, v_n, lap, adv, gradp, params.Fy, v_star)
 
     return v_star
 
 
 def update_velocity_z(cell_dict: Dict[str, Any], center: int,
-                      config: Dict[str, Any], timestep: int | None = None) -> float:
+                      config: Dict[str, Any], timestep: int | None = None,
+                      params: SolverParameters | None = None) -> float:
     """Predict intermediate v_z* at k+1/2 face."""
-    params = load_solver_parameters(config)
+    if params is None:
+        params = build_solver_parameters(config)
     v_n: float = vz_k_plus_half(cell_dict, center, timestep)
-    lap: float = laplacian_vz(cell_dict, center, params["dz"], timestep)
-    adv: float = adv_vz(cell_dict, center, params["dx"], params["dy"], params["dz"], timestep)
-    gradp: float = grad_p_z(cell_dict, center, params["dz"], timestep)
+    lap: float = laplacian_vz(cell_dict, center, params.dx, params.dy, params.dz, timestep)
+    adv: float = adv_vz(cell_dict, center, params.dx, params.dy, params.dz, timestep, params.advection_scheme)
+    gradp: float = grad_p_z(cell_dict, center, params.dz, timestep)
 
-    v_star: float = v_n + (params["dt"] / params["rho"]) * (
-        params["mu"] * lap - params["rho"] * adv - gradp + params["Fz"]
+    v_star: float = v_n + (params.dt / params.rho) * (
+        params.mu * lap - params.rho * adv - gradp + params.Fz
     )
 
-    if debug:
-        print(f"[Update vz] center={center}, v_n={v_n}, lap={lap}, adv={adv}, gradp={gradp}, Fz={params['Fz']} -> v*={v_star}")
+    log.debug("[Update vz] center=%s, v_n=%s, lap=%s, adv=%s, gradp=%s, Fz=%s -> v*=%s",
+              center, v_n, lap, adv, gradp, params.Fz, v_star)
 
     return v_star
 
 
+# ---------------- Fused predictor ----------------
+
+# Per-term diagnostics: |μ∇²v|, |ρ Adv(v)|, |∇p|, |F| (Euclidean norm over components)
+TERM_NAMES = ("diffusion", "advection", "pressure", "force")
+
+
+def _term_magnitudes(lap, adv, gradp, params: SolverParameters) -> Dict[str, Any]:
+    """Per-term magnitudes from (x, y, z) tuples of scalars or arrays."""
+    def norm(x, y, z):
+        return np.sqrt(x * x + y * y + z * z)
+
+    return {
+        "diffusion": params.mu * norm(*lap),
+        "advection": params.rho * norm(*adv),
+        "pressure": norm(*gradp),
+        "force": float(norm(params.Fx, params.Fy, params.Fz)),
+    }
+
+
+def _combine(v_n, lap, adv, gradp, force, params: SolverParameters):
+    return v_n + (params.dt / params.rho) * (params.mu * lap - params.rho * adv - gradp + force)
+
+
+def update_velocity(cell_dict: Dict[str, Any], center: int,
+                    config: Dict[str, Any], timestep: int | None = None,
+                    params: SolverParameters | None = None,
+                    terms: bool = False):
+    """
+    Predict (v_x*, v_y*, v_z*) at one cell in a single pass.
+
+    Same values as update_velocity_x/y/z, but the face velocities u(i+1/2),
+    v(j+1/2), w(k+1/2) are interpolated once and shared by the own-face value
+    and as advecting velocities of the three advection operators. The
+    Laplacian and advection-gradient stencils are the per-cell operators and
+    interpolate the neighbour faces they need themselves; the grid path
+    (update_velocity_grid) is the one that interpolates each face once.
+
+    Returns
+    -------
+    (vx*, vy*, vz*) : tuple of float
+        Or ((vx*, vy*, vz*), magnitudes) when terms=True, with magnitudes keyed
+        by TERM_NAMES.
+    """
+    if params is None:
+        params = build_solver_parameters(config)
+    dx, dy, dz = params.dx, params.dy, params.dz
+    # no spans here: called once per cell, so the driver times the whole loop
+    faces = (vx_i_plus_half(cell_dict, center, timestep),
+             vy_j_plus_half(cell_dict, center, timestep),
+             vz_k_plus_half(cell_dict, center, timestep))
+    lap = (laplacian_vx(cell_dict, center, dx, dy, dz, timestep),
+           laplacian_vy(cell_dict, center, dx, dy, dz, timestep),
+           laplacian_vz(cell_dict, center, dx, dy, dz, timestep))
+    scheme = params.advection_scheme
+    adv = tuple(
+        faces[0] * grads["dx"] + faces[1] * grads["dy"] + faces[2] * grads["dz"]
+        for grads in (_grad_vx_at_xface(cell_dict, center, dx, dy, dz, timestep, scheme, faces),
+                      _grad_vy_at_yface(cell_dict, center, dx, dy, dz, timestep, scheme, faces),
+                      _grad_vz_at_zface(cell_dict, center, dx, dy, dz, timestep, scheme, faces))
+    )
+    gradp = (grad_p_x(cell_dict, center, dx, timestep),
+             grad_p_y(cell_dict, center, dy, timestep),
+             grad_p_z(cell_dict, center, dz, timestep))
+    forces = (params.Fx, params.Fy, params.Fz)
+
+    v_star = tuple(_combine(faces[a], lap[a], adv[a], gradp[a], forces[a], params) for a in range(3))
+
+    log.debug("[Update v] center=%s, faces=%s, lap=%s, adv=%s, gradp=%s -> v*=%s", center, faces, lap, adv, gradp, v_star)
 
+    if terms:
+        return v_star, _term_magnitudes(lap, adv, gradp, params)
+    return v_star
+
+
+def update_velocity_grid(store: Any, params: SolverParameters, terms: bool = False):
+    """
+    Predict (v_x*, v_y*, v_z*) for every cell of a FieldStore in one pass.
+
+    Each component's face values (vx_faces_grid / vy_faces_grid / vz_faces_grid)
+    are computed once and reused for the own-face value, the staggered and
+    transverse Laplacian stencils and the advection gradients; the advecting
+    velocities are the three own-face arrays. Uses params.advection_scheme.
+
+    Returns
+    -------
+    (vx*, vy*, vz*) : tuple of np.ndarray
+        Or ((vx*, vy*, vz*), magnitudes) when terms=True, with magnitudes keyed
+        by TERM_NAMES holding the largest per-cell value of each term.
+    """
+    spacings = (params.dx, params.dy, params.dz)
+    with span("interpolation"):
+        faces = (vx_faces_grid(store.vx), vy_faces_grid(store.vy), vz_faces_grid(store.vz))
+    own = tuple(faces[axis][f"{'ijk'[axis]}_plus_half"] for axis in range(3))
+    forces = (params.Fx, params.Fy, params.Fz)
+    with span("pressure_gradient"):
+        gradp = pressure_gradient_grid(store.pressure, *spacings)
+
+    lap, adv, v_star = [], [], []
+    for axis in range(3):
+        label = "ijk"[axis]
+        f = own[axis]
+        two_f = 2.0 * f
+        with span("diffusion"):
+            # staggered axis: (v(+3/2) - 2 v(+1/2) + v(-1/2)) / h²
+            lap_a = (faces[axis][f"{label}_plus_three_half"] + faces[axis][f"{label}_minus_half"]
+                     - two_f) / spacings[axis] ** 2
+            for other in range(3):
+                if other != axis:
+                    # transverse: (v(+1) - 2 v(+1/2) + v(-1)) / h²
+                    o = "ijk"[other]
+                    lap_a += (faces[axis][f"{o}_plus_one"] + faces[axis][f"{o}_minus_one"] - two_f) / spacings[other] ** 2
+
+        with span("advection"):
+            gx, gy, gz = _grad_at_face_grid(faces[axis], axis, spacings, params.advection_scheme, own)
+            adv_a = own[0] * gx + own[1] * gy + own[2] * gz
+
+        lap.append(lap_a)
+        adv.append(adv_a)
+        v_star.append(_combine(f, lap_a, adv_a, gradp[axis], forces[axis], params))
+    v_star = tuple(v_star)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("[Update v grid] max|v*|=%s", [float(np.abs(v).max()) for v in v_star])
+
+    if terms:
+        magnitudes = {name: float(np.max(value)) for name, value in _term_magnitudes(lap, adv, gradp, params).items()}
+        return v_star, magnitudes
+    return v_star
@@ -0,0 +1,149 @@
+# src/step_2_time_stepping_loop/parallel_predictor.py
+# 🧵 Parallel Predictor — Phase 1 over z-slabs in a process pool
+#
+# The grid is split into contiguous z-slabs, one task per slab. The current
+# level (pressure, vx, vy, vz) is published once per step into
+# multiprocessing.shared_memory blocks; each worker copies its slab plus
+# HALO_WIDTH planes on either side (the halo exchange), runs the fused grid
+# predictor (update_velocity_grid) on that window and writes the slab interior
+# into the shared output arrays.
+#
+# HALO_WIDTH is the z-reach of the predictor stencil: the own-face QUICK
+# gradient of vz reads k+3, the staggered stencils k+2. With that halo every
+# interior cell sees exactly the neighbors it sees on the full grid, and slabs
+# touching the domain edge clamp at the same planes, so the result matches the
+# serial predictor bit for bit.
+#
+# Workers always run the NumPy predictor, so timestep_driver accepts a pool
+# only with backend "numpy"; the numba kernel is parallel over z on its own.
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.field_store import FIELD_NAMES, FieldStore
+from src.step_2_time_stepping_loop.mac_update_velocity import update_velocity_grid
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+
+log = get_logger(__name__)
+
+HALO_WIDTH = 3
+OUTPUT_NAMES = ("vx_star", "vy_star", "vz_star")
+
+# Shared arrays attached in each worker process (see _attach)
+_worker_arrays: Dict[str, np.ndarray] = {}
+_worker_blocks: List[shared_memory.SharedMemory] = []
+
+
+def slab_bounds(nz: int, n_slabs: int) -> List[Tuple[int, int]]:
+    """Split range(nz) into at most n_slabs contiguous (k_start, k_stop) slabs."""
+    n_slabs = max(1, min(int(n_slabs), nz))
+    edges = np.linspace(0, nz, n_slabs + 1).round().astype(int)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+def _attach(names: Dict[str, str], shape: Tuple[int, int, int]) -> None:
+    """Pool initializer: map the shared blocks into this worker."""
+    for field, block_name in names.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _worker_blocks.append(block)
+        _worker_arrays[field] = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+
+
+def _predict_slab(bounds: Tuple[int, int], params: SolverParameters, halo: int) -> Tuple[int, int]:
+    """Worker task: predictor for one z-slab, written into the shared outputs."""
+    k_start, k_stop = bounds
+    nz = _worker_arrays["vx"].shape[2]
+    lo, hi = max(0, k_start - halo), min(nz, k_stop + halo)
+
+    nx, ny, _ = _worker_arrays["vx"].shape
+    local = FieldStore((nx, ny, hi - lo))
+    for name in FIELD_NAMES:
+        np.copyto(getattr(local, name), _worker_arrays[name][:, :, lo:hi])
+
+    v_star = update_velocity_grid(local, params)
+    for name, values in zip(OUTPUT_NAMES, v_star):
+        _worker_arrays[name][:, :, k_start:k_stop] = values[:, :, k_start - lo:k_stop - lo]
+    return bounds
+
+
+class SlabPredictor:
+    """
+    Process pool running the Phase 1 predictor over z-slabs.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Grid resolution (nx, ny, nz); fixed for the pool's lifetime.
+    workers : int, optional
+        Pool size (defaults to os.cpu_count()). The grid is cut into at most
+        this many slabs.
+    halo : int
+        z-planes each worker reads beyond its slab (HALO_WIDTH reproduces the
+        serial result).
+
+    Use as a context manager, or call close(), to stop the pool and release
+    the shared memory.
+    """
+
+    def __init__(self, shape: Tuple[int, int, int], workers: int | None = None, halo: int = HALO_WIDTH):
+        self.shape = tuple(int(n) for n in shape)
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ValueError(f"Invalid worker count: {self.workers}")
+        self.halo = halo
+        self.slabs = slab_bounds(self.shape[2], self.workers)
+
+        nbytes = int(np.prod(self.shape)) * np.dtype(np.float64).itemsize
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+        self._arrays: Dict[str, np.ndarray] = {}
+        for field in FIELD_NAMES + OUTPUT_NAMES:
+            block = shared_memory.SharedMemory(create=True, size=nbytes)
+            self._blocks[field] = block
+            self._arrays[field] = np.ndarray(self.shape, dtype=np.float64, buffer=block.buf)
+
+        names = {field: block.name for field, block in self._blocks.items()}
+        self._pool = multiprocessing.get_context().Pool(
+            processes=min(self.workers, len(self.slabs)), initializer=_attach, initargs=(names, self.shape)
+        )
+
+        log.debug("🧵 SlabPredictor: %d slabs %s, halo=%d", len(self.slabs), self.slabs, halo)
+
+    def predict(self, store: Any, params: SolverParameters) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Predictor (vx*, vy*, vz*) of store, computed slab-parallel.
+
+        Same values as update_velocity_grid(store, params); the returned
+        arrays are copies owned by the caller.
+        """
+        if tuple(store.shape) != self.shape:
+            raise ValueError(f"FieldStore shape {store.shape} does not match the pool shape {self.shape}")
+        for name in FIELD_NAMES:
+            np.copyto(self._arrays[name], getattr(store, name))
+
+        tasks = [(bounds, params, self.halo) for bounds in self.slabs]
+        self._pool.starmap(_predict_slab, tasks)
+        return tuple(self._arrays[name].copy() for name in OUTPUT_NAMES)
+
+    def close(self) -> None:
+        """Stop the workers and unlink the shared memory."""
+        if self._pool is None:
+            return
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+        self._arrays.clear()
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self) -> "SlabPredictor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -3,10 +3,21 @@
 #
 # Provides a single entry point for solver modules to access dt, rho, mu, dx, dy, dz, Fx, Fy, Fz.
 # Raises explicit KeyError or ValueError if required blocks or fields are missing/invalid.
+#
+# load_solver_parameters validates the config on every call and returns a dict.
+# Hot paths should call build_solver_parameters once per run and pass the
+# resulting immutable SolverParameters object down instead.
 
+from dataclasses import dataclass, asdict
 from typing import Dict, Any
 
-debug = False  # toggle for verbose logging
+from src.solver_logging import get_logger
+
+log = get_logger(__name__)
+
+# Advection schemes selectable via simulation_parameters.advection_scheme
+ADVECTION_SCHEMES = ("central", "upwind", "quick")
+DEFAULT_ADVECTION_SCHEME = "central"
 
 
 def load_solver_parameters(config: Dict[str, Any]) -> Dict[str, float]:
@@ -74,10 +85,71 @@ def load_solver_parameters(config: Dict[str, Any]) -> Dict[str, float]:
         "Fx": Fx, "Fy": Fy, "Fz": Fz
     }
 
-    if debug:
-        print(f"[Parameter Loader] Solver parameters loaded: {out}")
+    log.debug("[Parameter Loader] Solver parameters loaded: %s", out)
 
     return out
 
 
+def load_advection_scheme(config: Dict[str, Any]) -> str:
+    """
+    Return the advection scheme from simulation_parameters.advection_scheme.
+
+    Defaults to "central" (the per-cell adv_vx/adv_vy/adv_vz behavior).
+
+    Raises:
+        ValueError: if the scheme is not one of ADVECTION_SCHEMES.
+    """
+    sim = config.get("simulation_parameters", {})
+    scheme = sim.get("advection_scheme", DEFAULT_ADVECTION_SCHEME)
+    if scheme not in ADVECTION_SCHEMES:
+        raise ValueError(f"Invalid 'advection_scheme': {scheme}. Expected one of {ADVECTION_SCHEMES}.")
+    log.debug("[Parameter Loader] Advection scheme: %s", scheme)
+    return scheme
+
+
+@dataclass(frozen=True, slots=True)
+class SolverParameters:
+    """
+    Immutable, pre-validated solver parameters for one run.
+
+    Built once by build_solver_parameters(config). Supports attribute access
+    (params.dx) and, for compatibility with the dict API, item access (params["dx"]).
+    """
+    dt: float
+    rho: float
+    mu: float
+    dx: float
+    dy: float
+    dz: float
+    Fx: float
+    Fy: float
+    Fz: float
+    advection_scheme: str = DEFAULT_ADVECTION_SCHEME
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return the load_solver_parameters() dict for this object."""
+        out = asdict(self)
+        out.pop("advection_scheme")
+        return out
+
+
+def build_solver_parameters(config: Dict[str, Any]) -> SolverParameters:
+    """
+    Validate config once and return an immutable SolverParameters.
 
+    Raises:
+        KeyError / ValueError: same conditions as load_solver_parameters
+        and load_advection_scheme.
+    """
+    params = SolverParameters(
+        **load_solver_parameters(config),
+        advection_scheme=load_advection_scheme(config),
+    )
+    log.debug("[Parameter Loader] SolverParameters built: %s", params)
+    return params
@@ -0,0 +1,83 @@
+# src/step_2_time_stepping_loop/predictor_backend.py
+# 🏎️ Phase 1 predictor backends — per-cell dict, NumPy arrays, or Numba
+#
+#   v_* = v^n + (Δt/ρ)[ μ ∇²v^n − ρ Adv(v)^n − ∇p^n + F ]      (see mac_update_velocity.py)
+#
+# Backends:
+#   "python" — update_velocity_x/y/z per cell on the cell_dict (reference)
+#   "numpy"  — fused whole-grid predictor on FieldStore arrays (update_velocity_grid)
+#   "numba"  — compiled per-cell loop (predictor_numba.py), parallel over z
+#
+# Selection: env var FLUID_SOLVER_BACKEND, else
+# simulation_parameters.predictor_backend, else "python". "numba" falls back to
+# "numpy" when numba cannot be imported.
+
+import logging
+import os
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_2_time_stepping_loop.mac_update_velocity import update_velocity_grid
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+
+try:
+    from src.step_2_time_stepping_loop.predictor_numba import SCHEME_CODES, predict_kernel
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+log = get_logger(__name__)
+
+PREDICTOR_BACKENDS = ("python", "numpy", "numba")
+DEFAULT_PREDICTOR_BACKEND = "python"
+BACKEND_ENV = "FLUID_SOLVER_BACKEND"
+
+
+def select_predictor_backend(config: Dict[str, Any]) -> str:
+    """
+    Resolve the predictor backend from the environment or the config.
+
+    Raises:
+        ValueError: if the requested backend is not in PREDICTOR_BACKENDS.
+    """
+    requested = os.environ.get(BACKEND_ENV) or \
+        config.get("simulation_parameters", {}).get("predictor_backend", DEFAULT_PREDICTOR_BACKEND)
+    if requested not in PREDICTOR_BACKENDS:
+        raise ValueError(f"Invalid predictor backend: {requested}. Expected one of {PREDICTOR_BACKENDS}.")
+    if requested == "numba" and not HAVE_NUMBA:
+        log.debug("🏎️ numba not importable → using the NumPy predictor")
+        return "numpy"
+    return requested
+
+
+def predict_velocity_numba(store: Any, params: SolverParameters) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Predictor (vx*, vy*, vz*) for every cell with the compiled kernel."""
+    out = tuple(np.empty(store.shape, dtype=np.float64) for _ in range(3))
+    predict_kernel(store.pressure, store.vx, store.vy, store.vz,
+                   params.dt, params.rho, params.mu, params.dx, params.dy, params.dz,
+                   params.Fx, params.Fy, params.Fz, SCHEME_CODES[params.advection_scheme], *out)
+    return out
+
+
+def predict_velocity(store: Any, params: SolverParameters, backend: str = "numpy",
+                     terms: bool = False):
+    """
+    Predictor for a whole FieldStore with an array backend ("numpy" or "numba").
+
+    With terms=True returns (v_star, magnitudes) as update_velocity_grid does;
+    the compiled kernel does not expose its terms, so this always runs the
+    NumPy path.
+    """
+    if backend not in ("numpy", "numba"):
+        raise ValueError(f"Backend '{backend}' does not run on arrays.")
+    if terms:
+        return update_velocity_grid(store, params, terms=True)
+    if backend == "numba" and HAVE_NUMBA:
+        out = predict_velocity_numba(store, params)
+    else:
+        out = update_velocity_grid(store, params)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🏎️ Predictor (%s): max|v*|=%s", backend, [float(np.abs(v).max()) for v in out])
+    return out
@@ -0,0 +1,61 @@
+# src/step_2_time_stepping_loop/pressure_fft.py
+# 🌊 Phase 2: Spectral Poisson Solve — DCT-II for all-fluid, all-Neumann boxes
+#
+# On a box without solid cells and without pressure-Dirichlet roles the compact
+# 7-point −∇² with zero-gradient edges is diagonalised by the type-II discrete
+# cosine transform along every axis. Mode m of an axis with n cells and spacing h
+# has eigenvalue
+#
+#   λ_m = (2 − 2 cos(π m / n)) / h²
+#
+# so −∇²φ = b becomes φ̂ = b̂ / (λ_x + λ_y + λ_z): two transforms, no iteration,
+# O(N log N). The (0, 0, 0) mode is the Neumann null space and is set to zero,
+# which returns the zero-mean solution, same as the CG path.
+
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from scipy import fft
+
+from src.solver_logging import get_logger
+
+log = get_logger(__name__)
+
+
+def spectral_eligible(active: np.ndarray, dirichlet: np.ndarray) -> bool:
+    """True when every cell is in the system and no cell fixes pressure."""
+    return bool(active.all()) and not bool(dirichlet.any())
+
+
+class SpectralPoissonSolver:
+    """
+    Direct DCT-based solver for −∇²φ = rhs on a uniform all-Neumann box.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Grid resolution (nx, ny, nz).
+    spacings : tuple of float
+        Uniform (dx, dy, dz).
+    """
+
+    def __init__(self, shape: Tuple[int, int, int], spacings: Tuple[float, float, float]):
+        self.shape = tuple(shape)
+        eig = np.zeros(self.shape)
+        for axis, (n, h) in enumerate(zip(self.shape, spacings)):
+            lam = (2.0 - 2.0 * np.cos(np.pi * np.arange(n) / n)) / h ** 2
+            view = [1, 1, 1]
+            view[axis] = n
+            eig = eig + lam.reshape(view)
+        eig[0, 0, 0] = 1.0  # null-space mode, zeroed in solve()
+        self._inv_eig = 1.0 / eig
+        self._inv_eig[0, 0, 0] = 0.0
+
+    def solve(self, rhs: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Return the zero-mean φ shaped (nx, ny, nz) and an info dict."""
+        coeffs = fft.dctn(rhs, type=2, norm="ortho")
+        coeffs *= self._inv_eig
+        phi = fft.idctn(coeffs, type=2, norm="ortho")
+        info = {"method": "fft", "iterations": 0, "residual": None, "converged": True}
+        log.debug("🌊 Spectral pressure solve on %s", self.shape)
+        return phi, info
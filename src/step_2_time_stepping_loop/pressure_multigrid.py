@@ -0,0 +1,130 @@
+# src/step_2_time_stepping_loop/pressure_multigrid.py
+# 🪜 Phase 2: Geometric Multigrid — V/W-cycle for the pressure Poisson system
+#
+# Hierarchy: each coarse cell (I, J, K) is the 2×2×2 block of fine cells
+# (2I..2I+1, 2J..2J+1, 2K..2K+1). Only blocks containing at least one unknown
+# fine cell exist on the coarse level, so solid cells (and Dirichlet cells) never
+# enter the hierarchy:
+#   - prolongation P: piecewise constant over the unknown cells of a block
+#   - restriction R = Pᵀ: sum of the fine residuals of a block
+#   - coarse operator A_c = Pᵀ A P (Galerkin), again a 7-point operator
+# Smoother: red-black Gauss–Seidel, colour = (i + j + k) mod 2 on each level.
+# The 7-point graph only couples opposite colours, so each half-sweep is one
+# sparse mat-vec. Pre-smoothing runs red→black and post-smoothing black→red,
+# which keeps the cycle symmetric so it can precondition conjugate gradients.
+# Coarsest level: dense pseudo-inverse (handles the all-Neumann null space).
+
+from typing import List
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from src.solver_logging import get_logger
+
+log = get_logger(__name__)
+
+MULTIGRID_CYCLES = ("V", "W")
+COARSEST_UNKNOWNS = 64  # stop coarsening at or below this many unknowns
+
+
+class _Level:
+    """Operator, colour split and transfer matrix for one grid level."""
+
+    __slots__ = ("shape", "A", "colours", "off_colour", "inv_diag", "P")
+
+    def __init__(self, A: sp.csr_matrix, coords: np.ndarray, shape: tuple):
+        self.shape = shape
+        self.A = A
+        parity = coords.sum(axis=1) % 2
+        self.colours = (np.flatnonzero(parity == 0), np.flatnonzero(parity == 1))
+        diag = A.diagonal()
+        red, black = self.colours
+        self.inv_diag = (1.0 / diag[red], 1.0 / diag[black])
+        self.off_colour = (A[red][:, black].tocsr(), A[black][:, red].tocsr())
+        self.P = None  # fine → coarse prolongation, set when a coarser level exists
+
+
+class MultigridHierarchy:
+    """
+    Geometric multigrid for the PoissonSystem operator.
+
+    Parameters
+    ----------
+    A : scipy.sparse matrix
+        SPD (or all-Neumann semi-definite) 7-point operator over the unknowns.
+    unknown_flat : np.ndarray
+        Flat (x-major) grid index of each unknown, in matrix order.
+    shape : tuple of int
+        Fine grid resolution (nx, ny, nz).
+    cycle : {"V", "W"}
+        Cycle type.
+    sweeps : int
+        Red-black sweeps before and after each coarse correction.
+    """
+
+    def __init__(self, A: sp.csr_matrix, unknown_flat: np.ndarray, shape: tuple,
+                 cycle: str = "V", sweeps: int = 2):
+        if cycle not in MULTIGRID_CYCLES:
+            raise ValueError(f"Invalid multigrid cycle: {cycle}. Expected one of {MULTIGRID_CYCLES}.")
+        if sweeps < 1:
+            raise ValueError(f"Invalid multigrid smoothing sweeps: {sweeps}")
+        self.cycle_type = cycle
+        self.sweeps = sweeps
+
+        nx, ny, _ = shape
+        coords = np.stack([unknown_flat % nx, (unknown_flat // nx) % ny, unknown_flat // (nx * ny)], axis=1)
+        self.levels: List[_Level] = [_Level(A.tocsr(), coords, tuple(shape))]
+
+        while self.levels[-1].A.shape[0] > COARSEST_UNKNOWNS and max(self.levels[-1].shape) > 1:
+            fine = self.levels[-1]
+            coarse_shape = tuple((n + 1) // 2 for n in fine.shape)
+            cnx, cny, _ = coarse_shape
+            block = coords // 2
+            block_flat = block[:, 0] + cnx * (block[:, 1] + cny * block[:, 2])
+            coarse_flat, inverse = np.unique(block_flat, return_inverse=True)
+            n_fine, n_coarse = coords.shape[0], coarse_flat.size
+            fine.P = sp.csr_matrix((np.ones(n_fine), (np.arange(n_fine), inverse)), shape=(n_fine, n_coarse))
+            A_c = (fine.P.T @ fine.A @ fine.P).tocsr()
+            coords = np.stack([coarse_flat % cnx, (coarse_flat // cnx) % cny, coarse_flat // (cnx * cny)], axis=1)
+            self.levels.append(_Level(A_c, coords, coarse_shape))
+
+        self._coarse_inverse = np.linalg.pinv(self.levels[-1].A.toarray())
+
+        log.debug("🪜 Multigrid hierarchy: %d levels, unknowns per level=%s",
+                  len(self.levels), [lvl.A.shape[0] for lvl in self.levels])
+
+    # ---------------- Cycle ----------------
+
+    def _smooth(self, level: _Level, x: np.ndarray, b: np.ndarray, order: tuple) -> None:
+        for colour in order:
+            idx = level.colours[colour]
+            other = level.colours[1 - colour]
+            x[idx] = (b[idx] - level.off_colour[colour] @ x[other]) * level.inv_diag[colour]
+
+    def _cycle(self, depth: int, b: np.ndarray) -> np.ndarray:
+        if depth == len(self.levels) - 1:
+            return self._coarse_inverse @ b
+
+        level = self.levels[depth]
+        x = np.zeros_like(b)
+        for _ in range(self.sweeps):
+            self._smooth(level, x, b, (0, 1))
+
+        r_c = level.P.T @ (b - level.A @ x)
+        e_c = self._cycle(depth + 1, r_c)
+        if self.cycle_type == "W":
+            e_c += self._cycle(depth + 1, r_c - self.levels[depth + 1].A @ e_c)
+        x += level.P @ e_c
+
+        for _ in range(self.sweeps):
+            self._smooth(level, x, b, (1, 0))
+        return x
+
+    def apply(self, b: np.ndarray) -> np.ndarray:
+        """One cycle with zero initial guess: an approximation of A⁻¹ b."""
+        return self._cycle(0, np.asarray(b, dtype=np.float64))
+
+    def as_preconditioner(self) -> spla.LinearOperator:
+        """Wrap the (symmetric) cycle as a LinearOperator for scipy's cg."""
+        return spla.LinearOperator(self.levels[0].A.shape, matvec=self.apply, dtype=np.float64)
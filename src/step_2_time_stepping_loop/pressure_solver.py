@@ -0,0 +1,385 @@
+# src/step_2_time_stepping_loop/pressure_solver.py
+# 💧 Phase 2: Pressure Projection — sparse Poisson solve for the pressure increment
+#
+# Incremental projection: the predictor already contains −∇pⁿ, so Phase 2 solves
+#
+#   ∇²φ = (ρ/Δt) ∇·v*        p^{n+1} = pⁿ + φ        v^{n+1} = v* − (Δt/ρ) ∇φ
+#
+# ∇² is the compact 7-point Laplacian on the uniform dx/dy/dz grid:
+#   - domain edges and fluid–solid faces: zero normal gradient (Neumann), the same
+#     "ghost = current cell" fallback used by grad_p_x/y/z
+#   - cells whose boundary role applies "pressure": Dirichlet, φ = p_bc − p*
+#   - solid cells, and fluid cells walled in by solids on every side, are not
+#     part of the system (φ = 0)
+#
+# It is −D·G for the staggered pair the projection uses: G is the forward-
+# difference pressure_gradient_grid and D the backward-difference
+# mac_divergence_grid, both with zero flux through closed faces. With that pair
+# the corrected velocity satisfies D·v^{n+1} = 0 to the solver tolerance.
+#
+# The system is assembled once per geometry as a symmetric positive (semi-)definite
+# scipy.sparse matrix A = −∇² and solved with preconditioned conjugate gradients.
+# Every connected region of active cells without a Dirichlet cell (the whole box
+# when there is no outlet, or a fluid pocket sealed off by solids) makes A
+# singular; the RHS is projected to zero mean over each such region and the
+# solution is returned with zero mean there. A solve that stops short of the
+# tolerance is logged as a warning.
+#
+# pressure_solver.method:
+#   "cg"        — CG with the Jacobi / IC(0) / no preconditioner
+#   "multigrid" — CG preconditioned by one geometric multigrid V- or W-cycle
+#                 (pressure_multigrid.py), roughly O(N) work per solve
+#   "fft"       — direct DCT solve (pressure_fft.py); only valid without solid
+#                 cells and pressure-Dirichlet roles, otherwise falls back to "cg"
+#   "auto"      — "fft" when the geometry allows it, else "cg" (the default)
+
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+from scipy.sparse.csgraph import connected_components
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.field_store import SOLID
+from src.step_1_solver_initialization.run_length_mask import sparse_mask
+from src.step_2_time_stepping_loop.boundary_utils import pressure_dirichlet_grid
+from src.step_2_time_stepping_loop.mac_gradients import mac_divergence_grid
+from src.step_2_time_stepping_loop.pressure_fft import SpectralPoissonSolver, spectral_eligible
+from src.step_2_time_stepping_loop.pressure_multigrid import MULTIGRID_CYCLES, MultigridHierarchy
+
+log = get_logger(__name__)
+
+PRESSURE_METHODS = ("auto", "cg", "multigrid", "fft")
+PRECONDITIONERS = ("jacobi", "ic", "none")
+DEFAULT_PRESSURE_SETTINGS = {
+    "method": "auto",
+    "tolerance": 1e-6,
+    "preconditioner": "jacobi",
+    "max_iterations": None,
+    "cycle": "V",
+    "smoothing_sweeps": 2,
+}
+
+
+class PressureSolverError(Exception):
+    """Raised when the pressure Poisson solve breaks down."""
+
+
+def load_pressure_solver_settings(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Read the optional pressure_solver block, filling defaults.
+
+    Keys: method, tolerance, preconditioner, max_iterations, and for
+    method "multigrid" also cycle ("V"/"W") and smoothing_sweeps.
+
+    Raises:
+        ValueError: if any setting is invalid.
+    """
+    settings = dict(DEFAULT_PRESSURE_SETTINGS)
+    settings.update(config.get("pressure_solver") or {})
+
+    if settings["method"] not in PRESSURE_METHODS:
+        raise ValueError(f"Invalid pressure_solver 'method': {settings['method']}. Expected one of {PRESSURE_METHODS}.")
+    if settings["preconditioner"] not in PRECONDITIONERS:
+        raise ValueError(f"Invalid pressure_solver 'preconditioner': {settings['preconditioner']}. "
+                         f"Expected one of {PRECONDITIONERS}.")
+    tol = settings["tolerance"]
+    if not isinstance(tol, (int, float)) or tol <= 0:
+        raise ValueError(f"Invalid pressure_solver 'tolerance': {tol}")
+    max_it = settings["max_iterations"]
+    if max_it is not None and (not isinstance(max_it, int) or max_it <= 0):
+        raise ValueError(f"Invalid pressure_solver 'max_iterations': {max_it}")
+    if settings["cycle"] not in MULTIGRID_CYCLES:
+        raise ValueError(f"Invalid pressure_solver 'cycle': {settings['cycle']}. Expected one of {MULTIGRID_CYCLES}.")
+    sweeps = settings["smoothing_sweeps"]
+    if not isinstance(sweeps, int) or sweeps < 1:
+        raise ValueError(f"Invalid pressure_solver 'smoothing_sweeps': {sweeps}")
+
+    log.debug("💧 Pressure solver settings: %s", settings)
+    return settings
+
+
+def coupled_cells(active: np.ndarray) -> np.ndarray:
+    """Active cells with at least one open face (an active neighbour)."""
+    coupled = np.zeros(active.shape, dtype=bool)
+    for axis in range(3):
+        lo = [slice(None)] * 3
+        hi = [slice(None)] * 3
+        lo[axis] = slice(None, -1)
+        hi[axis] = slice(1, None)
+        face = active[tuple(lo)] & active[tuple(hi)]
+        coupled[tuple(lo)] |= face
+        coupled[tuple(hi)] |= face
+    return coupled
+
+
+class PoissonSystem:
+    """
+    Sparse −∇² operator for one geometry, plus the coupling to Dirichlet cells.
+
+    Unknowns are the active (non-solid), non-Dirichlet cells in flat_index order.
+    Built once per run and reused every timestep; preconditioners are cached.
+    """
+
+    def __init__(self, active: np.ndarray, dirichlet: np.ndarray, spacings: Tuple[float, float, float]):
+        self.shape = active.shape
+        self.spacings = tuple(spacings)
+        n_cells = active.size
+
+        active_flat = active.ravel(order="F")
+        dirichlet_flat = dirichlet.ravel(order="F") & active_flat
+        # a cell walled in by solids on every side has no equation (φ = 0 there)
+        coupled_flat = coupled_cells(active).ravel(order="F")
+        self.unknown_flat = np.flatnonzero(active_flat & ~dirichlet_flat & coupled_flat)
+        self.dirichlet_flat = np.flatnonzero(dirichlet_flat)
+        self.n_unknowns = self.unknown_flat.size
+
+        number = np.full(n_cells, -1, dtype=np.int64)
+        number[self.unknown_flat] = np.arange(self.n_unknowns)
+        d_number = np.full(n_cells, -1, dtype=np.int64)
+        d_number[self.dirichlet_flat] = np.arange(self.dirichlet_flat.size)
+
+        flat_ids = np.arange(n_cells).reshape(self.shape, order="F")
+        diag = np.zeros(self.n_unknowns)
+        rows, cols, vals = [], [], []
+        b_rows, b_cols, b_vals = [], [], []
+
+        for axis in range(3):
+            if self.shape[axis] < 2:
+                continue
+            weight = 1.0 / self.spacings[axis] ** 2
+            lo = [slice(None)] * 3
+            hi = [slice(None)] * 3
+            lo[axis] = slice(None, -1)
+            hi[axis] = slice(1, None)
+            open_face = active[tuple(lo)] & active[tuple(hi)]
+            a = flat_ids[tuple(lo)][open_face]
+            b = flat_ids[tuple(hi)][open_face]
+            ua, ub = number[a], number[b]
+
+            # every open face adds its weight to the diagonal of an unknown endpoint
+            np.add.at(diag, ua[ua >= 0], weight)
+            np.add.at(diag, ub[ub >= 0], weight)
+
+            both = (ua >= 0) & (ub >= 0)
+            rows += [ua[both], ub[both]]
+            cols += [ub[both], ua[both]]
+            vals += [np.full(2 * int(both.sum()), -weight)]
+
+            # unknown next to a Dirichlet cell: known value moves to the RHS
+            for u, d in ((ua, d_number[b]), (ub, d_number[a])):
+                m = (u >= 0) & (d >= 0)
+                b_rows.append(u[m])
+                b_cols.append(d[m])
+                b_vals.append(np.full(int(m.sum()), weight))
+
+        n = self.n_unknowns
+        rows.append(np.arange(n))
+        cols.append(np.arange(n))
+        vals.append(diag)
+        self.A = sp.csr_matrix(
+            (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))), shape=(n, n)
+        )
+        self.B = sp.csr_matrix(
+            (np.concatenate(b_vals) if b_vals else np.zeros(0),
+             (np.concatenate(b_rows) if b_rows else np.zeros(0, dtype=np.int64),
+              np.concatenate(b_cols) if b_cols else np.zeros(0, dtype=np.int64))),
+            shape=(n, self.dirichlet_flat.size),
+        )
+        # regions of unknowns not coupled to any Dirichlet cell float: their
+        # pressure is fixed only up to a constant
+        n_regions, self.region = connected_components(self.A, directed=False)
+        anchored = np.zeros(n_regions, dtype=bool)
+        anchored[self.region[np.unique(self.B.tocoo().row)]] = True
+        self.floating = ~anchored[self.region]
+        self.singular = bool(self.floating.any())
+        self._preconditioners: Dict[str, Any] = {}
+
+        log.debug("💧 PoissonSystem: unknowns=%d, dirichlet=%d, nnz=%d, singular=%s",
+                  n, self.dirichlet_flat.size, self.A.nnz, self.singular)
+
+    # ---------------- Preconditioners ----------------
+
+    def preconditioner(self, kind: str):
+        """Return (and cache) a LinearOperator applying M⁻¹ for kind in PRECONDITIONERS."""
+        if kind == "none" or self.n_unknowns == 0:
+            return None
+        if kind not in self._preconditioners:
+            if kind == "jacobi":
+                inv_diag = 1.0 / self.A.diagonal()
+                m = spla.LinearOperator(self.A.shape, matvec=lambda x: inv_diag * x, dtype=np.float64)
+            elif kind == "ic":
+                m = self._incomplete_cholesky()
+            else:
+                raise ValueError(f"Unknown preconditioner '{kind}'. Expected one of {PRECONDITIONERS}.")
+            self._preconditioners[kind] = m
+        return self._preconditioners[kind]
+
+    def _incomplete_cholesky(self):
+        """
+        IC(0) as M = (D + L) D⁻¹ (D + Lᵀ), with L the strict lower part of A.
+
+        The 7-point graph has no triangles, so zero-fill IC only modifies the
+        diagonal: d_i = a_ii − Σ_{j<i} a_ij² / d_j. Lower neighbours of a cell lie
+        on the previous i+j+k hyperplane, so d is computed one wavefront at a time.
+        A singular (all-Neumann) A gets a tiny diagonal shift so the factor exists.
+        """
+        a_diag = self.A.diagonal()
+        if self.singular:
+            a_diag = a_diag * (1.0 + 1e-8)
+        lower = sp.tril(self.A, k=-1).tocoo()
+
+        nx, ny, _ = self.shape
+        flat = self.unknown_flat
+        level = flat % nx + (flat // nx) % ny + flat // (nx * ny)
+        entry_level = level[lower.row]
+        order = np.argsort(entry_level, kind="stable")
+        rows, cols, vals = lower.row[order], lower.col[order], lower.data[order]
+        bounds = np.searchsorted(entry_level[order], np.arange(level.max() + 2))
+
+        d = a_diag.copy()
+        for lev in range(level.max() + 1):
+            sl = slice(bounds[lev], bounds[lev + 1])
+            np.subtract.at(d, rows[sl], vals[sl] ** 2 / d[cols[sl]])
+
+        d_mat = sp.diags(d)
+        forward = spla.splu((d_mat + lower).tocsc(), permc_spec="NATURAL", diag_pivot_thresh=0.0)
+        backward = spla.splu((d_mat + lower.T).tocsc(), permc_spec="NATURAL", diag_pivot_thresh=0.0)
+
+        def apply(x):
+            return backward.solve(d * forward.solve(x))
+
+        return spla.LinearOperator(self.A.shape, matvec=apply, dtype=np.float64)
+
+    # ---------------- Solve ----------------
+
+    def multigrid(self, cycle: str = "V", sweeps: int = 2) -> MultigridHierarchy:
+        """Return (and cache) the multigrid hierarchy built on A."""
+        key = ("multigrid", cycle, sweeps)
+        if key not in self._preconditioners:
+            self._preconditioners[key] = MultigridHierarchy(self.A, self.unknown_flat, self.shape, cycle, sweeps)
+        return self._preconditioners[key]
+
+    def _remove_floating_mean(self, x: np.ndarray) -> np.ndarray:
+        """x minus its mean over each floating region (anchored unknowns unchanged)."""
+        sums = np.bincount(self.region, weights=x)
+        sizes = np.bincount(self.region)
+        return x - np.where(self.floating, (sums / sizes)[self.region], 0.0)
+
+    def solve(self, rhs: np.ndarray, dirichlet_values: np.ndarray, tolerance: float,
+              preconditioner: Any = "jacobi", max_iterations: int | None = None
+              ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Solve −∇²φ = rhs on the unknown cells with φ = dirichlet_values on Dirichlet cells.
+
+        Parameters
+        ----------
+        rhs : np.ndarray
+            (nx, ny, nz) right-hand side of −∇²φ = rhs (only unknown cells are read).
+        dirichlet_values : np.ndarray
+            (nx, ny, nz) array holding φ on Dirichlet cells.
+        tolerance : float
+            Relative residual target ‖b − Aφ‖ / ‖b‖.
+        preconditioner : str or LinearOperator
+            One of PRECONDITIONERS, or a ready operator (e.g. a multigrid cycle).
+
+        Returns
+        -------
+        (phi, info) : tuple
+            phi shaped (nx, ny, nz) (0 on solid cells) and a dict with
+            iterations, residual and converged.
+        """
+        phi_flat = np.zeros(int(np.prod(self.shape)))
+        g = dirichlet_values.ravel(order="F")[self.dirichlet_flat]
+        phi_flat[self.dirichlet_flat] = g
+        info = {"iterations": 0, "residual": 0.0, "converged": True}
+
+        if self.n_unknowns:
+            b = rhs.ravel(order="F")[self.unknown_flat] + self.B @ g
+            if self.singular:
+                b = self._remove_floating_mean(b)
+            b_norm = float(np.linalg.norm(b))
+            if b_norm > 0.0:
+                iterations = [0]
+
+                def count(_xk):
+                    iterations[0] += 1
+
+                if isinstance(preconditioner, str):
+                    preconditioner = self.preconditioner(preconditioner)
+                x, status = spla.cg(self.A, b, rtol=tolerance, atol=0.0, maxiter=max_iterations,
+                                    M=preconditioner, callback=count)
+                if status < 0:
+                    raise PressureSolverError(f"Conjugate gradient breakdown (status={status}).")
+                if self.singular:
+                    x = self._remove_floating_mean(x)
+                residual = float(np.linalg.norm(b - self.A @ x)) / b_norm
+                info = {"iterations": iterations[0], "residual": residual, "converged": status == 0}
+                phi_flat[self.unknown_flat] = x
+                if status > 0:
+                    log.warning("⚠️ Pressure solve did not converge: %d iterations, relative residual %.3e "
+                                "(tolerance %.1e)", iterations[0], residual, tolerance)
+
+        log.debug("💧 Pressure solve: %s", info)
+        return phi_flat.reshape(self.shape, order="F"), info
+
+
+class PressureProjection:
+    """
+    Phase 2 driver object: holds the assembled Poisson system (or spectral
+    solver) for one geometry and the pressure_solver settings. Build once per
+    run with the first predictor field and call project() every timestep.
+
+    ``method`` is the resolved solver: "auto" and "fft" become "fft" only when
+    the geometry has no solid cells and no pressure-Dirichlet roles.
+    ``roles`` is the run's boundary_role RunLengthMask, for the boundary
+    overrides of later steps.
+    """
+
+    def __init__(self, store: Any, config: Dict[str, Any], params: Any):
+        self.settings = load_pressure_solver_settings(config)
+        self.params = params
+        # boundary_role mask for the whole run: the driver reuses it every step
+        self.roles = sparse_mask(store, "boundary_role")
+        self.dirichlet, self.dirichlet_pressure = pressure_dirichlet_grid(store, config, self.roles)
+        self.active = store.cell_type != SOLID
+        spacings = (params.dx, params.dy, params.dz)
+
+        self.method = self.settings["method"]
+        if self.method in ("auto", "fft"):
+            self.method = "fft" if spectral_eligible(self.active, self.dirichlet) else "cg"
+            if self.settings["method"] == "fft" and self.method == "cg":
+                log.debug("💧 FFT pressure solve not applicable (solids or pressure Dirichlet) → falling back to CG")
+
+        self.spectral = SpectralPoissonSolver(store.shape, spacings) if self.method == "fft" else None
+        self.system = None if self.spectral else PoissonSystem(self.active, self.dirichlet, spacings)
+
+    def project(self, star: Any) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Solve for the pressure increment φ from the predictor field star.
+
+        Returns φ shaped (nx, ny, nz) and the solver info dict.
+        """
+        p = self.params
+        # staggered D with closed solid faces: −D·G is the assembled operator
+        div = mac_divergence_grid(star, p.dx, p.dy, p.dz, active=self.active)
+        # ∇²φ = (ρ/Δt) ∇·v*  →  −∇²φ = −(ρ/Δt) ∇·v*
+        rhs = div * (-p.rho / p.dt)
+        if self.spectral is not None:
+            return self.spectral.solve(rhs)
+
+        increment = np.where(self.dirichlet, self.dirichlet_pressure - star.pressure, 0.0)
+        settings = self.settings
+        preconditioner = settings["preconditioner"]
+        if self.method == "multigrid" and self.system.n_unknowns:
+            hierarchy = self.system.multigrid(settings["cycle"], settings["smoothing_sweeps"])
+            preconditioner = hierarchy.as_preconditioner()
+        phi, info = self.system.solve(
+            rhs, increment,
+            tolerance=settings["tolerance"],
+            preconditioner=preconditioner,
+            max_iterations=settings["max_iterations"],
+        )
+        info["method"] = self.method
+        return phi, info
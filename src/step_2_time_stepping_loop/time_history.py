@@ -0,0 +1,272 @@
+# src/step_2_time_stepping_loop/time_history.py
+# 🕰️ Step 2: Time History — bounded retention of committed time levels
+#
+# Every committed step used to stay in cell["time_history"] forever, together
+# with its "{t}_predictor" staging entry. A RetentionPolicy keeps only
+#   - the last K committed steps (simulation_parameters.history_retention)
+#   - the newest M older steps aligned to simulation_parameters.output_interval
+#     (simulation_parameters.max_snapshots)
+# FieldRing holds the last K levels as FieldStore arrays in a fixed ring of
+# preallocated slots; output-aligned levels leaving the ring are kept as
+# snapshots, at most M of them, the oldest recycled first. A run therefore
+# holds at most K + M levels however long it is, even at output_interval=1;
+# writers that need every output level must read it before it is recycled.
+# The first output level a ring recycles logs a warning, later ones log at
+# debug (raise max_snapshots, or set it to 0 to keep no output levels behind
+# the ring and silence it).
+# prune_time_history applies the same policy to a cell_dict.
+#
+# While timestep_driver advances a cell_dict it tracks that cell_dict's current
+# committed step (tracking / set_current_step), so "latest timestep" lookups in
+# the per-cell operators resolve in O(1) instead of scanning time_history keys.
+# The tracked step is bound to that one cell_dict and cleared when the driver
+# call returns; every other lookup scans.
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+from src.solver_logging import get_logger
+from src.step_1_solver_initialization.field_store import FIELD_NAMES
+
+log = get_logger(__name__)
+
+DEFAULT_HISTORY_RETENTION = 2  # current level plus the one being built from it
+DEFAULT_MAX_SNAPSHOTS = 8  # output-aligned levels kept behind the ring
+
+# Current committed step of the cell_dict being advanced (O(1) "latest" lookups)
+_tracked = {"owner": None, "step": None}
+
+# id() of the cell_dict prune_time_history last warned about (warn once per run)
+_warned_prune = {"owner": None}
+
+
+@contextmanager
+def tracking(cell_dict: Dict[Any, Any], step: int) -> Iterator[None]:
+    """
+    Track step as cell_dict's latest committed step for the body of the block.
+
+    The previous tracker (normally none) is restored on exit, so nothing
+    outlives the driver call that owns cell_dict.
+    """
+    previous = dict(_tracked)
+    _tracked.update(owner=cell_dict, step=int(step))
+    try:
+        yield
+    finally:
+        _tracked.update(previous)
+
+
+def set_current_step(cell_dict: Dict[Any, Any], step: int) -> None:
+    """
+    Advance the tracked step of cell_dict inside tracking().
+
+    Raises:
+        KeyError: if cell_dict is not the tracked one.
+    """
+    if _tracked["owner"] is not cell_dict:
+        raise KeyError("set_current_step() outside tracking() for this cell_dict.")
+    _tracked["step"] = int(step)
+    log.debug("🕰️ Current step → %d", _tracked["step"])
+
+
+def current_step(cell_dict: Dict[Any, Any]) -> int | None:
+    """Tracked step of cell_dict, or None when no driver call is advancing it."""
+    return _tracked["step"] if _tracked["owner"] is cell_dict else None
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    """Which committed steps to keep, relative to the latest one."""
+
+    keep_last: int = DEFAULT_HISTORY_RETENTION
+    output_interval: int = 1
+    max_snapshots: int = DEFAULT_MAX_SNAPSHOTS
+
+    def is_output_step(self, step: int) -> bool:
+        return step % self.output_interval == 0
+
+    def retains(self, step: int, latest: int) -> bool:
+        if latest - step < self.keep_last:
+            return True
+        if not self.is_output_step(step):
+            return False
+        # newest output step that has already left the last-K window
+        newest = (latest - self.keep_last) // self.output_interval * self.output_interval
+        return (newest - step) // self.output_interval < self.max_snapshots
+
+
+def load_retention_policy(config: Dict[str, Any]) -> RetentionPolicy:
+    """
+    Build the RetentionPolicy from simulation_parameters.
+
+    Raises:
+        KeyError: if output_interval is missing.
+        ValueError: if output_interval or history_retention is not a positive
+            integer, or max_snapshots is not a non-negative integer.
+    """
+    sim = config["simulation_parameters"]
+    if "output_interval" not in sim:
+        raise KeyError("Missing simulation parameter: 'output_interval'")
+    interval = sim["output_interval"]
+    keep_last = sim.get("history_retention", DEFAULT_HISTORY_RETENTION)
+    max_snapshots = sim.get("max_snapshots", DEFAULT_MAX_SNAPSHOTS)
+    for name, value, low in (("output_interval", interval, 1), ("history_retention", keep_last, 1),
+                             ("max_snapshots", max_snapshots, 0)):
+        if not isinstance(value, int) or value < low:
+            raise ValueError(f"Invalid simulation parameter '{name}': {value}")
+    return RetentionPolicy(keep_last=keep_last, output_interval=interval, max_snapshots=max_snapshots)
+
+
+def _step_of(key: Any) -> int | None:
+    """Integer step of a time_history key ("3", 3 or "3_predictor"), None if not step-like."""
+    head = str(key).split("_", 1)[0]
+    return int(head) if head.lstrip("-").isdigit() else None
+
+
+def _has_step(time_history: Dict[Any, Any], step: int) -> bool:
+    return str(step) in time_history or step in time_history
+
+
+def latest_committed_step(time_history: Dict[Any, Any], owner: Dict[Any, Any] | None = None) -> int:
+    """
+    Latest committed step of one cell: the tracked step when owner (the
+    cell_dict holding time_history) is the tracked cell_dict and the cell has
+    that step and nothing after it, otherwise a scan of the integer keys
+    (staging keys are ignored).
+    """
+    step = current_step(owner) if owner is not None else None
+    if step is not None and _has_step(time_history, step) and not _has_step(time_history, step + 1):
+        return step
+    steps = [int(k) for k in time_history if str(k).lstrip("-").isdigit()]
+    if not steps:
+        raise ValueError("No committed timestep available in time_history.")
+    return max(steps)
+
+
+def _warn_output_dropped(step: int, policy: RetentionPolicy, first: bool) -> None:
+    """Warning for the first dropped output step of a run, debug for the rest."""
+    if first:
+        log.warning("⚠️ Output step %d dropped: max_snapshots=%d output levels are already kept "
+                    "(raise simulation_parameters.max_snapshots to keep more; later drops log at debug).",
+                    step, policy.max_snapshots)
+    else:
+        log.debug("🕰️ Output step %d dropped (max_snapshots=%d)", step, policy.max_snapshots)
+
+
+def prune_time_history(cell_dict: Dict[Any, Dict[str, Any]], policy: RetentionPolicy, latest: int,
+                       warn: bool = True) -> int:
+    """
+    Drop committed steps the policy does not retain, and staging entries
+    ("{t}_predictor", ...) of steps up to latest. Returns the number of
+    entries removed.
+
+    Dropping an output-aligned step because max_snapshots (> 0) is reached
+    logs a warning the first time it happens for a cell_dict and at debug
+    afterwards; warn=False logs every drop at debug (the driver leaves the
+    warning to FieldRing).
+    """
+    removed = 0
+    dropped_output = set()
+    for cell in cell_dict.values():
+        history = cell["time_history"]
+        for key in list(history):
+            step = _step_of(key)
+            if step is None:
+                continue
+            staging = not str(key).lstrip("-").isdigit()
+            if (staging and step <= latest) or (not staging and not policy.retains(step, latest)):
+                del history[key]
+                removed += 1
+                if not staging and policy.is_output_step(step):
+                    dropped_output.add(step)
+    if policy.max_snapshots:
+        for step in sorted(dropped_output):
+            first = warn and _warned_prune["owner"] != id(cell_dict)
+            if first:
+                _warned_prune["owner"] = id(cell_dict)
+            _warn_output_dropped(step, policy, first)
+    log.debug("🕰️ Pruned %d time_history entries (latest=%s)", removed, latest)
+    return removed
+
+
+class FieldRing:
+    """
+    Fixed-size ring of FieldStore time levels.
+
+    Slots are allocated on first use and then overwritten in place, so a long
+    run allocates exactly ``policy.keep_last`` levels. Levels that leave the
+    ring on an output-aligned step are kept as snapshots; past
+    ``policy.max_snapshots`` the oldest snapshot's arrays are reused (the
+    first time with a warning naming the dropped step, then at debug), so a
+    run never holds more than keep_last + max_snapshots levels.
+    """
+
+    def __init__(self, policy: RetentionPolicy):
+        self.policy = policy
+        self._slots: List[Any] = [None] * policy.keep_last
+        self._steps = np.full(policy.keep_last, -1, dtype=np.int64)
+        self._head = 0  # slot the next push writes to
+        self.snapshots: Dict[int, Any] = {}
+        self._warned = False  # an output level has already been recycled
+
+    @property
+    def latest_step(self) -> int | None:
+        """Step held by the most recent push (O(1))."""
+        step = self._steps[self._head - 1]
+        return None if step < 0 else int(step)
+
+    def latest(self) -> Any:
+        if self.latest_step is None:
+            raise KeyError("FieldRing is empty.")
+        return self._slots[self._head - 1]
+
+    def push(self, store: Any) -> None:
+        """Copy a committed level (store.timestep must be an int) into the ring."""
+        step = int(store.timestep)
+        slot = self._slots[self._head]
+        evicted = int(self._steps[self._head])
+        if evicted >= 0 and self.policy.is_output_step(evicted) and self.policy.max_snapshots:
+            self._snapshot(evicted, slot)
+
+        if slot is None or slot.shape != store.shape:
+            self._slots[self._head] = store.copy(timestep=step)
+        else:
+            for name in FIELD_NAMES:
+                np.copyto(getattr(slot, name), getattr(store, name))
+            slot.timestep = step
+
+        self._steps[self._head] = step
+        self._head = (self._head + 1) % len(self._slots)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🕰️ FieldRing push step=%s, ring=%s", step, sorted(s for s in self._steps.tolist() if s >= 0))
+
+    def _snapshot(self, step: int, level: Any) -> None:
+        """Keep level as the snapshot of step, recycling the oldest one when full."""
+        if len(self.snapshots) < self.policy.max_snapshots:
+            self.snapshots[step] = level.copy()
+            return
+        dropped = min(self.snapshots)
+        _warn_output_dropped(dropped, self.policy, not self._warned)
+        self._warned = True
+        oldest = self.snapshots.pop(dropped)
+        for name in FIELD_NAMES:
+            np.copyto(getattr(oldest, name), getattr(level, name))
+        oldest.timestep = step
+        self.snapshots[step] = oldest
+
+    def get(self, step: int) -> Any:
+        """Return the level for step from the ring or the snapshots."""
+        hits = np.flatnonzero(self._steps == step)
+        if hits.size:
+            return self._slots[int(hits[0])]
+        if step in self.snapshots:
+            return self.snapshots[step]
+        raise KeyError(f"Timestep {step} is not retained.")
+
+    def retained_steps(self) -> List[int]:
+        return sorted(set(int(s) for s in self._steps if s >= 0) | set(self.snapshots))
@@ -0,0 +1,30 @@
+# tests/mocks/grid_mock.py
+# Full-grid fixture: random fields on a complete nx×ny×nz domain, available both as a
+# FieldStore and as the string-keyed cell_dict that step 2 reads after a JSON round trip.
+
+import json
+
+import numpy as np
+
+from src.step_1_solver_initialization.field_store import FieldStore
+
+
+def make_grid(shape=(4, 3, 5), seed=0):
+    """Return (store, cell_dict) holding identical random pressure/velocity at timestep 0."""
+    rng = np.random.default_rng(seed)
+    store = FieldStore(shape, timestep=0)
+    store.pressure[...] = 100.0 + rng.standard_normal(shape)
+    store.vx[...] = rng.standard_normal(shape)
+    store.vy[...] = rng.standard_normal(shape)
+    store.vz[...] = rng.standard_normal(shape)
+    cell_dict = json.loads(json.dumps(store.to_cell_dict()))
+    return store, cell_dict
+
+
+def iter_cells(shape):
+    """Yield (flat_index, i, j, k) in x-major order."""
+    nx, ny, nz = shape
+    for k in range(nz):
+        for j in range(ny):
+            for i in range(nx):
+                yield i + nx * (j + ny * k), i, j, k
@@ -0,0 +1,72 @@
+# tests/test_benchmarks.py
+# ✅ Benchmark harness: result records and baseline regression check
+
+import json
+import os
+import sys
+
+import numpy as np
+
+# benchmarks/ lives at the repo root, which CI (PYTHONPATH=src pytest tests/) does not put on sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.run_benchmarks import box_config, compare_to_baseline, main, sampled_cell_dict  # noqa: E402
+from src.step_1_solver_initialization.cell_builder import build_field_store  # noqa: E402
+from src.step_2_time_stepping_loop.mac_advection_ops import adv_vy  # noqa: E402
+from src.step_2_time_stepping_loop.mac_diffusion import laplacian_velocity  # noqa: E402
+
+
+def test_compare_flags_only_slowdowns_past_threshold():
+    baseline = [{"name": "adv_vx", "size": 16, "cells_per_second": 100.0},
+                {"name": "grad_p_x", "size": 16, "cells_per_second": 100.0},
+                {"name": "build_cell_dict", "size": 128, "skipped": "too big"}]
+    results = [{"name": "adv_vx", "size": 16, "cells_per_second": 70.0},
+               {"name": "grad_p_x", "size": 16, "cells_per_second": 85.0},
+               {"name": "build_cell_dict", "size": 128, "skipped": "too big"},
+               {"name": "divergence", "size": 16, "cells_per_second": 1.0}]
+    regressions = compare_to_baseline(results, baseline, threshold=0.2)
+    assert [(r["name"], r["size"]) for r in regressions] == [("adv_vx", 16)]
+    assert regressions[0]["ratio"] == 0.7
+
+
+def test_small_run_writes_report_and_checks_baseline(tmp_path):
+    output = tmp_path / "results.json"
+    args = ["--sizes", "4", "--repeat", "1", "--sample", "8", "--output", str(output)]
+    assert main(args) == 0
+    report = json.loads(output.read_text())
+    names = {entry["name"] for entry in report["results"]}
+    assert {"build_cell_dict", "build_neighbor_map", "adv_vx", "grad_p_z", "timestep_driver[python]",
+            "update_velocity_grid"} <= names
+    assert all(entry["cells_per_second"] > 0 for entry in report["results"])
+
+    # a baseline 1000× faster than anything measured must flag every entry
+    fast = {"results": [{**entry, "cells_per_second": entry["cells_per_second"] * 1000}
+                        for entry in report["results"]]}
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(fast))
+    assert main(args + ["--baseline", str(baseline)]) == 1
+    assert len(json.loads(output.read_text())["regressions"]) == len(report["results"])
+
+
+def test_sampled_cell_dict_matches_full_dict():
+    store = build_field_store(box_config(7))
+    store.vy[...] = np.random.default_rng(1).standard_normal(store.shape)
+    full = json.loads(json.dumps(store.to_cell_dict()))
+    sample = np.array([0, 24, 171, 342])
+    partial = sampled_cell_dict(store, sample)
+    assert len(partial) < len(full)
+    for center in sample.tolist():
+        assert laplacian_velocity(partial, center, 0.5, 0.5, 0.5, 0) == laplacian_velocity(full, center, 0.5, 0.5, 0.5, 0)
+        assert adv_vy(partial, center, 0.5, 0.5, 0.5, 0) == adv_vy(full, center, 0.5, 0.5, 0.5, 0)
+
+
+def test_large_sizes_time_sampled_operators_and_numpy_driver(tmp_path):
+    output = tmp_path / "results.json"
+    assert main(["--sizes", "6", "--dict-max-size", "4", "--repeat", "1", "--sample", "8",
+                 "--output", str(output)]) == 0
+    entries = {entry["name"]: entry for entry in json.loads(output.read_text())["results"]}
+    assert entries["adv_vz"]["cells"] == 8 and entries["grad_p_x"]["cells_per_second"] > 0
+    assert entries["timestep_driver[numpy]"]["cells"] == 216
+    for name in ("build_cell_dict", "build_neighbor_map", "timestep_driver[python]"):
+        assert "skipped" in entries[name]
+
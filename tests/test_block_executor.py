@@ -0,0 +1,101 @@
+# tests/test_block_executor.py
+# ✅ Thread-pool block operators must match the whole-grid operators exactly
+
+import json
+
+import numpy as np
+import pytest
+
+from src.step_2_time_stepping_loop.block_executor import BlockExecutor
+from src.step_2_time_stepping_loop.driver_loop import timestep_driver
+from src.step_2_time_stepping_loop.mac_advection_ops import advection_grid
+from src.step_2_time_stepping_loop.mac_diffusion import laplacian_velocity_grid
+from src.step_2_time_stepping_loop.mac_gradients import (
+    divergence_grid,
+    mac_divergence_grid,
+    pressure_gradient_grid,
+)
+from src.step_2_time_stepping_loop.mac_update_velocity import update_velocity_grid
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+from tests.mocks.grid_mock import make_grid
+
+SPACING = (0.5, 0.75, 1.25)
+PARAMS = SolverParameters(dt=0.01, rho=1.2, mu=0.05, dx=0.5, dy=0.75, dz=1.25,
+                          Fx=0.1, Fy=-0.2, Fz=0.3, advection_scheme="quick")
+
+
+def _assert_same(result, expected):
+    if isinstance(expected, tuple):
+        assert isinstance(result, tuple) and len(result) == len(expected)
+        for r, e in zip(result, expected):
+            np.testing.assert_array_equal(r, e)
+    else:
+        np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_operators_match_serial(workers):
+    store, _ = make_grid(shape=(5, 4, 14), seed=31)
+    with BlockExecutor(workers=workers, blocks_per_worker=2) as executor:
+        _assert_same(executor.laplacian(store, *SPACING), laplacian_velocity_grid(store, *SPACING))
+        _assert_same(executor.advection(store, *SPACING, scheme="quick"),
+                     advection_grid(store, *SPACING, scheme="quick"))
+        _assert_same(executor.divergence(store, *SPACING), divergence_grid(store, *SPACING))
+        _assert_same(executor.pressure_gradient(store, *SPACING), pressure_gradient_grid(store.pressure, *SPACING))
+        _assert_same(executor.predict(store, PARAMS), update_velocity_grid(store, PARAMS))
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_mac_divergence_matches_serial(workers):
+    store, _ = make_grid(shape=(5, 4, 14), seed=32)
+    active = np.random.default_rng(33).random(store.shape) > 0.2
+    with BlockExecutor(workers=workers, blocks_per_worker=2) as executor:
+        _assert_same(executor.mac_divergence(store, *SPACING, active=active),
+                     mac_divergence_grid(store, *SPACING, active=active))
+        _assert_same(executor.mac_divergence(store, *SPACING), mac_divergence_grid(store, *SPACING))
+
+
+def test_invalid_layout_rejected():
+    with pytest.raises(ValueError):
+        BlockExecutor(workers=2, blocks_per_worker=0)
+
+
+def test_driver_with_thread_pool_matches_serial():
+    with open("tests/test_models/test_step_0_output.json") as f:
+        config = json.load(f)
+    config["external_forces"] = {"force_vector": [0.0, 0.0, 0.0]}
+    with open("tests/test_models/test_step_1_output.json") as f:
+        serial = json.load(f)
+    threaded = json.loads(json.dumps(serial))
+
+    timestep_driver(serial, config, 0, backend="numpy")
+    with BlockExecutor(workers=2) as executor:
+        timestep_driver(threaded, config, 0, backend="numpy", pool=executor)
+    assert threaded == serial
+
+
+def _step_inputs():
+    with open("tests/test_models/test_step_0_output.json") as f:
+        config = json.load(f)
+    config["external_forces"] = {"force_vector": [0.0, 0.0, 0.0]}
+    with open("tests/test_models/test_step_1_output.json") as f:
+        return config, json.load(f)
+
+
+@pytest.mark.parametrize("backend", ["python", "numba"])
+def test_driver_pool_needs_numpy_backend(backend):
+    config, cell_dict = _step_inputs()
+    with BlockExecutor(workers=2) as executor:
+        with pytest.raises(ValueError, match=f"backend '{backend}' cannot use it"):
+            timestep_driver(cell_dict, config, 0, backend=backend, pool=executor)
+
+
+def test_driver_terms_bypass_the_pool():
+    config, serial = _step_inputs()
+    threaded = json.loads(json.dumps(serial))
+
+    expected = timestep_driver(serial, config, 0, backend="numpy", terms=True)
+    with BlockExecutor(workers=2) as executor:
+        diagnostics = timestep_driver(threaded, config, 0, backend="numpy", terms=True, pool=executor)
+    assert diagnostics["predictor_terms"] == expected["predictor_terms"]
+    assert threaded == serial
@@ -2,7 +2,8 @@
 # ✅ Unit tests for step_1_solver_initialization/cell_builder.py
 
 import pytest
-from src.step_1_solver_initialization.cell_builder import build_cell_dict, debug
+from src.solver_logging import configure
+from src.step_1_solver_initialization.cell_builder import build_cell_dict
 
 # --- Helper config generator ---
 def make_config(nx, ny, nz, mask_flat, mask_encoding, init_pressure=100.0, init_velocity=(1.0, 2.0, 3.0), boundary_conditions=None):
@@ -102,16 +103,40 @@ def test_boundary_conditions_absent():
     cell_dict = build_cell_dict(config)
     assert cell_dict[0]["boundary_role"] is None
 
-# --- Debug flag coverage ---
-def test_debug_flag_output(capsys):
-    from src.step_1_solver_initialization import cell_builder
-    cell_builder.debug = True
-    mask_encoding = {"fluid": 0, "solid": 1, "boundary": 2}
-    config = make_config(1, 1, 1, [0], mask_encoding)
-    _ = cell_builder.build_cell_dict(config)
+# --- Debug logging coverage ---
+def test_debug_logging_output(capsys):
+    configure("cell_builder=debug")
+    try:
+        mask_encoding = {"fluid": 0, "solid": 1, "boundary": 2}
+        config = make_config(1, 1, 1, [0], mask_encoding)
+        _ = build_cell_dict(config)
+    finally:
+        configure("")
     captured = capsys.readouterr()
     assert "🧱 Built cell" in captured.out
-    cell_builder.debug = False
 
 
 
+
+# --- Vectorized field store builder ---
+def test_build_field_store_faces_and_last_match_wins():
+    from src.step_1_solver_initialization.cell_builder import build_field_store
+    from src.step_1_solver_initialization.field_store import BOUNDARY, NO_ROLE
+    mask_encoding = {"fluid": 0, "solid": 1, "boundary": 2}
+    bc = [
+        {"apply_faces": ["wall"], "role": "no_slip"},
+        {"apply_faces": ["x_min"], "role": "inlet"},
+    ]
+    config = make_config(3, 2, 2, [2] * 12, mask_encoding, boundary_conditions=bc)
+    store = build_field_store(config)
+    assert (store.cell_type == BOUNDARY).all()
+    assert set(store.roles[c] for c in store.boundary_role[0].ravel()) == {"inlet"}
+    assert set(store.roles[c] for c in store.boundary_role[1:].ravel()) == {"wall"}
+    assert NO_ROLE not in store.boundary_role
+
+def test_build_field_store_rejects_mask_size_mismatch():
+    from src.step_1_solver_initialization.cell_builder import build_field_store
+    mask_encoding = {"fluid": 0, "solid": 1, "boundary": 2}
+    config = make_config(2, 2, 2, [0] * 7, mask_encoding)
+    with pytest.raises(ValueError):
+        build_field_store(config)
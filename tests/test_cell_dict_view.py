@@ -0,0 +1,80 @@
+# tests/test_cell_dict_view.py
+# ✅ Unit tests for src/step_1_solver_initialization/cell_dict_view.py
+
+import io
+import json
+
+import pytest
+
+from src.step_1_solver_initialization.cell_builder import build_cell_dict, build_field_store
+from src.step_1_solver_initialization.cell_dict_view import CellDictEncoder, CellDictView, dump_cell_dict
+
+STEP_0_OUTPUT = "tests/test_models/test_step_0_output.json"
+
+
+@pytest.fixture
+def config():
+    with open(STEP_0_OUTPUT) as f:
+        return json.load(f)
+
+
+def test_view_matches_build_cell_dict(config):
+    view = CellDictView(build_field_store(config))
+    expected = build_cell_dict(config)
+    assert len(view) == len(expected)
+    assert list(view) == list(expected)
+    assert view == expected
+    assert view.to_dict() == expected
+
+
+def test_string_and_invalid_keys(config):
+    view = CellDictView(build_field_store(config))
+    assert view["5"] == view[5]
+    assert "63" in view and 63 in view
+    for bad in ("64", -1, "1_predictor", None):
+        assert bad not in view
+        with pytest.raises(KeyError):
+            view[bad]
+
+
+def test_multiple_time_levels(config):
+    store = build_field_store(config)
+    later = store.copy(timestep=1)
+    later.pressure += 1.0
+    cell = CellDictView(store, later)[10]
+    assert set(cell["time_history"]) == {0, 1}
+    assert cell["time_history"][1]["pressure"] == cell["time_history"][0]["pressure"] + 1.0
+
+
+@pytest.mark.parametrize("indent", [2, None])
+def test_streamed_json_matches_json_dump(config, indent):
+    expected = build_cell_dict(config)
+    buffer = io.StringIO()
+    dump_cell_dict(CellDictView(build_field_store(config)), buffer, indent=indent)
+    assert buffer.getvalue() == json.dumps(expected, indent=indent)
+
+
+def test_streamed_json_empty_mapping():
+    buffer = io.StringIO()
+    dump_cell_dict({}, buffer)
+    assert buffer.getvalue() == "{}"
+
+
+@pytest.mark.parametrize("indent", [2, None])
+def test_json_dump_streams_view_with_encoder(config, indent, monkeypatch):
+    expected = json.dumps(build_cell_dict(config), indent=indent)
+    view = CellDictView(build_field_store(config))
+    monkeypatch.setattr(CellDictView, "to_dict", lambda self: pytest.fail("view was materialised"))
+    buffer = io.StringIO()
+    json.dump(view, buffer, cls=CellDictEncoder, indent=indent)
+    assert buffer.getvalue() == expected
+    assert json.dumps(view, cls=CellDictEncoder, indent=indent) == expected
+
+
+def test_plain_json_dump_of_view_is_rejected(config):
+    view = CellDictView(build_field_store(config))
+    with pytest.raises(TypeError):
+        json.dumps(view)
+    nested = json.loads(json.dumps({"cells": view}, cls=CellDictEncoder))
+    assert nested["cells"] == json.loads(json.dumps(build_cell_dict(config)))
+
@@ -0,0 +1,252 @@
+# tests/test_distributed.py
+# ✅ Cartesian decomposition, Pipe transport, halo exchange and distributed CG
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from src.step_1_solver_initialization.indexing_utils import (
+    global_flat_to_local_flat,
+    grid_to_flat,
+    local_flat_to_global_flat,
+)
+from src.step_2_time_stepping_loop.distributed import (
+    CartesianDecomposition,
+    DistributedDomain,
+    Transport,
+    choose_dims,
+    run_local,
+)
+from src.step_1_solver_initialization.field_store import SOLID
+from src.step_2_time_stepping_loop.boundary_utils import enforce_boundary_grid
+from src.step_2_time_stepping_loop.driver_loop import distributed_driver
+from src.step_2_time_stepping_loop.mac_correct_velocity import correct_velocity
+from src.step_2_time_stepping_loop.mac_update_velocity import update_velocity_grid
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+from src.step_2_time_stepping_loop.pressure_fft import SpectralPoissonSolver
+from src.step_2_time_stepping_loop.pressure_solver import PressureProjection
+from tests.mocks.grid_mock import make_grid
+
+SHAPE = (8, 7, 9)
+SPACINGS = (0.5, 0.75, 1.25)
+PARAMS = SolverParameters(dt=0.01, rho=1.2, mu=0.05, dx=0.5, dy=0.75, dz=1.25,
+                          Fx=0.1, Fy=-0.2, Fz=0.3, advection_scheme="quick")
+
+
+CONFIG = {
+    "boundary_conditions": [
+        {"role": "inlet", "apply_to": ["velocity"], "velocity": [1.0, 0.0, 0.0]},
+        {"role": "outlet", "apply_to": ["pressure"], "pressure": 100.0},
+    ],
+    "pressure_solver": {"method": "cg", "tolerance": 1e-12},
+}
+
+
+def _channel():
+    """Random fields with an inlet and outlet, an obstacle and a pocket sealed by solids."""
+    store, _ = make_grid(shape=SHAPE, seed=44)
+    store.roles = ("inlet", "outlet")
+    store.boundary_role[0] = 0
+    store.boundary_role[-1] = 1
+    store.cell_type[3:5, 1:3, 2:5] = SOLID
+    store.cell_type[2:5, 4:7, 6:9] = SOLID
+    store.cell_type[3, 5, 7:9] = 0
+    return store
+
+
+# --- Layout -----------------------------------------------------------------
+
+def test_choose_dims_prefers_small_cuts():
+    assert choose_dims(1, (8, 8, 8)) == (1, 1, 1)
+    assert choose_dims(2, (8, 8, 32)) == (1, 1, 2)
+    assert np.prod(choose_dims(8, (16, 16, 16))) == 8
+    with pytest.raises(ValueError):
+        choose_dims(4, (4, 4, 4))
+
+
+def test_choose_dims_scales_to_many_ranks():
+    start = time.perf_counter()
+    assert choose_dims(512, (1024, 1024, 1024)) == (8, 8, 8)
+    assert choose_dims(4096, (256, 256, 4096)) == (4, 8, 128)
+    assert choose_dims(96, (64, 64, 64)) == (4, 4, 6)
+    assert time.perf_counter() - start < 1.0
+
+
+def test_blocks_tile_the_grid():
+    decomposition = CartesianDecomposition(SHAPE, dims=(2, 2, 2))
+    owner = np.full(SHAPE, -1)
+    for rank in range(decomposition.n_ranks):
+        assert owner[decomposition.block_slices(rank)].max() == -1
+        owner[decomposition.block_slices(rank)] = rank
+        assert decomposition.rank_of(decomposition.coords(rank)) == rank
+    assert owner.min() == 0
+    assert decomposition.neighbor(0, 0, -1) is None
+    assert decomposition.neighbor(0, 2, 1) == 4
+
+
+def test_global_local_flat_round_trip():
+    decomposition = CartesianDecomposition(SHAPE, dims=(2, 1, 3))
+    for rank in range(decomposition.n_ranks):
+        offset, local_shape = decomposition.offset(rank), decomposition.local_shape(rank)
+        for local_flat in range(int(np.prod(local_shape))):
+            flat = local_flat_to_global_flat(local_flat, local_shape, offset, SHAPE)
+            assert global_flat_to_local_flat(flat, SHAPE, offset, local_shape) == local_flat
+    assert global_flat_to_local_flat(grid_to_flat(7, 0, 0, SHAPE), SHAPE, (0, 0, 0), (4, 7, 3)) is None
+
+
+# --- Multi-rank runs (PipeTransport) -----------------------------------------
+
+def _reduce_ranks(transport):
+    return (transport.allreduce(transport.rank + 1),
+            transport.allreduce(np.full(2, float(transport.rank)), "max").tolist())
+
+
+def test_allreduce_over_pipes():
+    assert run_local(_reduce_ranks, 3) == [(6, [2.0, 2.0])] * 3
+
+
+def _gather_broadcast(transport):
+    return transport.gather(transport.rank * 10, root=1), transport.broadcast(f"from {transport.rank}", root=2)
+
+
+def test_gather_and_broadcast_over_pipes():
+    assert run_local(_gather_broadcast, 3) == [(None, "from 2"), ([0, 10, 20], "from 2"), (None, "from 2")]
+
+
+def _predict_blocks(transport, dims, root):
+    # with a root only that rank builds the global store
+    store = make_grid(shape=SHAPE, seed=41)[0] if root is None or transport.rank == root else None
+    domain = DistributedDomain(transport, SHAPE, dims=dims)
+    local = domain.scatter(store, root)
+    return domain.gather(domain.predict(local, PARAMS)[2])
+
+
+@pytest.mark.parametrize("dims, root", [((2, 1, 1), 0), ((1, 1, 3), 2), ((2, 2, 1), None)])
+def test_distributed_predictor_matches_serial(dims, root):
+    store, _ = make_grid(shape=SHAPE, seed=41)
+    expected = update_velocity_grid(store, PARAMS)[2]
+    result, *others = run_local(_predict_blocks, int(np.prod(dims)), dims, root)
+    np.testing.assert_array_equal(result, expected)
+    assert others == [None] * len(others)
+
+
+def _solve_blocks(transport, rhs):
+    domain = DistributedDomain(transport, rhs.shape)
+    block = rhs[domain.decomposition.block_slices(domain.rank)]
+    phi, info = domain.solve_poisson(block, SPACINGS, tolerance=1e-10, max_iterations=500)
+    return domain.gather(phi), info
+
+
+def test_distributed_cg_matches_spectral_solver():
+    rhs = np.random.default_rng(42).standard_normal(SHAPE)
+    rhs -= rhs.mean()
+    expected, _ = SpectralPoissonSolver(SHAPE, SPACINGS).solve(rhs)
+    (phi, info), (other, other_info) = run_local(_solve_blocks, 2, rhs)
+    assert info["converged"] and info["residual"] < 1e-9
+    np.testing.assert_allclose(phi, expected, atol=1e-8)
+    assert other is None and other_info == info
+
+
+def _advance_blocks(transport, make_store, config, dims, steps):
+    store, history = distributed_driver(transport, make_store() if transport.rank == 0 else None, config, steps,
+                                        params=PARAMS, dims=dims)
+    return store, history
+
+
+def _serial_steps(store, config, steps):
+    for timestep in range(steps):
+        star = store.copy(timestep=f"{timestep + 1}_predictor")
+        star.vx[...], star.vy[...], star.vz[...] = update_velocity_grid(store, PARAMS)
+        enforce_boundary_grid(star, config)
+        phi, _ = PressureProjection(star, config, PARAMS).project(star)
+        store, expected = correct_velocity(star, phi, config, PARAMS, timestep=timestep + 1)
+    return store, expected
+
+
+def _split_box():
+    """No pressure roles: a solid wall at x=4 leaves two floating regions, each spanning several blocks."""
+    store, _ = make_grid(shape=SHAPE, seed=45)
+    store.cell_type[4] = SOLID
+    return store
+
+
+@pytest.mark.parametrize("make_store, config, dims", [
+    (_channel, CONFIG, (2, 1, 1)),
+    (_channel, CONFIG, (1, 2, 2)),
+    (_split_box, {"boundary_conditions": [], "pressure_solver": {"method": "cg", "tolerance": 1e-12}}, (1, 2, 2)),
+])
+def test_distributed_steps_match_serial_projection(make_store, config, dims):
+    store, expected = _serial_steps(make_store(), config, 2)
+
+    results = run_local(_advance_blocks, int(np.prod(dims)), make_store, config, dims, 2)
+    got, history = results[0]
+    for name in ("pressure", "vx", "vy", "vz"):
+        np.testing.assert_allclose(getattr(got, name), getattr(store, name), atol=1e-8)
+    np.testing.assert_array_equal(got.cell_type, store.cell_type)
+    assert got.timestep == 2
+    assert len(history) == 2 and all(step["pressure_solver"]["converged"] for step in history)
+    assert history[-1]["divergence_linf"] == pytest.approx(expected["divergence_linf"], abs=1e-8)
+    for other, other_history in results[1:]:
+        assert other is None and other_history == history
+
+
+def _regions(transport):
+    domain = DistributedDomain(transport, SHAPE, dims=(1, 2, 2))
+    domain.assemble(domain.scatter(_split_box() if transport.rank == 0 else None), {"boundary_conditions": []})
+    return domain.floating.tolist(), domain.region_size.tolist()
+
+
+def test_regions_are_joined_across_blocks():
+    fluid = [4 * 7 * 9, 3 * 7 * 9]
+    for floating, sizes in run_local(_regions, 4):
+        assert floating == [False, True, True]
+        assert sorted(sizes) == [0] + sorted(fluid)
+
+
+def test_advance_requires_assembled_operator():
+    domain = DistributedDomain(Transport(), SHAPE)
+    with pytest.raises(ValueError, match="assemble"):
+        domain.advance(domain.scatter(_channel()), CONFIG, PARAMS)
+
+
+def test_single_rank_transport():
+    rhs = np.random.default_rng(43).standard_normal(SHAPE)
+    phi, info = _solve_blocks(Transport(), rhs)
+    assert info["method"] == "cg" and info["converged"]
+
+
+def _fail(transport):
+    if transport.rank == 1:
+        raise RuntimeError("boom")
+    return transport.rank
+
+
+def test_rank_failure_is_reported():
+    with pytest.raises(RuntimeError, match="rank 1"):
+        run_local(_fail, 2)
+
+
+def _die(transport):
+    if transport.rank == 1:
+        os._exit(3)
+    return transport.rank
+
+
+def test_dead_rank_is_reported():
+    with pytest.raises(RuntimeError, match="rank 1: exited with code 3"):
+        run_local(_die, 2, poll_interval=0.05)
+
+
+def _stall(transport):
+    if transport.rank == 0:
+        time.sleep(30)
+    return transport.rank
+
+
+def test_run_local_timeout():
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match=r"ranks \[0\]: no result within"):
+        run_local(_stall, 2, timeout=0.5, poll_interval=0.05)
+    assert time.monotonic() - start < 10
@@ -0,0 +1,108 @@
+# tests/test_driver_loop.py
+# ✅ Timestep driver on the 4×4×4 integration model (Step 1 golden output)
+
+import json
+
+import numpy as np
+import pytest
+
+from src.step_2_time_stepping_loop import driver_loop
+from src.step_2_time_stepping_loop.driver_loop import timestep_driver
+from src.step_1_solver_initialization.field_store import FieldStore
+from src.step_1_solver_initialization.run_length_mask import RunLengthMask
+from src.step_2_time_stepping_loop.parameter_utils import build_solver_parameters
+from src.step_2_time_stepping_loop.pressure_solver import PressureProjection
+
+
+@pytest.fixture
+def config():
+    with open("tests/test_models/test_step_0_output.json") as f:
+        cfg = json.load(f)
+    cfg["external_forces"] = {"force_vector": [0.0, 0.0, 0.0]}
+    return cfg
+
+
+@pytest.fixture
+def cell_dict():
+    with open("tests/test_models/test_step_1_output.json") as f:
+        return json.load(f)
+
+
+def test_predictor_staged_for_every_cell(config, cell_dict):
+    timestep_driver(cell_dict, config, 0)
+    for cell in cell_dict.values():
+        staged = cell["time_history"]["1_predictor"]
+        assert set(staged["velocity"]) == {"vx", "vy", "vz"}
+
+
+def test_params_built_once_per_step(config, cell_dict, monkeypatch):
+    params = build_solver_parameters(config)
+    calls = []
+    monkeypatch.setattr(driver_loop, "build_solver_parameters", lambda cfg: calls.append(cfg) or params)
+    timestep_driver(cell_dict, config, 0)
+    assert len(calls) == 1
+    calls.clear()
+    timestep_driver(cell_dict, config, 0, params=params)
+    assert calls == []
+
+
+def test_boundary_masks_built_once_per_run(config, cell_dict, monkeypatch):
+    params = build_solver_parameters(config)
+    domain = config["domain_definition"]
+    store = FieldStore.from_cell_dict(cell_dict, shape=(domain["nx"], domain["ny"], domain["nz"]), timestep=0)
+    projection = PressureProjection(store, config, params)
+
+    scans = []
+    from_dense = RunLengthMask.from_dense.__func__
+    monkeypatch.setattr(RunLengthMask, "from_dense",
+                        classmethod(lambda cls, *args: scans.append(args) or from_dense(cls, *args)))
+    for timestep in range(3):
+        timestep_driver(cell_dict, config, timestep, params=params, projection=projection, backend="numpy")
+    assert scans == []
+
+
+def test_wall_cells_keep_wall_velocity(config, cell_dict):
+    timestep_driver(cell_dict, config, 0)
+    staged = cell_dict["0"]["time_history"]["1_predictor"]
+    assert staged["velocity"] == {"vx": 0.0, "vy": 0.0, "vz": 0.0}
+
+
+def test_corrected_state_committed(config, cell_dict):
+    diagnostics = timestep_driver(cell_dict, config, 0)
+    assert diagnostics["pressure_solver"]["converged"]
+    assert diagnostics["divergence_linf"] >= diagnostics["divergence_l2"] >= 0.0
+    for cell in cell_dict.values():
+        committed = cell["time_history"]["1"]
+        assert set(committed) == {"pressure", "velocity"}
+        assert "1_pressure" not in cell["time_history"]
+    # walls keep their no-slip velocity after the correction
+    assert cell_dict["0"]["time_history"]["1"]["velocity"] == {"vx": 0.0, "vy": 0.0, "vz": 0.0}
+
+
+@pytest.mark.parametrize("method", ["fft", "cg", "multigrid"])
+def test_projection_leaves_divergence_at_solver_tolerance(config, cell_dict, method):
+    # no boundary roles, so nothing overrides the projected velocity
+    rng = np.random.default_rng(3)
+    for cell in cell_dict.values():
+        cell["boundary_role"], cell["cell_type"] = None, "fluid"
+        cell["time_history"]["0"]["velocity"] = {c: float(rng.standard_normal()) for c in ("vx", "vy", "vz")}
+    config["pressure_solver"] = {"method": method, "tolerance": 1e-10}
+    diagnostics = timestep_driver(cell_dict, config, 0)
+    assert diagnostics["pressure_solver"]["method"] == method
+    assert diagnostics["divergence_linf"] < 1e-8
+
+
+def test_closed_box_uses_spectral_solver(config, cell_dict):
+    # the 4×4×4 model has no solids and only velocity walls
+    diagnostics = timestep_driver(cell_dict, config, 0)
+    assert diagnostics["pressure_solver"]["method"] == "fft"
+
+
+def test_predictor_terms_reported_by_every_backend(config, cell_dict):
+    plain = timestep_driver(json.loads(json.dumps(cell_dict)), config, 0)
+    assert "predictor_terms" not in plain
+
+    by_python = timestep_driver(json.loads(json.dumps(cell_dict)), config, 0, backend="python", terms=True)
+    by_numpy = timestep_driver(cell_dict, config, 0, backend="numpy", terms=True)
+    assert by_python["predictor_terms"] == pytest.approx(by_numpy["predictor_terms"], rel=1e-12)
+    assert by_numpy["predictor_terms"]["force"] == 0.0
@@ -0,0 +1,111 @@
+# tests/test_field_store.py
+# ✅ Unit tests for src/step_1_solver_initialization/field_store.py
+
+import json
+
+import numpy as np
+import pytest
+
+from src.step_1_solver_initialization.cell_builder import build_cell_dict
+from src.step_1_solver_initialization.field_store import (
+    FieldStore,
+    FLUID,
+    SOLID,
+    BOUNDARY,
+    NO_ROLE,
+)
+
+STEP_0_OUTPUT = "tests/test_models/test_step_0_output.json"
+STEP_1_OUTPUT = "tests/test_models/test_step_1_output.json"
+
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+# --- Round trips ------------------------------------------------------------
+
+def test_round_trip_build_cell_dict():
+    config = _load(STEP_0_OUTPUT)
+    cell_dict = build_cell_dict(config)
+    store = FieldStore.from_cell_dict(cell_dict)
+    assert store.shape == (4, 4, 4)
+    assert store.to_cell_dict() == cell_dict
+
+
+def test_round_trip_golden_json():
+    golden = _load(STEP_1_OUTPUT)  # string keys, as step 2 sees it
+    store = FieldStore.from_cell_dict(golden)
+    exported = json.loads(json.dumps(store.to_cell_dict()))
+    assert exported == golden
+
+
+# --- Array layout -----------------------------------------------------------
+
+def test_arrays_are_contiguous_float64():
+    store = FieldStore((3, 4, 5))
+    for name in ("pressure", "vx", "vy", "vz"):
+        arr = getattr(store, name)
+        assert arr.shape == (3, 4, 5)
+        assert arr.dtype == np.float64
+        assert arr.flags["C_CONTIGUOUS"]
+
+
+def test_flat_order_matches_x_major_indexing():
+    store = FieldStore((3, 4, 5))
+    store.vx[...] = np.arange(60).reshape((3, 4, 5))
+    flat = store.flat("vx")
+    # flat_index = i + nx * (j + ny * k)
+    assert flat[1 + 3 * (2 + 4 * 3)] == store.vx[1, 2, 3]
+
+
+def test_geometry_codes():
+    golden = _load(STEP_1_OUTPUT)
+    store = FieldStore.from_cell_dict(golden)
+    assert store.cell_type[0, 0, 0] == BOUNDARY
+    assert store.roles[store.boundary_role[0, 0, 0]] == "wall"
+    assert store.cell_type[1, 1, 1] == FLUID
+    assert store.boundary_role[1, 1, 1] == NO_ROLE
+    assert SOLID not in np.unique(store.cell_type)
+
+
+# --- Time levels ------------------------------------------------------------
+
+def test_explicit_timestep_selection():
+    golden = _load(STEP_1_OUTPUT)
+    for cell in golden.values():
+        cell["time_history"]["1"] = {"pressure": 1.0, "velocity": {"vx": 2.0, "vy": 3.0, "vz": 4.0}}
+    latest = FieldStore.from_cell_dict(golden)
+    first = FieldStore.from_cell_dict(golden, timestep=0)
+    assert latest.timestep == 1
+    assert np.all(latest.vz == 4.0)
+    assert np.all(first.vx == 1.0)
+
+
+def test_missing_timestep_raises():
+    golden = _load(STEP_1_OUTPUT)
+    with pytest.raises(ValueError):
+        FieldStore.from_cell_dict(golden, timestep=7)
+
+
+def test_write_time_level():
+    golden = _load(STEP_1_OUTPUT)
+    store = FieldStore.from_cell_dict(golden)
+    store.pressure += 1.0
+    store.write_time_level(golden, "1")
+    assert golden["5"]["time_history"]["1"]["pressure"] == pytest.approx(134.105)
+    assert golden["5"]["time_history"]["0"]["pressure"] == pytest.approx(133.105)
+
+
+def test_z_window_shares_memory():
+    store = FieldStore((3, 2, 5), timestep=4)
+    store.vx[...] = np.arange(30, dtype=np.float64).reshape(3, 2, 5)
+    window = store.z_window(1, 4)
+    assert window.shape == (3, 2, 3)
+    assert window.timestep == 4
+    np.testing.assert_array_equal(window.vx, store.vx[:, :, 1:4])
+    window.pressure[...] = 7.0
+    assert store.pressure[:, :, 1:4].min() == 7.0 and store.pressure[:, :, 0].max() == 0.0
+    with pytest.raises(ValueError):
+        store.z_window(3, 3)
@@ -2,7 +2,7 @@
 # ✅ Focused validation tests for x-major flattening logic in a 3×3×3 cube + edge cases
 
 import pytest
-from step_1_solver_initialization import indexing_utils
+from src.solver_logging import configure
 from step_1_solver_initialization.indexing_utils import (
     grid_to_flat,
     flat_to_grid,
@@ -99,9 +99,9 @@ def test_boundary_values_cube():
     assert grid_to_flat(nx-1, ny-1, nz-1, CUBE_SHAPE) == last_index
     assert flat_to_grid(last_index, CUBE_SHAPE) == [nx-1, ny-1, nz-1]
 
-# --- Debug flag coverage ---
-def test_debug_flag(monkeypatch, capsys):
-    indexing_utils.debug = True
+# --- Debug logging coverage ---
+def test_debug_logging(capsys):
+    configure("indexing_utils=debug")
     result = grid_to_flat(1, 1, 1, CUBE_SHAPE)
     assert result == 13
     result2 = flat_to_grid(13, CUBE_SHAPE)
@@ -110,12 +110,12 @@ def test_debug_flag(monkeypatch, capsys):
     assert result3 is True
     result4 = is_valid_flat_index(13, CUBE_SHAPE)
     assert result4 is True
+    configure("")
     captured = capsys.readouterr()
     assert "📐 grid_to_flat" in captured.out
     assert "📐 flat_to_grid" in captured.out
     assert "🔍 is_valid_grid_index" in captured.out
     assert "🔍 is_valid_flat_index" in captured.out
-    indexing_utils.debug = False
 
 
 
@@ -0,0 +1,205 @@
+# tests/test_input_reader.py
+# 🧪 Tests for input_reader — streamed geometry_mask_flat, sidecar files and validation
+
+import io
+import json
+import logging
+
+import numpy as np
+import pytest
+
+from src.step_0_input_data_parsing import input_reader
+from src.step_0_input_data_parsing.input_reader import MASK_DTYPE, _stream_mask, load_simulation_input
+from src.step_0_input_data_parsing.sidecar_files import (
+    check_mask_codes,
+    decode_rle,
+    encode_rle,
+    load_mask_file,
+    save_rle,
+)
+from src.step_1_solver_initialization.cell_builder import build_field_store
+from src.step_2_time_stepping_loop.pressure_solver import load_pressure_solver_settings
+
+MODEL_INPUT = "tests/test_models/test_model_input.json"
+
+
+@pytest.fixture
+def model():
+    with open(MODEL_INPUT) as f:
+        return json.load(f)
+
+
+def _write(tmp_path, config, indent=2):
+    path = tmp_path / "input.json"
+    path.write_text(json.dumps(config, indent=indent))
+    return str(path)
+
+
+def test_streamed_mask_matches_json_load(model):
+    data = load_simulation_input(MODEL_INPUT)
+    mask = data["geometry_definition"]["geometry_mask_flat"]
+    assert isinstance(mask, np.ndarray) and mask.dtype == MASK_DTYPE
+    assert mask.tolist() == model["geometry_definition"]["geometry_mask_flat"]
+
+    plain = load_simulation_input(MODEL_INPUT, stream_mask=False)
+    assert plain["geometry_definition"]["geometry_mask_flat"] == mask.tolist()
+    del data["geometry_definition"]["geometry_mask_flat"], plain["geometry_definition"]["geometry_mask_flat"]
+    assert data == plain
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 3, 7, 64])
+def test_stream_mask_across_chunk_boundaries(model, chunk_chars):
+    text = json.dumps(model, indent=None)
+    rest, mask = _stream_mask(io.StringIO(text), chunk_chars=chunk_chars)
+    assert mask.tolist() == model["geometry_definition"]["geometry_mask_flat"]
+    assert json.loads(rest)["geometry_definition"]["geometry_mask_flat"] is None
+    assert json.loads(rest)["domain_definition"] == model["domain_definition"]
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 2, 3, 4, 5, 64, 1 << 18])
+@pytest.mark.parametrize("mask", ["[1,2,]", "[1,,2]", "[1,2,3,,4,5,6]", "[1, ,2]", "[1 ,\n, 2]", "[,1]", "[,]"])
+def test_stream_mask_rejects_empty_values(mask, chunk_chars):
+    # small chunks put seams inside the ", ," separators
+    text = '{"geometry_mask_flat": %s, "a": 1}' % mask
+    with pytest.raises(ValueError):
+        json.loads(text)
+    with pytest.raises(ValueError, match="empty value"):
+        _stream_mask(io.StringIO(text), chunk_chars=chunk_chars)
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 2, 3, 64])
+@pytest.mark.parametrize("mask", ["[]", "[ ]", "[1]", "[ 1 ,\n 2 , 3 ]"])
+def test_stream_mask_accepts_valid_lists(mask, chunk_chars):
+    text = '{"geometry_mask_flat": %s, "a": 1}' % mask
+    rest, values = _stream_mask(io.StringIO(text), chunk_chars=chunk_chars)
+    assert values.tolist() == json.loads(text)["geometry_mask_flat"]
+    assert json.loads(rest) == {"geometry_mask_flat": None, "a": 1}
+
+
+def test_stream_mask_without_mask_returns_text_unchanged():
+    text = json.dumps({"a": [1, 2, 3]})
+    assert _stream_mask(io.StringIO(text), chunk_chars=4) == (text, None)
+
+
+def test_streamed_mask_feeds_field_store(model):
+    streamed = build_field_store(load_simulation_input(MODEL_INPUT))
+    reference = build_field_store(model)
+    np.testing.assert_array_equal(streamed.cell_type, reference.cell_type)
+
+
+def test_mask_length_checked_without_debug(tmp_path, model):
+    assert not input_reader.log.isEnabledFor(logging.DEBUG)
+    model["geometry_definition"]["geometry_mask_flat"].append(1)
+    with pytest.raises(ValueError, match="length mismatch"):
+        load_simulation_input(_write(tmp_path, model))
+
+
+def test_pressure_solver_keys_are_optional(tmp_path, model):
+    model["pressure_solver"] = {"preconditioner": "none"}
+    data = load_simulation_input(_write(tmp_path, model))
+    settings = load_pressure_solver_settings(data)
+    assert (settings["method"], settings["tolerance"]) == ("auto", 1e-6)
+    assert settings["preconditioner"] == "none"
+
+
+@pytest.mark.parametrize("value", [1.5, 300, "1"])
+def test_mask_values_must_be_small_integers(tmp_path, model, value):
+    model["geometry_definition"]["geometry_mask_flat"][5] = value
+    with pytest.raises(ValueError, match="geometry_mask_flat"):
+        load_simulation_input(_write(tmp_path, model))
+
+
+def test_unterminated_mask_raises(tmp_path):
+    path = tmp_path / "input.json"
+    path.write_text('{"geometry_definition": {"geometry_mask_flat": [1, 0, 1')
+    with pytest.raises(ValueError, match="unterminated"):
+        load_simulation_input(str(path))
+
+
+def test_mask_key_outside_geometry_definition_rejected(tmp_path, model):
+    model["extra"] = {"geometry_mask_flat": [1]}
+    del model["geometry_definition"]
+    with pytest.raises(ValueError, match="only allowed inside"):
+        load_simulation_input(_write(tmp_path, model))
+
+
+# --- Sidecar masks and initial fields ----------------------------------------
+
+def _sidecar_input(tmp_path, model, mask_ref):
+    del model["geometry_definition"]["geometry_mask_flat"]
+    model["geometry_definition"]["geometry_mask_file"] = mask_ref
+    return _write(tmp_path, model)
+
+
+@pytest.mark.parametrize("layout", ["flat", "fortran", "c"])
+def test_npy_mask_sidecar_matches_inline(tmp_path, model, layout):
+    flat = np.array(model["geometry_definition"]["geometry_mask_flat"], dtype=np.int8)
+    shape = tuple(model["geometry_definition"]["geometry_mask_shape"])
+    stored = {"flat": flat,
+              "fortran": np.asfortranarray(flat.reshape(shape, order="F")),
+              "c": np.ascontiguousarray(flat.reshape(shape, order="F"))}[layout]
+    np.save(tmp_path / "mask.npy", stored)
+    data = load_simulation_input(_sidecar_input(tmp_path, model, {"path": "mask.npy", "format": "npy"}))
+    mask = data["geometry_definition"]["geometry_mask_flat"]
+    assert mask.tolist() == flat.tolist()
+    if layout != "c":
+        assert isinstance(mask.base, np.memmap) or isinstance(mask, np.memmap)
+
+
+def test_rle_mask_sidecar_round_trip(tmp_path, model):
+    flat = np.array(model["geometry_definition"]["geometry_mask_flat"])
+    save_rle(str(tmp_path / "mask.rle.npy"), flat)
+    assert len(encode_rle(flat)) < flat.size
+    data = load_simulation_input(_sidecar_input(tmp_path, model, {"path": "mask.rle.npy", "format": "rle"}))
+    assert data["geometry_definition"]["geometry_mask_flat"].tolist() == flat.tolist()
+
+
+def test_mask_sidecar_integrity_checks(tmp_path, model):
+    np.save(tmp_path / "short.npy", np.ones(10, dtype=np.int8))
+    with pytest.raises(ValueError, match="shape"):
+        load_simulation_input(_sidecar_input(tmp_path, model, {"path": "short.npy", "format": "npy"}))
+    with pytest.raises(ValueError, match="covers 63 cells"):
+        decode_rle(np.array([[1, 60], [0, 3]]), 64)
+    with pytest.raises(ValueError, match="integers"):
+        check_mask_codes(np.zeros(4), "mask")
+    with pytest.raises(FileNotFoundError):
+        load_mask_file({"path": "missing.npy", "format": "npy"}, str(tmp_path), (4, 4, 4))
+
+
+def test_mask_flat_and_file_are_exclusive(tmp_path, model):
+    np.save(tmp_path / "mask.npy", np.ones(64, dtype=np.int8))
+    model["geometry_definition"]["geometry_mask_file"] = {"path": "mask.npy", "format": "npy"}
+    with pytest.raises(ValueError, match="not both"):
+        load_simulation_input(_write(tmp_path, model))
+
+
+def test_initial_field_sidecars_fill_field_store(tmp_path, model):
+    shape = tuple(model["geometry_definition"]["geometry_mask_shape"])
+    n = int(np.prod(shape))
+    pressure = np.arange(n, dtype=np.float64)
+    velocity = np.random.default_rng(0).standard_normal(shape + (3,))
+    np.save(tmp_path / "p.npy", pressure)
+    np.save(tmp_path / "v.npy", velocity)
+    model["initial_conditions"]["initial_fields"] = {"pressure": {"path": "p.npy"}, "velocity": {"path": "v.npy"}}
+    data = load_simulation_input(_write(tmp_path, model))
+
+    store = build_field_store(data)
+    np.testing.assert_array_equal(store.pressure, pressure.reshape(shape, order="F"))
+    np.testing.assert_array_equal(store.vy, velocity[..., 1])
+    assert store.pressure[1, 0, 0] == 1.0  # x-major: flat index 1 is (1, 0, 0)
+
+
+def test_initial_field_sidecar_rejects_bad_data(tmp_path, model):
+    np.save(tmp_path / "p.npy", np.full(64, np.nan))
+    model["initial_conditions"]["initial_fields"] = {"pressure": {"path": "p.npy"}}
+    with pytest.raises(ValueError, match="finite"):
+        load_simulation_input(_write(tmp_path, model))
+
+    np.save(tmp_path / "v.npy", np.zeros((64, 2)))
+    model["initial_conditions"]["initial_fields"] = {"velocity": {"path": "v.npy"}}
+    with pytest.raises(ValueError, match="shape"):
+        load_simulation_input(_write(tmp_path, model))
+
+    model["initial_conditions"]["initial_fields"] = {"temperature": {"path": "v.npy"}}
+    with pytest.raises(KeyError, match="temperature"):
+        load_simulation_input(_write(tmp_path, model))
@@ -0,0 +1,113 @@
+# tests/test_instrumentation.py
+# ✅ Opt-in timing spans, counters and the driver's per-phase report
+
+import csv
+import json
+import logging
+
+import pytest
+
+from src.step_2_time_stepping_loop import driver_loop, instrumentation
+from src.step_2_time_stepping_loop.block_executor import BlockExecutor
+from src.step_2_time_stepping_loop.driver_loop import timestep_driver
+from src.step_2_time_stepping_loop.instrumentation import Profiler, activate, count, span
+
+PHASES = {"predictor", "load_state", "boundary", "poisson_assembly", "poisson_solve", "correction",
+          "history_commit"}
+OPERATORS = {"interpolation", "diffusion", "advection", "pressure_gradient"}
+
+
+@pytest.fixture
+def config():
+    with open("tests/test_models/test_step_0_output.json") as f:
+        cfg = json.load(f)
+    cfg["external_forces"] = {"force_vector": [0.0, 0.0, 0.0]}
+    return cfg
+
+
+@pytest.fixture
+def cell_dict():
+    with open("tests/test_models/test_step_1_output.json") as f:
+        return json.load(f)
+
+
+def test_spans_are_shared_noop_when_inactive():
+    assert span("a") is span("b")
+    count("ignored")
+    assert instrumentation.active_profiler() is None
+
+
+def test_activate_records_and_restores():
+    outer, inner = Profiler(echo_steps=False), Profiler(echo_steps=False)
+    with activate(outer):
+        with span("a"):
+            with activate(inner):
+                with span("b"):
+                    count("hits", 2)
+            with activate(None):  # None keeps the enclosing profiler
+                with span("a"):
+                    pass
+    assert instrumentation.active_profiler() is None
+    assert outer.spans["a"][0] == 2 and "b" not in outer.spans
+    assert inner.spans["b"][0] == 1 and inner.counters == {"hits": 2}
+
+
+def test_worker_threads_see_no_profiler(config, cell_dict):
+    profiler = Profiler(echo_steps=False)
+    with BlockExecutor(workers=2) as pool, activate(profiler):
+        seen = list(pool._executor.map(lambda _: instrumentation.active_profiler(), range(4)))
+        timestep_driver(cell_dict, config, 0, backend="numpy", pool=pool)
+    assert seen == [None] * 4
+    # the threaded predictor is timed as a whole, its kernels' spans stay off
+    assert profiler.spans["predictor"][0] == 1
+    assert not OPERATORS & set(profiler.spans)
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_driver_reports_phases_and_operators(config, cell_dict, backend, caplog):
+    profiler = Profiler()
+    with caplog.at_level(logging.INFO, logger="fluid_solver.instrumentation"):
+        timestep_driver(cell_dict, config, 0, backend=backend, profiler=profiler)
+        timestep_driver(cell_dict, config, 1, backend=backend, profiler=profiler)
+
+    report = profiler.report()
+    assert PHASES <= set(report["spans"])
+    if backend == "python":
+        assert not OPERATORS & set(report["spans"])  # per-cell predictor timed as a whole
+    else:
+        assert OPERATORS <= set(report["spans"])
+    assert report["spans"]["predictor"]["count"] == 2
+    assert report["spans"]["poisson_assembly"]["count"] == 2  # no projection passed in
+    assert report["spans"]["load_state"]["count"] == 2
+    # writebacks only: the corrected level, plus the staged v* on the array path
+    assert report["spans"]["history_commit"]["count"] == (2 if backend == "python" else 4)
+    assert report["spans"]["boundary"]["count"] == (2 * 64 if backend == "python" else 2)
+    assert [step["timestep"] for step in report["steps"]] == [0, 1]
+    assert all(step["cells"] == 64 and step["cells_per_second"] > 0 for step in report["steps"])
+    assert 0.0 < report["spans"]["predictor"]["share"] <= 1.0
+    assert caplog.text.count("cells/s") == 2
+
+
+def test_untimed_python_step_opens_no_span_per_cell(config, cell_dict, monkeypatch):
+    names = []
+    monkeypatch.setattr(driver_loop, "span", lambda name: names.append(name) or span(name))
+    timestep_driver(cell_dict, config, 0, backend="python")
+    assert "boundary" not in names
+    assert len(names) < len(cell_dict)
+
+
+def test_report_files(config, cell_dict, tmp_path, caplog):
+    profiler = Profiler(echo_steps=False)
+    timestep_driver(cell_dict, config, 0, backend="numpy", profiler=profiler)
+
+    json_path, csv_path = tmp_path / "timing.json", tmp_path / "timing.csv"
+    with caplog.at_level(logging.INFO, logger="fluid_solver.instrumentation"):
+        profiler.write_report(str(json_path))
+        profiler.write_report(str(csv_path))
+    assert "cells/s" not in caplog.text  # echo_steps=False
+    assert caplog.text.count("Timing report written") == 2
+
+    assert json.loads(json_path.read_text())["steps"][0]["timestep"] == 0
+    rows = list(csv.reader(csv_path.open()))
+    assert rows[0][0] == "kind"
+    assert {row[0] for row in rows[1:]} == {"span", "counter", "step"}
@@ -0,0 +1,114 @@
+# tests/test_mac_correct_velocity.py
+# ✅ Phase 3 velocity correction on whole-grid arrays
+
+import numpy as np
+import pytest
+
+from src.step_2_time_stepping_loop.boundary_utils import enforce_boundary, enforce_boundary_grid
+from src.step_2_time_stepping_loop.mac_correct_velocity import correct_velocity
+from src.step_1_solver_initialization.field_store import SOLID
+from src.step_2_time_stepping_loop.mac_gradients import (
+    grad_p_x,
+    grad_p_y,
+    grad_p_z,
+    mac_divergence_grid,
+    pressure_gradient_grid,
+)
+from src.step_2_time_stepping_loop.pressure_solver import PressureProjection
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+from tests.mocks.grid_mock import make_grid, iter_cells
+
+CONFIG = {
+    "boundary_conditions": [
+        {"role": "inlet", "apply_to": ["velocity", "pressure"], "velocity": [1.0, 0.0, 0.0], "pressure": 5.0},
+        {"role": "wall", "apply_to": ["velocity"], "velocity": [0.0, 0.0, 0.0]},
+    ]
+}
+PARAMS = SolverParameters(dt=0.1, rho=2.0, mu=0.0, dx=0.5, dy=0.75, dz=1.25, Fx=0.0, Fy=0.0, Fz=0.0)
+
+
+def _with_roles(store):
+    store.boundary_role[0, :, :] = store.role_code("inlet")
+    store.boundary_role[:, 0, :] = store.role_code("wall")
+    return store
+
+
+def test_pressure_gradient_grid_matches_scalar():
+    store, cell_dict = make_grid(seed=3)
+    gx, gy, gz = pressure_gradient_grid(store.pressure, 0.5, 0.75, 1.25)
+    for flat, i, j, k in iter_cells(store.shape):
+        assert gx[i, j, k] == pytest.approx(grad_p_x(cell_dict, flat, 0.5, timestep=0))
+        assert gy[i, j, k] == pytest.approx(grad_p_y(cell_dict, flat, 0.75, timestep=0))
+        assert gz[i, j, k] == pytest.approx(grad_p_z(cell_dict, flat, 1.25, timestep=0))
+
+
+def test_enforce_boundary_grid_matches_scalar():
+    store, _ = make_grid(seed=4)
+    store = _with_roles(store)
+    cells = store.to_cell_dict()
+    enforce_boundary_grid(store, CONFIG)
+    for flat, i, j, k in iter_cells(store.shape):
+        cell = cells[flat]
+        expected = enforce_boundary(cell["time_history"][0], cell, CONFIG)
+        assert store.state_at(i, j, k) == expected
+
+
+def test_correction_subtracts_scaled_gradient_and_keeps_star():
+    star, _ = make_grid(seed=5)
+    phi = np.random.default_rng(6).standard_normal(star.shape)
+    before = star.copy()
+
+    corrected, diagnostics = correct_velocity(star, phi, {"boundary_conditions": []}, PARAMS, timestep=1)
+    gx, _, _ = pressure_gradient_grid(phi, PARAMS.dx, PARAMS.dy, PARAMS.dz)
+    np.testing.assert_allclose(corrected.vx, before.vx - 0.05 * gx)
+    np.testing.assert_allclose(corrected.pressure, before.pressure + phi)
+    np.testing.assert_array_equal(star.vx, before.vx)
+    assert corrected.timestep == 1
+    assert set(diagnostics) == {"divergence_l2", "divergence_linf"}
+
+
+def test_correction_reapplies_boundary_overrides():
+    star, _ = make_grid(seed=7)
+    star = _with_roles(star)
+    phi = np.random.default_rng(8).standard_normal(star.shape)
+    corrected, _ = correct_velocity(star, phi, CONFIG, PARAMS)
+    assert np.all(corrected.vx[0, 1:, :] == 1.0)
+    assert np.all(corrected.pressure[0, 1:, :] == 5.0)
+    assert np.all(corrected.vx[1:, 0, :] == 0.0)
+
+
+def test_gradient_is_negative_adjoint_of_divergence():
+    # <D v, φ> = −<v, G φ> over the active cells, with solids closing faces
+    store, _ = make_grid(shape=(5, 4, 6), seed=9)
+    store.cell_type[1:3, 2, 2:4] = SOLID
+    active = store.cell_type != SOLID
+    phi = np.random.default_rng(10).standard_normal(store.shape)
+    div = mac_divergence_grid(store, PARAMS.dx, PARAMS.dy, PARAMS.dz, active=active)
+    grads = pressure_gradient_grid(phi, PARAMS.dx, PARAMS.dy, PARAMS.dz, active)
+    flux_dot_grad = sum(float((getattr(store, c) * g).sum()) for c, g in zip(("vx", "vy", "vz"), grads))
+    assert float((div * phi).sum()) == pytest.approx(-flux_dot_grad, rel=1e-12)
+    assert np.all(grads[0][0:3, 2, 2:4] == 0.0)  # faces into and out of the solid block
+
+
+def test_corrected_field_is_divergence_free():
+    star, _ = make_grid(shape=(8, 6, 7), seed=11)
+    star.cell_type[3:5, 2:4, 3] = SOLID
+    config = {"boundary_conditions": [], "pressure_solver": {"method": "cg", "tolerance": 1e-12}}
+    phi, info = PressureProjection(star, config, PARAMS).project(star)
+    corrected, diagnostics = correct_velocity(star, phi, config, PARAMS)
+    assert info["converged"]
+    div = mac_divergence_grid(corrected, PARAMS.dx, PARAMS.dy, PARAMS.dz, active=star.cell_type != SOLID)
+    assert np.abs(div).max() < 1e-9
+    assert diagnostics["divergence_linf"] == pytest.approx(float(np.abs(div).max()))
+
+
+
+def test_fused_divergence_accounts_for_boundary_overrides():
+    star, _ = make_grid(shape=(6, 5, 4), seed=12)
+    star = _with_roles(star)
+    star.cell_type[2:4, 2, 1:3] = SOLID
+    phi = np.random.default_rng(13).standard_normal(star.shape)
+    corrected, diagnostics = correct_velocity(star, phi, CONFIG, PARAMS)
+    div = mac_divergence_grid(corrected, PARAMS.dx, PARAMS.dy, PARAMS.dz, active=star.cell_type != SOLID)
+    assert diagnostics["divergence_linf"] == pytest.approx(float(np.abs(div).max()), rel=1e-12)
+    assert diagnostics["divergence_l2"] == pytest.approx(float(np.sqrt(np.mean(div * div))), rel=1e-12)
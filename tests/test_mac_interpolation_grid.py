@@ -0,0 +1,37 @@
+# tests/test_mac_interpolation_grid.py
+# Whole-grid interpolation kernels must reproduce the per-cell functions at every cell,
+# including the Neumann fallbacks on all six domain faces.
+
+import pytest
+
+from src.step_2_time_stepping_loop import mac_interpolation
+from src.step_2_time_stepping_loop.mac_interpolation import (
+    vx_faces_grid,
+    vy_faces_grid,
+    vz_faces_grid,
+)
+from tests.mocks.grid_mock import make_grid, iter_cells
+
+
+@pytest.mark.parametrize("comp, kernel", [
+    ("vx", vx_faces_grid),
+    ("vy", vy_faces_grid),
+    ("vz", vz_faces_grid),
+])
+def test_grid_faces_match_scalar_api(comp, kernel):
+    store, cell_dict = make_grid(shape=(4, 3, 5))
+    faces = kernel(getattr(store, comp))
+    assert len(faces) == 8
+    for key, values in faces.items():
+        assert values.shape == store.shape
+        scalar = getattr(mac_interpolation, f"{comp}_{key}")
+        for flat, i, j, k in iter_cells(store.shape):
+            assert values[i, j, k] == pytest.approx(scalar(cell_dict, flat, 0), rel=1e-12, abs=1e-12)
+
+
+def test_grid_faces_single_cell_axis():
+    store, cell_dict = make_grid(shape=(1, 2, 3), seed=3)
+    faces = vx_faces_grid(store.vx)
+    # With nx=1 every x-face falls back to the central value
+    for key in ("i_plus_half", "i_minus_half", "i_plus_three_half", "i_minus_three_half"):
+        assert faces[key] == pytest.approx(store.vx)
@@ -2,6 +2,7 @@
 # Comprehensive unit tests for src/step_2_time_stepping_loop/mac_interpolation/vx.py
 
 import pytest
+from src.solver_logging import configure
 from src.step_2_time_stepping_loop.mac_interpolation import vx
 from tests.mocks.cell_dict_mock import cell_dict
 
@@ -103,11 +104,13 @@ def test_vx_k_plus_one_fallback(monkeypatch):
 # --- Debug logging -----------------------------------------------------------
 
 def test_vx_debug_logging(capsys):
-    vx.debug = True
-    result = vx.vx_j_plus_one(cell_dict, 13, timestep=0)
+    configure("vx=debug")
+    try:
+        vx.vx_j_plus_one(cell_dict, 13, timestep=0)
+    finally:
+        configure("")
     captured = capsys.readouterr()
     assert "vx_j+1" in captured.out
-    vx.debug = False
 
 
 # --- Robustness against malformed input --------------------------------------
@@ -2,6 +2,7 @@
 # Comprehensive unit tests for src/step_2_time_stepping_loop/mac_interpolation/vy.py
 
 import pytest
+from src.solver_logging import configure
 from src.step_2_time_stepping_loop.mac_interpolation import vy
 from tests.mocks.cell_dict_mock import cell_dict
 
@@ -108,11 +109,13 @@ def test_vy_k_plus_one_fallback(monkeypatch):
 # --- Debug logging -----------------------------------------------------------
 
 def test_vy_debug_logging(capsys):
-    vy.debug = True
-    result = vy.vy_i_plus_one(cell_dict, 13, timestep=0)
+    configure("vy=debug")
+    try:
+        vy.vy_i_plus_one(cell_dict, 13, timestep=0)
+    finally:
+        configure("")
     captured = capsys.readouterr()
     assert "vy_i+1" in captured.out
-    vy.debug = False
 
 
 # --- Robustness against malformed input --------------------------------------
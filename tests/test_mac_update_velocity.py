@@ -0,0 +1,98 @@
+# tests/test_mac_update_velocity.py
+# ✅ Predictor update functions with pre-built SolverParameters
+
+import numpy as np
+import pytest
+
+from src.step_2_time_stepping_loop import mac_update_velocity
+from src.step_2_time_stepping_loop.mac_update_velocity import (
+    TERM_NAMES,
+    update_velocity,
+    update_velocity_grid,
+    update_velocity_x,
+    update_velocity_y,
+    update_velocity_z,
+)
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters, build_solver_parameters
+from tests.mocks.cell_dict_mock import cell_dict
+from tests.mocks.grid_mock import make_grid, iter_cells
+
+
+@pytest.fixture
+def config():
+    return {
+        "simulation_parameters": {"time_step": 0.1},
+        "fluid_properties": {"density": 1.0, "viscosity": 0.1},
+        "domain_definition": {
+            "x_min": 0.0, "x_max": 3.0,
+            "y_min": 0.0, "y_max": 3.0,
+            "z_min": 0.0, "z_max": 3.0,
+            "nx": 3, "ny": 3, "nz": 3,
+        },
+        "external_forces": {"force_vector": [1.0, 2.0, -3.0]},
+    }
+
+
+@pytest.mark.parametrize("update", [update_velocity_x, update_velocity_y, update_velocity_z])
+def test_params_object_matches_config_path(config, update):
+    params = build_solver_parameters(config)
+    from_config = update(cell_dict, 13, config, timestep=0)
+    from_params = update(cell_dict, 13, config, timestep=0, params=params)
+    assert isinstance(from_params, float)
+    assert from_params == pytest.approx(from_config)
+
+
+def test_params_object_skips_config_validation(config, monkeypatch):
+    params = build_solver_parameters(config)
+
+    def fail(_config):
+        raise AssertionError("config re-validated")
+
+    monkeypatch.setattr(mac_update_velocity, "build_solver_parameters", fail)
+    update_velocity_x(cell_dict, 13, config, 0, params)
+    update_velocity_y(cell_dict, 13, config, 0, params)
+    update_velocity_z(cell_dict, 13, config, 0, params)
+
+
+def test_force_shifts_predictor(config):
+    base = update_velocity_x(cell_dict, 13, config, timestep=0)
+    config["external_forces"]["force_vector"] = [11.0, 2.0, -3.0]
+    pushed = update_velocity_x(cell_dict, 13, config, timestep=0)
+    assert pushed - base == pytest.approx(0.1 * 10.0)
+
+
+def test_fused_update_matches_components(config):
+    params = build_solver_parameters(config)
+    for center in map(int, cell_dict):
+        fused = update_velocity(cell_dict, center, config, 0, params)
+        separate = tuple(update(cell_dict, center, config, 0, params)
+                         for update in (update_velocity_x, update_velocity_y, update_velocity_z))
+        assert fused == pytest.approx(separate, rel=1e-12)
+
+
+def test_fused_update_terms(config):
+    params = build_solver_parameters(config)
+    v_star, terms = update_velocity(cell_dict, 13, config, 0, params, terms=True)
+    assert v_star == pytest.approx(update_velocity(cell_dict, 13, config, 0, params))
+    assert set(terms) == set(TERM_NAMES)
+    assert terms["force"] == pytest.approx(np.sqrt(1.0 + 4.0 + 9.0))
+    assert all(value >= 0.0 for value in terms.values())
+
+
+@pytest.mark.parametrize("scheme", ["central", "upwind", "quick"])
+def test_fused_grid_matches_per_cell(scheme):
+    store, grid_dict = make_grid(shape=(4, 3, 5), seed=5)
+    params = SolverParameters(dt=0.01, rho=1.2, mu=0.05, dx=0.5, dy=0.75, dz=1.25,
+                              Fx=0.1, Fy=-0.2, Fz=0.3, advection_scheme=scheme)
+    (vx, vy, vz), terms = update_velocity_grid(store, params, terms=True)
+    if scheme == "central":
+        peak = dict.fromkeys(TERM_NAMES, 0.0)
+        for flat, i, j, k in iter_cells(store.shape):
+            cell_star, cell_terms = update_velocity(grid_dict, flat, {}, 0, params, terms=True)
+            assert (vx[i, j, k], vy[i, j, k], vz[i, j, k]) == pytest.approx(cell_star, rel=1e-12, abs=1e-12)
+            for name in TERM_NAMES:
+                peak[name] = max(peak[name], cell_terms[name])
+        assert terms == pytest.approx(peak, rel=1e-12)
+    else:
+        unfused = update_velocity_grid(store, SolverParameters(**params.as_dict()))
+        assert not np.allclose(vx, unfused[0])
@@ -0,0 +1,20 @@
+# tests/test_main_solver.py
+# ✅ Pipeline step 1 hands out a lazy view, not the eager per-cell dict
+
+import json
+from collections.abc import Mapping
+
+from src import main_solver
+from src.step_1_solver_initialization.cell_builder import build_cell_dict
+
+
+def test_step_1_returns_lazy_view_matching_build_cell_dict():
+    with open("tests/test_models/test_step_0_output.json") as f:
+        config = json.load(f)
+    view = main_solver.step_1_solver_initialization(config)
+    eager = build_cell_dict(config)
+
+    assert isinstance(view, Mapping) and not isinstance(view, dict)
+    assert len(view) == len(eager)
+    for flat_index in (0, len(eager) // 2, len(eager) - 1):
+        assert view[flat_index] == eager[flat_index]
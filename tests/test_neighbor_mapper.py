@@ -1,7 +1,14 @@
 # tests/test_neighbor_mapper.py
 # ✅ Single tests for neighbors in a 3×3×3 cube
 
-from step_1_solver_initialization.neighbor_mapper import get_stencil_neighbors
+import numpy as np
+
+from step_1_solver_initialization.neighbor_mapper import (
+    build_neighbor_table,
+    gather_neighbors,
+    get_stencil_neighbors,
+    neighbor_entry,
+)
 
 def test_neighbors_of_index_zero_cube():
     shape = (3, 3, 3)
@@ -133,3 +140,25 @@ def test_round_trip_consistency_cube():
 
 
 
+def test_neighbor_table_matches_scalar_mapping():
+    shape = (4, 3, 5)
+    table, boundary = build_neighbor_table(shape)
+    assert table.shape == (60, 6)
+    assert table.dtype.name == "int32"
+    for flat_index in range(60):
+        expected = get_stencil_neighbors(flat_index, shape)
+        assert neighbor_entry(table, flat_index) == expected
+        assert boundary[flat_index] == (None in expected.values())
+
+
+def test_neighbor_table_mask_and_gather():
+    shape = (3, 3, 3)
+    mask = np.ones(shape, dtype=bool)
+    mask[2, 1, 1] = False  # flat 14
+    table, boundary = build_neighbor_table(shape, mask)
+    assert table[13, 1] == -1  # i+1 of the center is masked out
+    assert boundary[13]
+
+    values = np.arange(27, dtype=float)
+    gathered = gather_neighbors(values, table)
+    assert gathered[13].tolist() == [12.0, 13.0, 10.0, 16.0, 4.0, 22.0]
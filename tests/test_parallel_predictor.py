@@ -0,0 +1,64 @@
+# tests/test_parallel_predictor.py
+# ✅ Slab-parallel predictor must match the serial fused predictor exactly
+
+import json
+
+import numpy as np
+import pytest
+
+from src.step_2_time_stepping_loop.driver_loop import timestep_driver
+from src.step_2_time_stepping_loop.mac_update_velocity import update_velocity_grid
+from src.step_2_time_stepping_loop.parallel_predictor import SlabPredictor, slab_bounds
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+from tests.mocks.grid_mock import make_grid
+
+
+def _params(scheme):
+    return SolverParameters(dt=0.01, rho=1.2, mu=0.05, dx=0.5, dy=0.75, dz=1.25,
+                            Fx=0.1, Fy=-0.2, Fz=0.3, advection_scheme=scheme)
+
+
+def test_slab_bounds_cover_the_grid():
+    assert slab_bounds(10, 3) == [(0, 3), (3, 7), (7, 10)]
+    assert slab_bounds(2, 8) == [(0, 1), (1, 2)]
+    assert slab_bounds(5, 1) == [(0, 5)]
+
+
+@pytest.mark.parametrize("scheme", ["central", "upwind", "quick"])
+def test_slab_pool_matches_serial(scheme):
+    store, _ = make_grid(shape=(6, 5, 13), seed=21)
+    expected = update_velocity_grid(store, _params(scheme))
+    with SlabPredictor(store.shape, workers=3) as pool:
+        for _ in range(2):  # pool and shared blocks are reused across steps
+            result = pool.predict(store, _params(scheme))
+            for r, e in zip(result, expected):
+                np.testing.assert_array_equal(r, e)
+
+
+def test_short_halo_breaks_slab_edges():
+    store, _ = make_grid(shape=(4, 4, 12), seed=22)
+    expected = update_velocity_grid(store, _params("quick"))
+    with SlabPredictor(store.shape, workers=3, halo=1) as pool:
+        vx, vy, vz = pool.predict(store, _params("quick"))
+    assert not np.allclose(vz, expected[2])
+
+
+def test_shape_mismatch_rejected():
+    store, _ = make_grid(shape=(4, 4, 4), seed=23)
+    with SlabPredictor((4, 4, 5), workers=2) as pool:
+        with pytest.raises(ValueError):
+            pool.predict(store, _params("central"))
+
+
+def test_driver_with_pool_matches_serial():
+    with open("tests/test_models/test_step_0_output.json") as f:
+        config = json.load(f)
+    config["external_forces"] = {"force_vector": [0.0, 0.0, 0.0]}
+    with open("tests/test_models/test_step_1_output.json") as f:
+        serial = json.load(f)
+    parallel = json.loads(json.dumps(serial))
+
+    timestep_driver(serial, config, 0, backend="numpy")
+    with SlabPredictor((4, 4, 4), workers=2) as pool:
+        timestep_driver(parallel, config, 0, backend="numpy", pool=pool)
+    assert parallel == serial
@@ -131,3 +131,36 @@ def test_load_solver_parameters_runs_fast(valid_config):
 
 
 
+
+
+# --- SolverParameters -------------------------------------------------------
+
+def test_build_solver_parameters_matches_dict_api(valid_config):
+    from src.step_2_time_stepping_loop.parameter_utils import build_solver_parameters
+    params = build_solver_parameters(valid_config)
+    assert params.as_dict() == load_solver_parameters(valid_config)
+    assert params["dx"] == params.dx
+    assert params.advection_scheme == "central"
+
+
+def test_solver_parameters_is_immutable(valid_config):
+    import dataclasses
+    from src.step_2_time_stepping_loop.parameter_utils import build_solver_parameters
+    params = build_solver_parameters(valid_config)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        params.dt = 1.0
+    assert not hasattr(params, "__dict__")
+
+
+def test_solver_parameters_unknown_key_raises(valid_config):
+    from src.step_2_time_stepping_loop.parameter_utils import build_solver_parameters
+    params = build_solver_parameters(valid_config)
+    with pytest.raises(KeyError):
+        params["nope"]
+
+
+def test_build_solver_parameters_validates(valid_config):
+    from src.step_2_time_stepping_loop.parameter_utils import build_solver_parameters
+    valid_config["simulation_parameters"]["advection_scheme"] = "bogus"
+    with pytest.raises(ValueError):
+        build_solver_parameters(valid_config)
@@ -0,0 +1,52 @@
+# tests/test_pressure_fft.py
+# ✅ Unit tests for src/step_2_time_stepping_loop/pressure_fft.py
+
+import numpy as np
+import pytest
+
+from src.step_1_solver_initialization.field_store import FieldStore, SOLID
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+from src.step_2_time_stepping_loop.pressure_fft import SpectralPoissonSolver, spectral_eligible
+from src.step_2_time_stepping_loop.pressure_solver import PoissonSystem, PressureProjection
+
+PARAMS = SolverParameters(dt=0.1, rho=1.0, mu=0.0, dx=0.5, dy=0.25, dz=1.0, Fx=0.0, Fy=0.0, Fz=0.0)
+
+
+def test_spectral_matches_sparse_cg():
+    shape = (7, 5, 6)
+    spacings = (0.5, 0.25, 1.0)
+    rhs = np.random.default_rng(0).standard_normal(shape)
+    active = np.ones(shape, dtype=bool)
+
+    phi, info = SpectralPoissonSolver(shape, spacings).solve(rhs)
+    ref, _ = PoissonSystem(active, ~active, spacings).solve(rhs, np.zeros(shape), tolerance=1e-12)
+    assert info["iterations"] == 0
+    assert abs(phi.mean()) < 1e-12
+    np.testing.assert_allclose(phi, ref, atol=1e-9)
+
+
+def test_eligibility():
+    active = np.ones((3, 3, 3), dtype=bool)
+    assert spectral_eligible(active, ~active)
+    dirichlet = ~active
+    dirichlet[0, 0, 0] = True
+    assert not spectral_eligible(active, dirichlet)
+    active[1, 1, 1] = False
+    assert not spectral_eligible(active, ~active)
+
+
+@pytest.mark.parametrize("method", ["auto", "fft"])
+def test_projection_picks_fft_only_without_solids(method):
+    config = {"boundary_conditions": [], "pressure_solver": {"method": method, "tolerance": 1e-8}}
+    store = FieldStore((6, 4, 5))
+    store.vx[...] = np.random.default_rng(1).standard_normal(store.shape)
+    box = PressureProjection(store, config, PARAMS)
+    assert box.method == "fft"
+    assert box.system is None
+
+    store.cell_type[2, 2, 2] = SOLID
+    fallback = PressureProjection(store, config, PARAMS)
+    assert fallback.method == "cg"
+    _, info = fallback.project(store)
+    assert info["method"] == "cg"
+    assert info["converged"]
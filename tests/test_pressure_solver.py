@@ -0,0 +1,215 @@
+# tests/test_pressure_solver.py
+# ✅ Unit tests for src/step_2_time_stepping_loop/pressure_solver.py
+
+import logging
+
+import numpy as np
+import pytest
+
+from src.step_1_solver_initialization.field_store import FieldStore, SOLID
+from src.step_1_solver_initialization.indexing_utils import grid_to_flat
+from src.step_2_time_stepping_loop.pressure_solver import (
+    PoissonSystem,
+    PressureProjection,
+    load_pressure_solver_settings,
+)
+from src.step_2_time_stepping_loop.mac_correct_velocity import correct_velocity
+from src.step_2_time_stepping_loop.mac_gradients import (
+    divergence,
+    divergence_grid,
+    mac_divergence_grid,
+    pressure_gradient_grid,
+)
+from src.step_2_time_stepping_loop.parameter_utils import SolverParameters
+from tests.mocks.grid_mock import make_grid, iter_cells
+
+SPACINGS = (0.5, 0.25, 1.0)
+
+
+def _apply_minus_laplacian(phi, active, spacings):
+    """Reference −∇² with zero-gradient faces at domain edges and solids."""
+    out = np.zeros_like(phi)
+    for axis in range(3):
+        w = 1.0 / spacings[axis] ** 2
+        for step in (-1, 1):
+            nb = np.roll(phi, -step, axis=axis)
+            nb_active = np.roll(active, -step, axis=axis)
+            edge = [slice(None)] * 3
+            edge[axis] = -1 if step == 1 else 0
+            nb_active[tuple(edge)] = False
+            out += np.where(active & nb_active, w * (phi - nb), 0.0)
+    return np.where(active, out, 0.0)
+
+
+# --- Settings ---------------------------------------------------------------
+
+def test_settings_defaults_and_validation():
+    settings = load_pressure_solver_settings({})
+    assert settings["method"] == "auto"
+    assert settings["preconditioner"] == "jacobi"
+    with pytest.raises(ValueError):
+        load_pressure_solver_settings({"pressure_solver": {"preconditioner": "amg"}})
+    with pytest.raises(ValueError):
+        load_pressure_solver_settings({"pressure_solver": {"tolerance": 0}})
+
+
+# --- Assembly ---------------------------------------------------------------
+
+def test_matrix_is_symmetric_and_matches_stencil():
+    rng = np.random.default_rng(1)
+    active = np.ones((4, 3, 5), dtype=bool)
+    active[1, 1, 2] = False
+    system = PoissonSystem(active, np.zeros_like(active), SPACINGS)
+    assert system.n_unknowns == active.sum()
+    assert abs(system.A - system.A.T).max() == 0.0
+
+    phi = np.where(active, rng.standard_normal(active.shape), 0.0)
+    x = phi.ravel(order="F")[system.unknown_flat]
+    expected = _apply_minus_laplacian(phi, active, SPACINGS).ravel(order="F")[system.unknown_flat]
+    np.testing.assert_allclose(system.A @ x, expected)
+
+
+# --- Solve ------------------------------------------------------------------
+
+@pytest.mark.parametrize("preconditioner", ["jacobi", "ic", "none"])
+def test_neumann_manufactured_solution(preconditioner):
+    rng = np.random.default_rng(2)
+    active = np.ones((5, 4, 6), dtype=bool)
+    active[2, 1:3, 3] = False
+    exact = np.where(active, rng.standard_normal(active.shape), 0.0)
+    exact[active] -= exact[active].mean()
+    rhs = _apply_minus_laplacian(exact, active, SPACINGS)
+
+    system = PoissonSystem(active, np.zeros_like(active), SPACINGS)
+    phi, info = system.solve(rhs, np.zeros(active.shape), tolerance=1e-10, preconditioner=preconditioner)
+    assert info["converged"]
+    assert np.all(phi[~active] == 0.0)
+    np.testing.assert_allclose(phi, exact, atol=1e-7)
+
+
+def test_dirichlet_values_are_imposed():
+    rng = np.random.default_rng(3)
+    active = np.ones((6, 3, 3), dtype=bool)
+    dirichlet = np.zeros_like(active)
+    dirichlet[0] = True
+    exact = rng.standard_normal(active.shape)
+    rhs = _apply_minus_laplacian(exact, active, SPACINGS)
+
+    system = PoissonSystem(active, dirichlet, SPACINGS)
+    assert not system.singular
+    phi, info = system.solve(rhs, exact, tolerance=1e-12, preconditioner="ic")
+    assert info["converged"]
+    np.testing.assert_allclose(phi, exact, atol=1e-8)
+
+
+@pytest.mark.parametrize("preconditioner", ["jacobi", "ic", "none"])
+def test_pocket_sealed_by_solids_is_solved_up_to_its_own_constant(preconditioner):
+    # outlet at x=0, solid plane at x=3: cells x=4..5 see no Dirichlet cell
+    shape = (6, 4, 4)
+    active = np.ones(shape, dtype=bool)
+    active[3] = False
+    dirichlet = np.zeros(shape, dtype=bool)
+    dirichlet[0] = True
+    system = PoissonSystem(active, dirichlet, SPACINGS)
+    assert system.singular
+    pocket = np.zeros(shape, dtype=bool)
+    pocket[4:] = True
+    np.testing.assert_array_equal(system.floating, pocket.ravel(order="F")[system.unknown_flat])
+
+    rhs = np.random.default_rng(12).standard_normal(shape)
+    phi, info = system.solve(rhs, np.zeros(shape), tolerance=1e-10, preconditioner=preconditioner)
+    assert info["converged"] and info["residual"] < 1e-9
+    assert abs(phi[pocket].mean()) < 1e-10
+    # the anchored region solves its equations exactly, the pocket up to its mean RHS
+    residual = rhs - _apply_minus_laplacian(phi, active, SPACINGS)
+    np.testing.assert_allclose(residual[1:3], 0.0, atol=1e-7)
+    np.testing.assert_allclose(residual[pocket], rhs[pocket].mean(), atol=1e-7)
+
+
+@pytest.mark.parametrize("preconditioner", ["jacobi", "ic", "none"])
+def test_fluid_cell_walled_in_by_solids_has_no_equation(preconditioner):
+    shape = (5, 5, 5)
+    active = np.ones(shape, dtype=bool)
+    active[1:4, 1:4, 1:4] = False
+    active[2, 2, 2] = True
+    dirichlet = np.zeros(shape, dtype=bool)
+    dirichlet[0] = True
+    system = PoissonSystem(active, dirichlet, SPACINGS)
+    assert grid_to_flat(2, 2, 2, shape) not in system.unknown_flat
+
+    rhs = np.random.default_rng(14).standard_normal(shape)
+    phi, info = system.solve(rhs, np.zeros(shape), tolerance=1e-10, preconditioner=preconditioner)
+    assert info["converged"] and np.isfinite(phi).all()
+    assert phi[2, 2, 2] == 0.0
+
+
+def test_non_converged_solve_is_logged(caplog):
+    active = np.ones((6, 6, 6), dtype=bool)
+    system = PoissonSystem(active, np.zeros_like(active), SPACINGS)
+    rhs = np.random.default_rng(13).standard_normal(active.shape)
+    with caplog.at_level(logging.WARNING, logger="fluid_solver.pressure_solver"):
+        _, info = system.solve(rhs, np.zeros(active.shape), tolerance=1e-12, max_iterations=2)
+    assert not info["converged"]
+    assert "did not converge" in caplog.text
+
+
+def test_projection_removes_divergence_on_closed_box():
+    shape = (6, 6, 6)
+    store = FieldStore(shape)
+    store.vx[...] = np.random.default_rng(4).standard_normal(shape)
+    store.cell_type[0, 0, 0] = SOLID
+    params = SolverParameters(dt=0.1, rho=2.0, mu=0.0, dx=0.5, dy=0.5, dz=0.5, Fx=0.0, Fy=0.0, Fz=0.0)
+
+    projection = PressureProjection(store, {"boundary_conditions": []}, params)
+    phi, info = projection.project(store)
+    assert info["converged"]
+    assert info["iterations"] > 0
+    assert phi[0, 0, 0] == 0.0
+    assert abs(phi[store.cell_type != SOLID].mean()) < 1e-10
+
+
+def test_divergence_grid_matches_scalar():
+    store, cell_dict = make_grid(shape=(4, 3, 5), seed=5)
+    div = divergence_grid(store, 0.5, 0.75, 1.25)
+    for flat, i, j, k in iter_cells(store.shape):
+        assert div[i, j, k] == pytest.approx(divergence(cell_dict, flat, 0.5, 0.75, 1.25, timestep=0), abs=1e-10)
+
+
+# --- Staggered D/G pair -------------------------------------------------------
+
+def _random_store(shape, seed, solid=False):
+    rng = np.random.default_rng(seed)
+    store = FieldStore(shape)
+    for comp in ("vx", "vy", "vz"):
+        getattr(store, comp)[...] = rng.standard_normal(shape)
+    if solid:
+        store.cell_type[2:4, 1:3, 2:5] = SOLID
+    return store
+
+
+def test_minus_div_grad_is_the_assembled_operator():
+    store = _random_store((5, 4, 6), seed=9, solid=True)
+    active = store.cell_type != SOLID
+    phi = np.where(active, np.random.default_rng(10).standard_normal(store.shape), 0.0)
+    grads = pressure_gradient_grid(phi, *SPACINGS, active)
+    for comp, grad in zip(("vx", "vy", "vz"), grads):
+        getattr(store, comp)[...] = grad
+    div_grad = mac_divergence_grid(store, *SPACINGS, active=active)
+    np.testing.assert_allclose(-div_grad, _apply_minus_laplacian(phi, active, SPACINGS), atol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["cg", "multigrid", "fft"])
+@pytest.mark.parametrize("solid", [False, True])
+def test_projection_drives_divergence_to_tolerance(method, solid):
+    star = _random_store((12, 10, 8), seed=11, solid=solid)
+    params = SolverParameters(dt=0.1, rho=2.0, mu=0.0, dx=0.5, dy=0.75, dz=1.25, Fx=0.0, Fy=0.0, Fz=0.0)
+    config = {"boundary_conditions": [], "pressure_solver": {"method": method, "tolerance": 1e-10}}
+    projection = PressureProjection(star, config, params)
+    before = np.abs(mac_divergence_grid(star, 0.5, 0.75, 1.25, active=projection.active)).max()
+
+    phi, info = projection.project(star)
+    _, diagnostics = correct_velocity(star, phi, config, params)
+    assert info["converged"]
+    assert before > 1.0
+    assert diagnostics["divergence_linf"] < 1e-8 * before
+
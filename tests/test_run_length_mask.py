@@ -0,0 +1,112 @@
+# tests/test_run_length_mask.py
+# 🧪 Tests for RunLengthMask and the cached sparse geometry of a FieldStore
+
+import numpy as np
+import pytest
+
+from src.step_1_solver_initialization.field_store import BOUNDARY, FLUID, NO_ROLE, SOLID, FieldStore
+from src.step_1_solver_initialization.run_length_mask import RunLengthMask, sparse_mask
+from src.step_2_time_stepping_loop.boundary_utils import enforce_boundary_grid
+
+SHAPE = (6, 5, 4)
+
+
+def _cell_types():
+    rng = np.random.default_rng(7)
+    cell_type = np.full(SHAPE, FLUID, dtype=np.uint8)
+    cell_type[2:4, 1:3, 1:3] = SOLID
+    cell_type[[0, -1], :, :] = BOUNDARY
+    cell_type[rng.random(SHAPE) < 0.05] = SOLID
+    return cell_type
+
+
+def test_dense_round_trip_keeps_dtype():
+    dense = _cell_types()
+    mask = RunLengthMask.from_dense(dense)
+    restored = mask.to_dense()
+    assert restored.dtype == np.uint8
+    np.testing.assert_array_equal(restored, dense)
+    assert mask.count() == int((dense != FLUID).sum())
+    assert len(mask.starts) < mask.count()
+
+
+def test_point_queries_match_dense():
+    dense = _cell_types()
+    flat = dense.ravel(order="F")
+    mask = RunLengthMask.from_dense(dense)
+    every = np.arange(flat.size)
+    np.testing.assert_array_equal(mask.code_at(every), flat)
+    np.testing.assert_array_equal(mask.is_solid(every), flat == SOLID)
+    np.testing.assert_array_equal(mask.is_boundary(every), flat == BOUNDARY)
+    assert mask.code_at(0) == BOUNDARY and isinstance(mask.code_at(0), int)
+    with pytest.raises(ValueError, match="out of range"):
+        mask.code_at(flat.size)
+
+
+def test_cells_and_where_select_one_code():
+    dense = _cell_types()
+    mask = RunLengthMask.from_dense(dense)
+    np.testing.assert_array_equal(mask.cells(SOLID), np.flatnonzero(dense.ravel(order="F") == SOLID))
+    i, j, k = mask.where(BOUNDARY)
+    assert (dense[i, j, k] == BOUNDARY).all()
+    assert len(i) == mask.count(BOUNDARY) == int((dense == BOUNDARY).sum())
+    assert mask.codes_present().tolist() == [SOLID, BOUNDARY]
+
+
+def test_iterate_active_cells_covers_non_solid_cells():
+    dense = _cell_types()
+    mask = RunLengthMask.from_dense(dense)
+    active = np.zeros(dense.size, dtype=bool)
+    for start, stop in mask.iterate_active_cells():
+        assert start < stop
+        active[start:stop] = True
+    np.testing.assert_array_equal(active, dense.ravel(order="F") != SOLID)
+    with pytest.raises(ValueError, match="background"):
+        next(mask.iterate_active_cells(inactive=FLUID))
+
+
+def test_all_fluid_mask_has_no_runs():
+    mask = RunLengthMask.from_dense(np.zeros(SHAPE, dtype=np.uint8))
+    assert len(mask.starts) == 0
+    assert mask.code_at(5) == FLUID
+    assert list(mask.iterate_active_cells()) == [(0, mask.n_cells)]
+    assert mask.cells().size == 0
+
+
+def test_boundary_role_mask_uses_no_role_background():
+    roles = np.full(SHAPE, NO_ROLE, dtype=np.int8)
+    roles[0, :, :] = 0
+    roles[-1, 2:, :] = 1
+    mask = RunLengthMask.from_dense(roles, NO_ROLE)
+    np.testing.assert_array_equal(mask.to_dense(), roles)
+    assert mask.codes_present().tolist() == [0, 1]
+
+
+def test_sparse_mask_is_cached_per_store():
+    store = FieldStore(SHAPE)
+    store.cell_type[...] = _cell_types()
+    cells = sparse_mask(store)
+    assert sparse_mask(store, "cell_type") is cells
+    copy = store.copy(timestep=1)
+    assert copy.sparse == {}
+    assert sparse_mask(copy, "boundary_role").count() == 0
+    assert "boundary_role" not in store.sparse
+    assert store.z_window(0, 2).sparse == {}
+    with pytest.raises(KeyError, match="pressure"):
+        sparse_mask(store, "pressure")
+
+
+def test_copy_with_edited_roles_is_not_served_a_stale_mask():
+    config = {"boundary_conditions": [
+        {"role": "inlet", "apply_to": ["velocity"], "velocity": [1.0, 0.0, 0.0]},
+        {"role": "wall", "apply_to": ["velocity"], "velocity": [0.0, 0.0, 0.0]},
+    ]}
+    store = FieldStore(SHAPE, roles=("inlet", "wall"))
+    store.boundary_role[-1, :, :] = 1
+    enforce_boundary_grid(store, config)
+
+    copy = store.copy()
+    copy.boundary_role[0, :, :] = 0
+    enforce_boundary_grid(copy, config)
+    assert np.all(copy.vx[0] == 1.0)
+    assert np.all(store.vx[0] == 0.0)
@@ -0,0 +1,189 @@
+# tests/test_solver_logging.py
+# 🧪 Tests for the central logging layer (src/solver_logging.py)
+
+import importlib
+import json
+import logging
+
+import pytest
+
+from src import solver_logging
+from src.solver_logging import configure, get_logger, lazy, parse_spec
+from src.step_0_input_data_parsing.config_validator import validate_config
+from src.step_2_time_stepping_loop.driver_loop import timestep_driver
+from src.step_2_time_stepping_loop.field_access import build_neighbor_map
+
+
+@pytest.fixture(autouse=True)
+def reset_levels():
+    yield
+    configure("")
+
+
+def _cell(flat, grid, neighbors, vx):
+    cell = {"grid_index": grid, "time_history": {"0": {"velocity": {"vx": vx, "vy": 0.0, "vz": 0.0}}}}
+    for direction in ("xp", "xm", "yp", "ym", "zp", "zm"):
+        cell[f"flat_index_{direction}"] = neighbors.get(direction)
+    return cell
+
+
+CELLS = {
+    "0": _cell(0, [0, 0, 0], {"xp": 1}, 1.0),
+    "1": _cell(1, [1, 0, 0], {"xm": 0}, 2.0),
+}
+
+
+def test_get_logger_maps_both_import_styles():
+    assert get_logger("src.step_2_time_stepping_loop.field_access") is get_logger("step_2_time_stepping_loop.field_access")
+    assert get_logger("field_access").name == "fluid_solver.field_access"
+
+
+def test_parse_spec_bare_and_module_levels():
+    assert parse_spec("info, field_access=DEBUG") == {"": logging.INFO, "field_access": logging.DEBUG}
+    assert parse_spec("") == {}
+
+
+def test_parse_spec_rejects_unknown_level():
+    with pytest.raises(ValueError, match="Unknown log level"):
+        parse_spec("field_access=loud")
+
+
+def test_configure_reads_env_and_resets_previous_overrides(monkeypatch):
+    monkeypatch.setenv(solver_logging.ENV_VAR, "error,field_access=debug")
+    configure()
+    assert get_logger("field_access").isEnabledFor(logging.DEBUG)
+    assert not get_logger("main_solver").isEnabledFor(logging.WARNING)
+
+    configure("info")
+    assert not get_logger("field_access").isEnabledFor(logging.DEBUG)
+    assert get_logger("field_access").isEnabledFor(logging.INFO)
+
+
+def test_lazy_argument_only_evaluated_when_emitted(capsys):
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return "dump"
+
+    configure("warning")
+    get_logger("main_solver").debug("%s", lazy(expensive))
+    assert calls == []
+
+    configure("debug")
+    get_logger("main_solver").debug("%s", lazy(expensive))
+    assert calls  # formatted once per handler (pytest adds its own)
+    assert "dump" in capsys.readouterr().out
+
+
+def test_neighbor_map_silent_by_default(capsys):
+    configure("")
+    neighbor_map = build_neighbor_map(CELLS, 0)
+    assert neighbor_map[0]["vx_neighbors"]["xp"] == 2.0
+    assert neighbor_map[0]["vx_neighbors"]["xm"] == 1.0
+    assert capsys.readouterr().out == ""
+
+
+def test_neighbor_map_traces_at_module_debug(capsys):
+    configure("warning,field_access=debug")
+    build_neighbor_map(CELLS, 0)
+    out = capsys.readouterr().out
+    assert "Cell 0 [0, 0, 0] → xp neighbor 1 → vx=2.0" in out
+    assert "Cell 1 [1, 0, 0] → xp boundary → clamped to vx=2.0" in out
+
+
+def test_config_validator_reports_at_info(caplog):
+    with open("tests/test_models/test_model_input.json") as f:
+        config = json.load(f)
+    validate_config(config)
+    assert caplog.text == ""
+    with caplog.at_level(logging.INFO, logger="fluid_solver.config_validator"):
+        validate_config(config)
+    assert "Validation passed" in caplog.text
+
+
+def _driver_inputs():
+    with open("tests/test_models/test_step_0_output.json") as f:
+        config = json.load(f)
+    config["external_forces"] = {"force_vector": [0.0, 0.0, 0.0]}
+    with open("tests/test_models/test_step_1_output.json") as f:
+        return config, json.load(f)
+
+
+def test_driver_silent_by_default_and_traces_at_module_debug(capsys):
+    configure("")
+    config, cell_dict = _driver_inputs()
+    timestep_driver(cell_dict, config, 0, backend="python")
+    assert capsys.readouterr().out == ""
+
+    configure("warning,driver_loop=debug")
+    config, cell_dict = _driver_inputs()
+    timestep_driver(cell_dict, config, 0, backend="python")
+    out = capsys.readouterr().out
+    assert out.count("[Phase 1] cell=") == 5
+    assert "complete" in out
+
+
+@pytest.mark.parametrize("module", [
+    "src.solver_logging",
+    "src.step_0_input_data_parsing.input_reader",
+    "src.step_0_input_data_parsing.sidecar_files",
+    "src.step_1_solver_initialization.cell_builder",
+    "src.step_1_solver_initialization.cell_dict_view",
+    "src.step_1_solver_initialization.field_store",
+    "src.step_1_solver_initialization.indexing_utils",
+    "src.step_1_solver_initialization.neighbor_mapper",
+    "src.step_1_solver_initialization.run_length_mask",
+    "src.step_2_time_stepping_loop.block_executor",
+    "src.step_2_time_stepping_loop.boundary_utils",
+    "src.step_2_time_stepping_loop.driver_loop",
+    "src.step_2_time_stepping_loop.grid_spacing",
+    "src.step_2_time_stepping_loop.instrumentation",
+    "src.step_2_time_stepping_loop.mac_advection_ops",
+    "src.step_2_time_stepping_loop.mac_correct_velocity",
+    "src.step_2_time_stepping_loop.mac_diffusion",
+    "src.step_2_time_stepping_loop.mac_diffusion_x",
+    "src.step_2_time_stepping_loop.mac_diffusion_y",
+    "src.step_2_time_stepping_loop.mac_diffusion_z",
+    "src.step_2_time_stepping_loop.mac_gradients",
+    "src.step_2_time_stepping_loop.mac_interpolation.base",
+    "src.step_2_time_stepping_loop.mac_interpolation.vx",
+    "src.step_2_time_stepping_loop.mac_interpolation.vy",
+    "src.step_2_time_stepping_loop.mac_interpolation.vz",
+    "src.step_2_time_stepping_loop.mac_update_velocity",
+    "src.step_2_time_stepping_loop.parallel_predictor",
+    "src.step_2_time_stepping_loop.parameter_utils",
+    "src.step_2_time_stepping_loop.predictor_backend",
+    "src.step_2_time_stepping_loop.pressure_fft",
+    "src.step_2_time_stepping_loop.pressure_multigrid",
+    "src.step_2_time_stepping_loop.pressure_solver",
+    "src.step_2_time_stepping_loop.time_history",
+    "src.step_2_time_stepping_loop.distributed.decomposition",
+    "src.step_2_time_stepping_loop.distributed.runner",
+    "src.step_2_time_stepping_loop.distributed.transport",
+])
+def test_modules_log_through_the_logger_tree(module):
+    mod = importlib.import_module(module)
+    assert not hasattr(mod, "debug")
+    if module != "src.solver_logging":
+        assert mod.log is get_logger(module)
+
+
+
+def test_env_spec_turns_on_a_grid_module(monkeypatch, capsys):
+    from src.step_2_time_stepping_loop.grid_spacing import compute_grid_spacings
+    with open("tests/test_models/test_step_0_output.json") as f:
+        config = json.load(f)
+    compute_grid_spacings(config)
+    assert capsys.readouterr().out == ""
+
+    monkeypatch.setenv(solver_logging.ENV_VAR, "warning,grid_spacing=debug")
+    configure()
+    compute_grid_spacings(config)
+    assert "📐 Computed spacings" in capsys.readouterr().out
+
+
+def test_import_does_not_configure(monkeypatch):
+    monkeypatch.setenv(solver_logging.ENV_VAR, "debug")
+    importlib.reload(solver_logging)
+    assert not get_logger("field_access").isEnabledFor(logging.DEBUG)
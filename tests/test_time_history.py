@@ -0,0 +1,193 @@
+# tests/test_time_history.py
+# ✅ Unit tests for src/step_2_time_stepping_loop/time_history.py
+
+import json
+import logging
+
+import numpy as np
+import pytest
+
+from src.step_1_solver_initialization.field_store import FieldStore
+from src.step_2_time_stepping_loop import time_history
+from src.step_2_time_stepping_loop.driver_loop import timestep_driver
+from src.step_2_time_stepping_loop.mac_gradients import _resolve_pressure
+from src.step_2_time_stepping_loop.mac_interpolation.base import _get_velocity
+from src.step_2_time_stepping_loop.parameter_utils import build_solver_parameters
+from src.step_2_time_stepping_loop.time_history import (
+    FieldRing,
+    RetentionPolicy,
+    current_step,
+    latest_committed_step,
+    load_retention_policy,
+    prune_time_history,
+    set_current_step,
+    tracking,
+)
+
+
+@pytest.fixture(autouse=True)
+def tracker_is_clear():
+    yield
+    assert time_history._tracked == {"owner": None, "step": None}
+
+
+def _level(step, value, shape=(2, 2, 2)):
+    store = FieldStore(shape, timestep=step)
+    store.pressure[...] = value
+    return store
+
+
+def test_policy_keeps_last_and_output_steps():
+    policy = RetentionPolicy(keep_last=2, output_interval=5)
+    kept = [s for s in range(13) if policy.retains(s, latest=12)]
+    assert kept == [0, 5, 10, 11, 12]
+    capped = RetentionPolicy(keep_last=2, output_interval=5, max_snapshots=2)
+    assert [s for s in range(13) if capped.retains(s, latest=12)] == [5, 10, 11, 12]
+
+
+def test_load_retention_policy_validation():
+    config = {"simulation_parameters": {"output_interval": 3, "history_retention": 4}}
+    assert load_retention_policy(config) == RetentionPolicy(keep_last=4, output_interval=3)
+    config["simulation_parameters"]["history_retention"] = 0
+    with pytest.raises(ValueError):
+        load_retention_policy(config)
+    config["simulation_parameters"].update(history_retention=2, max_snapshots=-1)
+    with pytest.raises(ValueError, match="max_snapshots"):
+        load_retention_policy(config)
+
+
+def test_ring_reuses_slots_and_snapshots_output_steps():
+    ring = FieldRing(RetentionPolicy(keep_last=2, output_interval=3))
+    for step in range(1, 8):
+        ring.push(_level(step, float(step)))
+        if step == 2:
+            slots = list(ring._slots)
+    assert [id(s) for s in ring._slots] == [id(s) for s in slots]
+    assert ring.latest_step == 7
+    assert ring.latest().pressure[0, 0, 0] == 7.0
+    assert ring.retained_steps() == [3, 6, 7]
+    assert ring.get(3).pressure[0, 0, 0] == 3.0
+    with pytest.raises(KeyError):
+        ring.get(5)
+
+
+def test_every_step_output_stays_bounded():
+    policy = RetentionPolicy(keep_last=2, output_interval=1, max_snapshots=3)
+    ring = FieldRing(policy)
+    cell_dict = {"0": {"time_history": {}}}
+    levels = set()
+    for step in range(200):
+        ring.push(_level(step, float(step)))
+        cell_dict["0"]["time_history"][str(step)] = {}
+        prune_time_history(cell_dict, policy, latest=step)
+        levels.update(id(level) for level in list(ring._slots) + list(ring.snapshots.values()) if level is not None)
+    assert ring.retained_steps() == [195, 196, 197, 198, 199]
+    assert ring.get(195).pressure[0, 0, 0] == 195.0
+    assert len(levels) == policy.keep_last + policy.max_snapshots  # storage is recycled
+    assert sorted(cell_dict["0"]["time_history"], key=int) == ["195", "196", "197", "198", "199"]
+
+
+def test_dropped_output_steps_warn_once(caplog, monkeypatch):
+    monkeypatch.setitem(time_history._warned_prune, "owner", None)
+    policy = RetentionPolicy(keep_last=1, output_interval=2, max_snapshots=1)
+    ring = FieldRing(policy)
+    cell_dict = {"0": {"time_history": {}}}
+    with caplog.at_level(logging.DEBUG, logger="fluid_solver.time_history"):
+        for step in range(9):
+            ring.push(_level(step, float(step)))
+        dropped = [r for r in caplog.records if "dropped" in r.getMessage()]
+        assert [(r.levelno, r.getMessage().split(" dropped")[0]) for r in dropped] == [
+            (logging.WARNING, "⚠️ Output step 0"), (logging.DEBUG, "🕰️ Output step 2"),
+            (logging.DEBUG, "🕰️ Output step 4")]
+        caplog.clear()
+        for step in range(9):
+            cell_dict["0"]["time_history"][str(step)] = {}
+            prune_time_history(cell_dict, policy, latest=step)
+        warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+        assert [m.split(":")[0] for m in warnings] == ["⚠️ Output step 0 dropped"]
+        assert sum("dropped" in r.getMessage() for r in caplog.records) == 3
+        caplog.clear()
+        prune_time_history({"0": {"time_history": {"0": {}}}}, policy, latest=9, warn=False)
+        assert all(r.levelno == logging.DEBUG for r in caplog.records)
+    assert ring.retained_steps() == [6, 8]
+
+
+def test_zero_snapshots_keeps_only_the_ring():
+    ring = FieldRing(RetentionPolicy(keep_last=2, output_interval=1, max_snapshots=0))
+    for step in range(5):
+        ring.push(_level(step, float(step)))
+    assert ring.retained_steps() == [3, 4]
+
+
+def test_latest_committed_step_uses_tracker_and_falls_back():
+    history = {"0": {}, "1": {}, "2_predictor": {}}
+    cell_dict = {"0": {"time_history": history}}
+    assert latest_committed_step(history, cell_dict) == 1
+    with tracking(cell_dict, 1):
+        assert latest_committed_step(history, cell_dict) == 1
+        history["2"] = {}
+        assert latest_committed_step(history, cell_dict) == 2  # tracked step is stale for this cell
+
+
+def test_tracked_step_is_bound_to_its_cell_dict():
+    tracked = {"0": {"time_history": {"0": {}, "5": {}}}}
+    pruned = {"0": {"time_history": {"0": {}, "5": {}, "10": {}}}}
+    with tracking(tracked, 5):
+        assert current_step(tracked) == 5
+        assert current_step(pruned) is None
+        assert latest_committed_step(pruned["0"]["time_history"], pruned) == 10
+        with pytest.raises(KeyError):
+            set_current_step(pruned, 10)
+    assert current_step(tracked) is None
+
+
+def test_prune_time_history():
+    cell_dict = {"0": {"time_history": {0: {}, "1": {}, "2": {}, "3": {}, "3_predictor": {}, "4_predictor": {}}}}
+    removed = prune_time_history(cell_dict, RetentionPolicy(keep_last=2, output_interval=10), latest=3)
+    assert removed == 2
+    assert list(cell_dict["0"]["time_history"]) == [0, "2", "3", "4_predictor"]
+
+
+def test_driver_bounds_history_length():
+    with open("tests/test_models/test_step_0_output.json") as f:
+        config = json.load(f)
+    config["external_forces"] = {"force_vector": [0.0, 0.0, 0.0]}
+    config["simulation_parameters"]["output_interval"] = 100
+    with open("tests/test_models/test_step_1_output.json") as f:
+        cell_dict = json.load(f)
+
+    params = build_solver_parameters(config)
+    ring = FieldRing(load_retention_policy(config))
+    for step in range(4):
+        timestep_driver(cell_dict, config, step, params=params, ring=ring)
+    assert sorted(cell_dict["21"]["time_history"]) == ["0", "3", "4"]
+    assert ring.latest_step == 4
+    assert current_step(cell_dict) is None  # cleared when the driver returns
+    np.testing.assert_allclose(ring.latest().flat("pressure")[21], cell_dict["21"]["time_history"]["4"]["pressure"])
+
+
+class _NoScanHistory(dict):
+    """time_history that fails if anything iterates its keys."""
+
+    def __iter__(self):
+        raise AssertionError("time_history keys were scanned")
+
+    def keys(self):
+        raise AssertionError("time_history keys were scanned")
+
+
+def test_tracked_latest_is_constant_time():
+    history = _NoScanHistory({str(s): {"pressure": float(s)} for s in range(500)})
+    cell_dict = {"0": {"time_history": history}}
+    with tracking(cell_dict, 499):
+        assert latest_committed_step(history, cell_dict) == 499
+
+
+def test_resolvers_use_tracked_step():
+    state = {"pressure": 7.0, "velocity": {"vx": 1.0, "vy": 2.0, "vz": 3.0}}
+    history = _NoScanHistory({"0": state, "1": state, "2_predictor": state})
+    cell_dict = {"0": {"time_history": history}}
+    with tracking(cell_dict, 0):
+        set_current_step(cell_dict, 1)
+        assert _resolve_pressure(cell_dict, 0, None) == 7.0
+        assert _get_velocity(cell_dict, 0, None, "vy") == 2.0